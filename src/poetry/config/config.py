@@ -151,6 +151,7 @@ _default_config: Config | None = None
 class Config:
     default_config: ClassVar[dict[str, Any]] = {
         "cache-dir": str(DEFAULT_CACHE_DIR),
+        "cache-max-size": 0,
         "data-dir": str(data_dir()),
         "virtualenvs": {
             "create": True,
@@ -166,10 +167,16 @@ class Config:
         },
         "requests": {
             "max-retries": 0,
+            "offline": False,
+            "stale-while-revalidate": 0,
         },
         "installer": {
             "re-resolve": False,
             "parallel": True,
+            "defer-compile": False,
+            "download-segments": 4,
+            "max-connections-per-host": 8,
+            "max-download-rate": None,
             "max-workers": None,
             "no-binary": None,
             "only-binary": None,
@@ -181,6 +188,7 @@ class Config:
             "min-release-age": 0,
             "min-release-age-exclude": None,
             "min-release-age-exclude-source": None,
+            "missing-package-ttl": 0,
         },
         "system-git-client": False,
         "keyring": {
@@ -286,6 +294,18 @@ class Config:
     def artifacts_cache_directory(self) -> Path:
         return Path(self.get("cache-dir")).expanduser() / "artifacts"
 
+    @property
+    def lock_cache_directory(self) -> Path:
+        return Path(self.get("cache-dir")).expanduser() / "cache" / "locks"
+
+    @property
+    def latest_versions_cache_directory(self) -> Path:
+        return Path(self.get("cache-dir")).expanduser() / "cache" / "latest-versions"
+
+    @property
+    def metadata_cache_directory(self) -> Path:
+        return Path(self.get("cache-dir")).expanduser() / "cache" / "metadata"
+
     @property
     def virtualenvs_path(self) -> Path:
         path = self.get("virtualenvs.path")
@@ -394,8 +414,10 @@ class Config:
             "virtualenvs.options.no-pip",
             "virtualenvs.options.system-site-packages",
             "virtualenvs.use-poetry-python",
+            "requests.offline",
             "installer.re-resolve",
             "installer.parallel",
+            "installer.defer-compile",
             "solver.lazy-wheel",
             "system-git-client",
             "keyring.enabled",
@@ -406,9 +428,15 @@ class Config:
             return lambda val: str(Path(val))
 
         if name in {
+            "cache-max-size",
             "installer.max-workers",
+            "installer.download-segments",
+            "installer.max-connections-per-host",
+            "installer.max-download-rate",
             "requests.max-retries",
+            "requests.stale-while-revalidate",
             "solver.min-release-age",
+            "solver.missing-package-ttl",
         }:
             return int_normalizer
 
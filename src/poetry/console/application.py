@@ -72,6 +72,7 @@ COMMANDS = [
     # Cache commands
     "cache clear",
     "cache list",
+    "cache prune",
     # Debug commands
     "debug info",
     "debug resolve",
@@ -129,6 +130,7 @@ class Application(BaseApplication):
         self._io: IO | None = None
         self._disable_plugins = False
         self._disable_cache = False
+        self._offline = False
         self._plugins_loaded = False
         self._working_directory = Path.cwd()
         self._project_directory: Path | None = None
@@ -166,6 +168,18 @@ class Application(BaseApplication):
             )
         )
 
+        definition.add_option(
+            Option(
+                "--offline",
+                flag=True,
+                description=(
+                    "Disables network access. Package metadata and distributions"
+                    " are only taken from Poetry's caches; the command fails if"
+                    " something that is not cached is required."
+                ),
+            )
+        )
+
         definition.add_option(
             Option(
                 "--project",
@@ -209,6 +223,7 @@ class Application(BaseApplication):
             io=self._io,
             disable_plugins=self._disable_plugins,
             disable_cache=self._disable_cache,
+            offline=self._offline,
         )
 
         return self._poetry
@@ -343,6 +358,15 @@ class Application(BaseApplication):
         self._disable_plugins = io.input.option("no-plugins")
         self._disable_cache = io.input.option("no-cache")
 
+        self._offline = io.input.option("offline")
+        if self._offline:
+            from poetry.config.config import Config
+
+            # Commands that do not load a project (and the default authenticator)
+            # only see the global configuration. The project configuration
+            # is overridden when the project is loaded.
+            Config.create().merge({"requests": {"offline": True}})
+
         # we use ensure_path for the directories to make sure these are valid paths
         # this will raise an exception if the path is invalid
         self._working_directory = ensure_path(
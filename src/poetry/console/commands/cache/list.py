@@ -1,15 +1,38 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+from typing import ClassVar
+
+from cleo.helpers import option
+
 from poetry.config.config import Config
 from poetry.console.commands.command import Command
 
 
+if TYPE_CHECKING:
+    from cleo.io.inputs.option import Option
+
+
 class CacheListCommand(Command):
     name = "cache list"
     description = "List Poetry's caches."
 
+    options: ClassVar[list[Option]] = [
+        option(
+            "usage",
+            description=(
+                "Show the disk usage of each repository cache"
+                " and of the caches that are shared by all repositories."
+            ),
+        )
+    ]
+
     def handle(self) -> int:
         config = Config.create()
+
+        if self.option("usage"):
+            return self._show_usage(config)
+
         if config.repository_cache_directory.exists():
             caches = sorted(config.repository_cache_directory.iterdir())
             if caches:
@@ -19,3 +42,27 @@ class CacheListCommand(Command):
 
         self.line_error("<warning>No caches found</>")
         return 0
+
+    def _show_usage(self, config: Config) -> int:
+        from poetry.utils.cache import CacheManager
+
+        manager = CacheManager(
+            repository_cache_dir=config.repository_cache_directory,
+            artifacts_cache_dir=config.artifacts_cache_directory,
+            metadata_cache_dir=config.metadata_cache_directory,
+            lock_cache_dir=config.lock_cache_directory,
+            latest_versions_cache_dir=config.latest_versions_cache_directory,
+        )
+        usage = manager.usage()
+        total = sum(usage.values())
+        width = max(len(name) for name in usage)
+
+        for name, size in usage.items():
+            self.line(f"<info>{name:{width}}</>  {size / 2**20:10.1f} MiB")
+        self.line(f"<comment>{'Total':{width}}</>  {total / 2**20:10.1f} MiB")
+
+        max_size = config.get("cache-max-size")
+        if max_size:
+            self.line(f"{'Limit':{width}}  {max_size:10.1f} MiB")
+
+        return 0
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import ClassVar
+
+from cleo.helpers import option
+
+from poetry.config.config import Config
+from poetry.console.commands.command import Command
+
+
+if TYPE_CHECKING:
+    from cleo.io.inputs.option import Option
+
+
+class CachePruneCommand(Command):
+    name = "cache prune"
+    description = (
+        "Remove the least recently used cache entries"
+        " until the caches fit into the configured size."
+    )
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "max-size",
+            description=(
+                "The maximum size of the caches in MiB."
+                " Overrides the <comment>cache-max-size</comment> setting."
+            ),
+            flag=False,
+        )
+    ]
+
+    def handle(self) -> int:
+        from poetry.utils.cache import CacheManager
+
+        config = Config.create()
+
+        max_size = self.option("max-size")
+        if max_size is None:
+            max_size = config.get("cache-max-size")
+        elif not max_size.isdigit():
+            raise ValueError("--max-size must be a non-negative integer")
+        else:
+            max_size = int(max_size)
+
+        if not max_size:
+            self.line(
+                "The size of the caches is not limited."
+                " Set <c1>cache-max-size</> or pass <c1>--max-size</>"
+                " to prune the caches."
+            )
+            return 0
+
+        manager = CacheManager(
+            repository_cache_dir=config.repository_cache_directory,
+            artifacts_cache_dir=config.artifacts_cache_directory,
+            metadata_cache_dir=config.metadata_cache_directory,
+            lock_cache_dir=config.lock_cache_directory,
+            latest_versions_cache_dir=config.latest_versions_cache_directory,
+        )
+        removed, freed = manager.prune(max_size * 2**20)
+
+        if removed:
+            self.line(
+                f"Removed <info>{removed}</> cache entries"
+                f" (<info>{freed / 2**20:.1f} MiB</>)"
+            )
+        else:
+            self.line("The caches already fit into the limit")
+
+        return 0
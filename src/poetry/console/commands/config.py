@@ -77,6 +77,7 @@ To remove a repository (repo is a short alias for repositories):
     def unique_config_values(self) -> dict[str, tuple[Any, Any]]:
         unique_config_values = {
             "cache-dir": (str, lambda val: str(Path(val))),
+            "cache-max-size": (lambda val: int(val) >= 0, int_normalizer),
             "data-dir": (str, lambda val: str(Path(val))),
             "virtualenvs.create": (boolean_validator, boolean_normalizer),
             "virtualenvs.in-project": (boolean_validator, boolean_normalizer),
@@ -91,9 +92,21 @@ To remove a repository (repo is a short alias for repositories):
             "virtualenvs.prompt": (str, str),
             "system-git-client": (boolean_validator, boolean_normalizer),
             "requests.max-retries": (lambda val: int(val) >= 0, int_normalizer),
+            "requests.offline": (boolean_validator, boolean_normalizer),
+            "requests.stale-while-revalidate": (
+                lambda val: int(val) >= 0,
+                int_normalizer,
+            ),
             "installer.re-resolve": (boolean_validator, boolean_normalizer),
             "installer.parallel": (boolean_validator, boolean_normalizer),
+            "installer.defer-compile": (boolean_validator, boolean_normalizer),
             "installer.max-workers": (lambda val: int(val) > 0, int_normalizer),
+            "installer.download-segments": (lambda val: int(val) > 0, int_normalizer),
+            "installer.max-connections-per-host": (
+                lambda val: int(val) > 0,
+                int_normalizer,
+            ),
+            "installer.max-download-rate": (lambda val: int(val) > 0, int_normalizer),
             "installer.no-binary": (
                 PackageFilterPolicy.validator,
                 PackageFilterPolicy.normalize,
@@ -112,6 +125,7 @@ To remove a repository (repo is a short alias for repositories):
                 lambda val: bool(val.strip()),
                 str_list_normalizer,
             ),
+            "solver.missing-package-ttl": (lambda val: int(val) >= 0, int_normalizer),
             "keyring.enabled": (boolean_validator, boolean_normalizer),
             "python.installation-dir": (str, lambda val: str(Path(val))),
         }
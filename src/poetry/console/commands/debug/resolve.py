@@ -12,10 +12,17 @@ from poetry.console.commands.show import ShowCommand
 
 
 if TYPE_CHECKING:
+    import functools
+
     from cleo.io.inputs.argument import Argument
     from cleo.io.inputs.option import Option
     from cleo.ui.table import Rows
 
+    from poetry.utils.profiling import Profiler
+
+
+PROFILE_FORMATS = ("json", "chrome")
+
 
 class DebugResolveCommand(InitCommand):
     name = "debug resolve"
@@ -35,6 +42,23 @@ class DebugResolveCommand(InitCommand):
         option("python", None, "Python version(s) to use for resolution.", flag=False),
         option("tree", None, "Display the dependency tree."),
         option("install", None, "Show what would be installed for the current system."),
+        option("profile", None, "Show where the time of the resolution is spent."),
+        option(
+            "profile-output",
+            None,
+            "Write the profile of the resolution to the given file"
+            " (implies <info>--profile</info>).",
+            flag=False,
+        ),
+        option(
+            "profile-format",
+            None,
+            "Format of the profile file (`json` or `chrome`)."
+            " `chrome` writes a trace that can be loaded into chrome://tracing"
+            " or Perfetto.",
+            flag=False,
+            default="json",
+        ),
     ]
 
     loggers: ClassVar[list[str]] = [
@@ -47,11 +71,23 @@ class DebugResolveCommand(InitCommand):
         from poetry.core.packages.project_package import ProjectPackage
 
         from poetry.factory import Factory
+        from poetry.puzzle.markers import cache_info
         from poetry.puzzle.solver import Solver
+        from poetry.repositories.lockfile_repository import LockfileRepository
         from poetry.repositories.repository import Repository
         from poetry.repositories.repository_pool import RepositoryPool
+        from poetry.utils import profiling
         from poetry.utils.env import EnvManager
 
+        profile = self.option("profile") or bool(self.option("profile-output"))
+        if self.option("profile-format") not in PROFILE_FORMATS:
+            self.line_error(
+                "<error>Error: Invalid profile format. Supported formats are:"
+                f" {', '.join(PROFILE_FORMATS)}.</error>"
+            )
+
+            return 1
+
         packages = self.argument("package")
 
         if not packages:
@@ -91,7 +127,15 @@ class DebugResolveCommand(InitCommand):
 
         solver = Solver(package, pool, [], [], self.io)
 
-        ops = solver.solve().calculate_operations()
+        if profile:
+            # The marker caches live as long as the process,
+            # so only the statistics of this resolution are reported.
+            marker_cache_info = cache_info()
+            with profiling.profile() as profiler:
+                ops = solver.solve().calculate_operations()
+            self._display_profile(profiler, marker_cache_info)
+        else:
+            ops = solver.solve().calculate_operations()
 
         self.line("")
         self.line("Resolution results:")
@@ -102,14 +146,14 @@ class DebugResolveCommand(InitCommand):
             assert isinstance(show_command, ShowCommand)
             show_command.init_styles(self.io)
 
-            packages = [op.package for op in ops]
+            solved_repository = LockfileRepository()
+            for op in ops:
+                solved_repository.add_package(op.package)
 
-            requires = package.all_requires
-            for pkg in packages:
-                for require in requires:
-                    if pkg.name == require.name:
-                        show_command.display_package_tree(self.io, pkg, packages)
-                        break
+            required_names = {require.name for require in package.all_requires}
+            for pkg in solved_repository.packages:
+                if pkg.name in required_names:
+                    show_command.display_package_tree(self.io, pkg, solved_repository)
 
             return 0
 
@@ -149,3 +193,64 @@ class DebugResolveCommand(InitCommand):
         table.render()
 
         return 0
+
+    def _display_profile(
+        self,
+        profiler: Profiler,
+        marker_cache_info: dict[str, functools._CacheInfo],
+    ) -> None:
+        import json
+
+        from pathlib import Path
+
+        from poetry.puzzle.markers import cache_info
+
+        for name, info in cache_info().items():
+            before = marker_cache_info[name]
+            profiler.count("marker cache hits", info.hits - before.hits)
+            profiler.count("marker cache misses", info.misses - before.misses)
+
+        self.line("")
+        self.line(f"Profile (<b>{profiler.seconds:.3f}s</b>):")
+        self.line("")
+
+        table = self.table(style="compact")
+        table.style.set_vertical_border_chars("", " ")
+        rows: Rows = [
+            [f"<c1>{name}</c1>", str(stats.count), f"<b>{stats.seconds:.3f}s</b>"]
+            for name, stats in sorted(
+                profiler.phases.items(), key=lambda item: -item[1].seconds
+            )
+        ]
+        rows.extend(
+            [f"<c1>{name}</c1>", str(value), ""]
+            for name, value in sorted(profiler.counters.items())
+        )
+        table.set_rows(rows)
+        table.render()
+
+        slowest = profiler.slowest_subjects()
+        if slowest:
+            self.line("")
+            self.line("Slowest packages:")
+            self.line("")
+            table = self.table(style="compact")
+            table.style.set_vertical_border_chars("", " ")
+            table.set_rows(
+                [
+                    [f"<c1>{name}</c1>", f"<b>{seconds:.3f}s</b>"]
+                    for name, seconds in slowest
+                ]
+            )
+            table.render()
+
+        output = self.option("profile-output")
+        if output:
+            data = (
+                profiler.to_chrome_trace()
+                if self.option("profile-format") == "chrome"
+                else profiler.to_dict()
+            )
+            Path(output).write_text(json.dumps(data, indent=2), encoding="utf-8")
+            self.line("")
+            self.line(f"Wrote profile to <c1>{output}</c1>")
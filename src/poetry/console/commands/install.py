@@ -58,6 +58,18 @@ class InstallCommand(InstallerCommand):
             None,
             "Compile Python source files to bytecode.",
         ),
+        option(
+            "timing",
+            None,
+            "Display how long the phases of the slowest installations took.",
+        ),
+        option(
+            "timing-output",
+            None,
+            "Write the timings of the installation to the given file"
+            " (implies <info>--timing</info>).",
+            flag=False,
+        ),
     ]
 
     help = """\
@@ -107,6 +119,8 @@ you can set the "package-mode" to false in your pyproject.toml file.
         return bool(with_synchronization)
 
     def handle(self) -> int:
+        from pathlib import Path
+
         from poetry.core.masonry.utils.module import ModuleOrPackageNotFoundError
 
         from poetry.masonry.builders.editable import EditableBuilder
@@ -169,6 +183,10 @@ you can set the "package-mode" to false in your pyproject.toml file.
         self.installer.dry_run(self.option("dry-run"))
         self.installer.requires_synchronization(self._with_synchronization)
         self.installer.executor.enable_bytecode_compilation(self.option("compile"))
+        timing_output = self.option("timing-output")
+        self.installer.executor.enable_timing(
+            self.option("timing"), Path(timing_output) if timing_output else None
+        )
         self.installer.verbose(self.io.is_verbose())
 
         return_code = self.installer.run()
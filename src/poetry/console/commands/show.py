@@ -26,18 +26,19 @@ if TYPE_CHECKING:
     from poetry.core.packages.package import Package
     from poetry.core.packages.project_package import ProjectPackage
 
-    from poetry.repositories.repository import Repository
+    from poetry.repositories.lockfile_repository import LockfileRepository
+    from poetry.utils.cache import FileCache
 
 
-def reverse_deps(pkg: Package, repo: Repository) -> dict[str, str]:
-    required_by = {}
-    for locked in repo.packages:
-        dependencies = {d.name: d.pretty_constraint for d in locked.requires}
+# Lifetime in minutes of the cached results of latest version lookups.
+LATEST_VERSIONS_CACHE_TTL = 10
 
-        if pkg.name in dependencies:
-            required_by[locked.pretty_name] = dependencies[pkg.name]
 
-    return required_by
+def reverse_deps(pkg: Package, repo: LockfileRepository) -> dict[str, str]:
+    return {
+        locked.pretty_name: dependency.pretty_constraint
+        for locked, dependency in repo.required_by(pkg.name)
+    }
 
 
 class OutputFormats(str, Enum):
@@ -173,20 +174,17 @@ lists all packages available."""
         return "poetry lock"
 
     def _display_single_package_information(
-        self, package: str, locked_repository: Repository
+        self, package: str, locked_repository: LockfileRepository
     ) -> int:
-        locked_packages = locked_repository.packages
-        canonicalized_package = canonicalize_name(package)
-        pkg = None
-
-        for locked in locked_packages:
-            if locked.name == canonicalized_package:
-                pkg = locked
-                break
+        locked_packages = locked_repository.packages_with_name(
+            canonicalize_name(package)
+        )
 
-        if not pkg:
+        if not locked_packages:
             raise ValueError(f"Package {package} not found")
 
+        pkg = locked_packages[0]
+
         required_by = reverse_deps(pkg, locked_repository)
 
         if self.option("tree"):
@@ -196,9 +194,7 @@ lists all packages available."""
                 # of them in turn
                 packages = [pkg]
                 if required_by:
-                    packages = [
-                        p for p in locked_packages for r in required_by if p.name == r
-                    ]
+                    packages = [p for p, _ in locked_repository.required_by(pkg.name)]
                 else:
                     # if no rev-deps exist we'll make this clear as it can otherwise
                     # look very odd for packages that also have no or few direct
@@ -207,11 +203,11 @@ lists all packages available."""
 
                 for p in packages:
                     self.display_package_tree(
-                        self.io, p, locked_packages, why_package=pkg
+                        self.io, p, locked_repository, why_package=pkg
                     )
 
             else:
-                self.display_package_tree(self.io, pkg, locked_packages)
+                self.display_package_tree(self.io, pkg, locked_repository)
 
             return 0
 
@@ -259,7 +255,7 @@ lists all packages available."""
         return 0
 
     def _display_packages_information(
-        self, locked_repository: Repository, root: ProjectPackage
+        self, locked_repository: LockfileRepository, root: ProjectPackage
     ) -> int:
         import shutil
 
@@ -295,9 +291,24 @@ lists all packages available."""
             else shutil.get_terminal_size().columns
         )
         name_length = version_length = latest_length = required_by_length = 0
-        latest_packages = {}
-        latest_statuses = {}
+        latest_packages: dict[str, Package] = {}
+        latest_statuses: dict[str, str] = {}
         installed_repo = InstalledRepository.load(self.env)
+
+        if show_latest:
+            shown_packages = [
+                locked
+                for locked in locked_packages
+                if show_all or locked in required_locked_packages
+            ]
+            for locked, latest in zip(
+                shown_packages, self.find_latest_packages(shown_packages, root)
+            ):
+                latest = latest or locked
+                latest_packages[locked.pretty_name] = latest
+                latest_statuses[locked.pretty_name] = self.get_update_status(
+                    latest, locked
+                )
         requires = root.all_requires
 
         # Computing widths
@@ -315,14 +326,8 @@ lists all packages available."""
                     current_length += 4
 
             if show_latest:
-                latest = self.find_latest_package(locked, root)
-                if not latest:
-                    latest = locked
-
-                latest_packages[locked.pretty_name] = latest
-                update_status = latest_statuses[locked.pretty_name] = (
-                    self.get_update_status(latest, locked)
-                )
+                latest = latest_packages[locked.pretty_name]
+                update_status = latest_statuses[locked.pretty_name]
 
                 if not self.option("outdated") or update_status != "up-to-date":
                     name_length = max(name_length, current_length)
@@ -504,15 +509,13 @@ lists all packages available."""
         return 0
 
     def _display_packages_tree_information(
-        self, locked_repository: Repository, root: ProjectPackage
+        self, locked_repository: LockfileRepository, root: ProjectPackage
     ) -> int:
-        packages = locked_repository.packages
+        required_names = {require.name for require in root.all_requires}
 
-        for p in packages:
-            for require in root.all_requires:
-                if p.name == require.name:
-                    self.display_package_tree(self.io, p, packages)
-                    break
+        for p in locked_repository.packages:
+            if p.name in required_names:
+                self.display_package_tree(self.io, p, locked_repository)
 
         return 0
 
@@ -520,7 +523,7 @@ lists all packages available."""
         self,
         io: IO,
         package: Package,
-        installed_packages: list[Package],
+        locked_repository: LockfileRepository,
         why_package: Package | None = None,
     ) -> None:
         io.write(f"<c1>{package.pretty_name}</c1>")
@@ -559,7 +562,7 @@ lists all packages available."""
             self._display_tree(
                 io,
                 dependency,
-                installed_packages,
+                locked_repository,
                 packages_in_tree,
                 tree_bar,
                 level + 1,
@@ -569,7 +572,7 @@ lists all packages available."""
         self,
         io: IO,
         dependency: Dependency,
-        installed_packages: list[Package],
+        locked_repository: LockfileRepository,
         packages_in_tree: set[NormalizedName],
         previous_tree_bar: str = "├",
         level: int = 1,
@@ -577,11 +580,8 @@ lists all packages available."""
         previous_tree_bar = previous_tree_bar.replace("├", "│")
 
         dependencies = []
-        for package in installed_packages:
-            if package.name == dependency.name:
-                dependencies = package.requires
-
-                break
+        if packages := locked_repository.packages_with_name(dependency.name):
+            dependencies = packages[0].requires
 
         dependencies = sorted(
             dependencies,
@@ -614,7 +614,7 @@ lists all packages available."""
                     self._display_tree(
                         io,
                         dependency,
-                        installed_packages,
+                        locked_repository,
                         packages_in_tree,
                         tree_bar,
                         level + 1,
@@ -639,6 +639,92 @@ lists all packages available."""
             io.output.formatter.set_style(color, style)
             io.error_output.formatter.set_style(color, style)
 
+    def find_latest_packages(
+        self, packages: list[Package], root: ProjectPackage
+    ) -> list[Package | None]:
+        """
+        Find the latest versions of several packages at once.
+
+        Lookups are run concurrently and results for packages from package
+        sources are kept in a short-lived cache, so that repeated invocations
+        do not have to fetch the same project pages again. Only the version
+        and the source of a package are cached because nothing else of the
+        latest packages is displayed. Thus, packages that are restored from
+        the cache have no description or dependencies.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from poetry.utils.cache import FileCache
+
+        cache: FileCache[dict[str, str | None]] = FileCache(
+            self.poetry.config.latest_versions_cache_directory
+        )
+        max_workers = min(self.poetry.config.installer_max_workers, len(packages))
+        if max_workers <= 1:
+            return [self._find_latest_package(p, root, cache) for p in packages]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda p: self._find_latest_package(p, root, cache), packages
+                )
+            )
+
+    def _find_latest_package(
+        self,
+        package: Package,
+        root: ProjectPackage,
+        cache: FileCache[dict[str, str | None]],
+    ) -> Package | None:
+        from poetry.core.packages.package import Package
+
+        if package.is_direct_origin():
+            return self.find_latest_package(package, root)
+
+        key = self._latest_cache_key(package, root)
+        cached = cache.get(key)
+        if cached is not None:
+            if cached["version"] is None:
+                return None
+
+            return Package(
+                package.name,
+                cached["version"],
+                source_type=cached["source_type"],
+                source_url=cached["source_url"],
+                source_reference=cached["source_reference"],
+            )
+
+        latest = self.find_latest_package(package, root)
+        cache.put(
+            key,
+            {
+                "version": latest.pretty_version if latest else None,
+                "source_type": latest.source_type if latest else None,
+                "source_url": latest.source_url if latest else None,
+                "source_reference": latest.source_reference if latest else None,
+            },
+            minutes=LATEST_VERSIONS_CACHE_TTL,
+        )
+        return latest
+
+    def _latest_cache_key(self, package: Package, root: ProjectPackage) -> str:
+        from poetry.repositories.http_repository import HTTPRepository
+
+        allow_prereleases: bool | None = None
+        for dep in root.all_requires:
+            if dep.name == package.name:
+                allow_prereleases = dep.allows_prereleases()
+                break
+
+        sources = [
+            f"{repo.name}={repo.url if isinstance(repo, HTTPRepository) else ''}"
+            for repo in self.poetry.pool.repositories
+        ]
+        return json.dumps(
+            [sources, package.name, package.pretty_version, allow_prereleases]
+        )
+
     def find_latest_package(
         self, package: Package, root: ProjectPackage
     ) -> Package | None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import logging
 import re
 
@@ -25,7 +26,7 @@ from poetry.plugins.plugin_manager import PluginManager
 from poetry.poetry import Poetry
 from poetry.pyproject.toml import PyProjectTOML
 from poetry.toml.file import TOMLFile
-from poetry.utils.isolated_build import CONSTRAINTS_GROUP_NAME
+from poetry.utils.constants import CONSTRAINTS_GROUP_NAME
 
 
 if TYPE_CHECKING:
@@ -39,6 +40,7 @@ if TYPE_CHECKING:
 
     from poetry.repositories import RepositoryPool
     from poetry.repositories.http_repository import HTTPRepository
+    from poetry.repositories.repository_pool import Priority
     from poetry.utils.dependency_specification import DependencySpec
 
 logger = logging.getLogger(__name__)
@@ -70,6 +72,7 @@ class Factory(BaseFactory):
         io: IO | None = None,
         disable_plugins: bool = False,
         disable_cache: bool = False,
+        offline: bool = False,
     ) -> Poetry:
         if io is None:
             io = NullIO()
@@ -96,7 +99,6 @@ class Factory(BaseFactory):
                     )
 
         poetry_file = base_poetry.pyproject_path
-        locker = Locker(poetry_file.parent / "poetry.lock", base_poetry.pyproject.data)
 
         # Loading global configuration
         config = Config.create()
@@ -109,6 +111,10 @@ class Factory(BaseFactory):
 
             config.merge(local_config_file.read())
 
+        if offline:
+            # the command line option takes precedence over the local configuration
+            config.merge({"requests": {"offline": True}})
+
         # Load local sources
         repositories = {}
         existing_repositories = config.get("repositories", {})
@@ -120,6 +126,12 @@ class Factory(BaseFactory):
 
         config.merge({"repositories": repositories})
 
+        locker = Locker(
+            poetry_file.parent / "poetry.lock",
+            base_poetry.pyproject.data,
+            cache_dir=None if disable_cache else config.lock_cache_directory,
+        )
+
         poetry = Poetry(
             poetry_file,
             base_poetry.local_config,
@@ -130,12 +142,14 @@ class Factory(BaseFactory):
             build_constraints=build_constraints,
         )
 
-        poetry.set_pool(
-            self.create_pool(
-                config,
-                poetry.local_config.get("source", []),
-                io,
-                disable_cache=disable_cache,
+        # The pool is created on first use so that commands that do not need
+        # any package sources do not have to load the network stack.
+        # Nevertheless, the sources are validated right away.
+        sources = poetry.local_config.get("source", [])
+        self._get_pool_sources(sources)
+        poetry.set_pool_factory(
+            functools.partial(
+                self.create_pool, config, sources, io, disable_cache=disable_cache
             )
         )
 
@@ -155,7 +169,6 @@ class Factory(BaseFactory):
         disable_cache: bool = False,
     ) -> RepositoryPool:
         from poetry.repositories import RepositoryPool
-        from poetry.repositories.repository_pool import Priority
 
         if io is None:
             io = NullIO()
@@ -165,12 +178,10 @@ class Factory(BaseFactory):
 
         pool = RepositoryPool(config=config)
 
-        explicit_pypi = False
-        for source in sources:
+        for source, priority in cls._get_pool_sources(sources, io):
             repository = cls.create_package_source(
                 source, config, disable_cache=disable_cache
             )
-            priority = Priority[source.get("priority", Priority.PRIMARY.name).upper()]
 
             if io.is_debug():
                 io.write_line(
@@ -179,28 +190,42 @@ class Factory(BaseFactory):
                 )
 
             pool.add_repository(repository, priority=priority)
-            if repository.name.lower() == "pypi":
+
+        return pool
+
+    @staticmethod
+    def _get_pool_sources(
+        sources: Iterable[dict[str, Any]], io: IO | None = None
+    ) -> list[tuple[dict[str, Any], Priority]]:
+        """
+        Returns the package sources of a pool with their priorities,
+        including PyPI if it is used implicitly.
+        """
+        from poetry.repositories.repository_pool import Priority
+
+        pool_sources: list[tuple[dict[str, Any], Priority]] = []
+
+        explicit_pypi = False
+        for source in sources:
+            priority = Priority[source.get("priority", Priority.PRIMARY.name).upper()]
+            pool_sources.append((source, priority))
+            if source.get("name", "").lower() == "pypi":
                 explicit_pypi = True
 
         # Only add PyPI if no primary repository is configured
         if not explicit_pypi:
-            if pool.has_primary_repositories():
-                if io.is_debug():
+            if any(priority is Priority.PRIMARY for _, priority in pool_sources):
+                if io is not None and io.is_debug():
                     io.write_line("Deactivating the PyPI repository")
             else:
-                pool.add_repository(
-                    cls.create_package_source(
-                        {"name": "pypi"}, config, disable_cache=disable_cache
-                    ),
-                    priority=Priority.PRIMARY,
-                )
+                pool_sources.append(({"name": "pypi"}, Priority.PRIMARY))
 
-        if not pool.repositories:
+        if all(priority is Priority.EXPLICIT for _, priority in pool_sources):
             raise PoetryError(
                 "At least one source must not be configured as 'explicit'."
             )
 
-        return pool
+        return pool_sources
 
     @classmethod
     def create_package_source(
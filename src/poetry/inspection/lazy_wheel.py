@@ -8,6 +8,7 @@ import re
 
 from bisect import bisect_left
 from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from tempfile import NamedTemporaryFile
 from typing import IO
@@ -69,20 +70,29 @@ class InvalidWheelError(LazyWheelUnsupportedError):
 
 
 def metadata_from_wheel_url(
-    name: str, url: str, session: Session | Authenticator
+    name: str,
+    url: str,
+    session: Session | Authenticator,
+    *,
+    supports_range_requests: dict[str, bool] | None = None,
 ) -> RawMetadata:
     """Fetch metadata from the given wheel URL.
 
     This uses HTTP range requests to only fetch the portion of the wheel
     containing metadata, just enough for the object to be constructed.
 
+    If ``supports_range_requests`` is given, it is used and updated to remember
+    which hosts support range requests (see ``LazyWheelOverHTTP``).
+
     :raises HTTPRangeRequestUnsupportedError: if range requests are unsupported for ``url``.
     :raises InvalidWheelError: if the zip file contents could not be parsed.
     """
     try:
         # After context manager exit, wheel.name will point to a deleted file path.
         # Add `delete_backing_file=False` to disable this for debugging.
-        with LazyWheelOverHTTP(url, session) as lazy_file:
+        with LazyWheelOverHTTP(
+            url, session, supports_range_requests=supports_range_requests
+        ) as lazy_file:
             metadata_bytes = lazy_file.read_metadata(name)
 
         metadata, _ = parse_email(metadata_bytes)
@@ -113,6 +123,60 @@ def metadata_from_wheel_url(
         ) from e
 
 
+def metadata_from_wheel_urls(
+    wheels: Iterable[tuple[str, str]],
+    session: Session | Authenticator,
+    *,
+    supports_range_requests: dict[str, bool] | None = None,
+    max_workers: int | None = None,
+) -> dict[str, RawMetadata | LazyWheelUnsupportedError]:
+    """Fetch metadata from many wheel URLs concurrently.
+
+    ``wheels`` are pairs of a name and a URL as passed to
+    ``metadata_from_wheel_url()``. The range requests for different wheels
+    run concurrently and share the connection pool of ``session``.
+
+    Whether a host supports range requests is only found out once:
+    if ``supports_range_requests`` does not know a host yet, the metadata of
+    one of its wheels is fetched first. If the host turns out to not support
+    range requests, its other wheels are not requested at all.
+
+    :returns: the metadata or the error for each URL.
+    """
+    if supports_range_requests is None:
+        supports_range_requests = {}
+
+    # One wheel of each unknown host is fetched before all other wheels.
+    probes: list[tuple[str, str]] = []
+    others: list[tuple[str, str]] = []
+    probed_hosts: set[str] = set()
+    for name, url in wheels:
+        host = urlparse(url).netloc
+        if host in supports_range_requests or host in probed_hosts:
+            others.append((name, url))
+        else:
+            probed_hosts.add(host)
+            probes.append((name, url))
+
+    def fetch(wheel: tuple[str, str]) -> RawMetadata | LazyWheelUnsupportedError:
+        name, url = wheel
+        try:
+            return metadata_from_wheel_url(
+                name, url, session, supports_range_requests=supports_range_requests
+            )
+        except LazyWheelUnsupportedError as e:
+            return e
+
+    results: dict[str, RawMetadata | LazyWheelUnsupportedError] = {}
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="lazy-wheel"
+    ) as executor:
+        for batch in (probes, others):
+            results.update(zip((url for _, url in batch), executor.map(fetch, batch)))
+
+    return results
+
+
 class MergeIntervals:
     """Stateful bookkeeping to merge interval graphs."""
 
@@ -498,12 +562,59 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
 
     _metadata_regex = re.compile(r"^[^/]*\.dist-info/METADATA$")
 
+    def __init__(
+        self,
+        url: str,
+        session: Session | Authenticator,
+        delete_backing_file: bool = True,
+        *,
+        supports_range_requests: dict[str, bool] | None = None,
+    ) -> None:
+        """
+        ``supports_range_requests`` may be shared between several lazy wheels
+        to remember which hosts support range requests. A domain might support
+        range requests only for some files, so the meaning is as follows:
+
+        - Domain not in dict: We don't know anything.
+        - True: The domain supports range requests for at least some files.
+        - False: The domain does not support range requests for the files we tried.
+
+        No requests are made for wheels from domains that are known to not
+        support range requests.
+        """
+        super().__init__(url, session, delete_backing_file)
+        self._supports_range_requests = supports_range_requests
+        self._domain = urlparse(url).netloc
+
+    def __enter__(self) -> Self:
+        try:
+            return super().__enter__()
+        except HTTPRangeRequestUnsupportedError:
+            self._remember_range_support(False)
+            raise
+
     def read_metadata(self, name: str) -> bytes:
         """Download and read the METADATA file from the remote wheel."""
-        with ZipFile(self) as zf:
-            # prefetch metadata to reduce the number of range requests
-            filename = self._prefetch_metadata(name)
-            return zf.read(filename)
+        try:
+            with ZipFile(self) as zf:
+                # prefetch metadata to reduce the number of range requests
+                filename = self._prefetch_metadata(name)
+                metadata = zf.read(filename)
+        except HTTPRangeRequestNotRespectedError:
+            self._remember_range_support(False)
+            raise
+
+        self._remember_range_support(True)
+        return metadata
+
+    def _remember_range_support(self, supported: bool) -> None:
+        if self._supports_range_requests is None:
+            return
+        if supported:
+            self._supports_range_requests[self._domain] = True
+        else:
+            # Do not forget that range requests are supported for some files.
+            self._supports_range_requests.setdefault(self._domain, False)
 
     @classmethod
     def _initial_chunk_length(cls) -> int:
@@ -538,6 +649,14 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
         by a GET request with the double-ended range header ``Range: bytes=X-Y`` to
         extract the final ``N`` bytes from the remote resource.
         """
+        if (
+            self._supports_range_requests is not None
+            and self._supports_range_requests.get(self._domain) is False
+        ):
+            raise HTTPRangeRequestUnsupportedError(
+                f"server {self._domain} did not support byte ranges before"
+            )
+
         initial_chunk_size = self._initial_chunk_length()
         ret_length, tail = self._extract_content_length(initial_chunk_size)
 
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import csv
+import dataclasses
 import functools
 import itertools
 import json
 import threading
+import time
 
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
@@ -23,8 +25,10 @@ from poetry.installation.operations import Uninstall
 from poetry.installation.operations import Update
 from poetry.installation.wheel_installer import WheelInstaller
 from poetry.puzzle.exceptions import SolverProblemError
+from poetry.utils import profiling
 from poetry.utils._compat import decode
 from poetry.utils.authenticator import Authenticator
+from poetry.utils.download_scheduler import DownloadScheduler
 from poetry.utils.env import EnvCommandError
 from poetry.utils.helpers import Downloader
 from poetry.utils.helpers import get_file_hash
@@ -40,6 +44,7 @@ from poetry.vcs.git import Git
 if TYPE_CHECKING:
     from collections.abc import Mapping
     from collections.abc import Sequence
+    from concurrent.futures import Future
 
     from cleo.io.io import IO
     from cleo.io.outputs.section_output import SectionOutput
@@ -77,6 +82,7 @@ class Executor:
         self._enabled = True
         self._verbose = False
         self._wheel_installer = WheelInstaller(self._env)
+        self._defer_compile = config.get("installer.defer-compile", False)
         self._build_constraints = build_constraints or {}
 
         if parallel is None:
@@ -87,9 +93,20 @@ class Executor:
         else:
             self._max_workers = 1
 
+        self._download_segments = config.get("installer.download-segments", 1)
         self._artifact_cache = pool.artifact_cache
+        # each worker may download with several connections
         self._authenticator = Authenticator(
-            config, self._io, disable_cache=disable_cache, pool_size=self._max_workers
+            config,
+            self._io,
+            disable_cache=disable_cache,
+            pool_size=self._max_workers * self._download_segments,
+        )
+        max_download_rate = config.get("installer.max-download-rate")
+        self._download_scheduler = DownloadScheduler(
+            max_connections_per_host=config.get("installer.max-connections-per-host"),
+            # the setting is given in KiB/s
+            max_rate=max_download_rate * 1024 if max_download_rate else None,
         )
         self._chef = Chef(self._artifact_cache, self._env, pool)
         self._chooser = Chooser(pool, self._env, config)
@@ -102,6 +119,9 @@ class Executor:
         self._lock = threading.Lock()
         self._shutdown = False
         self._hashes: dict[str, str] = {}
+        self._timing = False
+        self._timing_output: Path | None = None
+        self._submitted: dict[int, float] = {}
 
         # Cache whether decorated output is supported.
         # https://github.com/python-poetry/cleo/issues/423
@@ -148,9 +168,31 @@ class Executor:
         return self
 
     def enable_bytecode_compilation(self, enable: bool = True) -> None:
-        self._wheel_installer.enable_bytecode_compilation(enable)
+        self._wheel_installer.enable_bytecode_compilation(
+            enable, defer=self._defer_compile
+        )
+
+    def enable_timing(self, enable: bool = True, output: Path | None = None) -> None:
+        """
+        Measure the phases of the operations and display the slowest packages
+        after the execution. If an output path is given, the timings are
+        also written to this file in the Trace Event Format.
+        """
+        self._timing = enable or output is not None
+        self._timing_output = output
 
     def execute(self, operations: list[Operation]) -> int:
+        if not self._timing:
+            return self._execute(operations)
+
+        with profiling.profile() as profiler:
+            result = self._execute(operations)
+
+        self._display_timing(profiler)
+
+        return result
+
+    def _execute(self, operations: list[Operation]) -> int:
         for job_type in self._executed:
             self._executed[job_type] = 0
             self._skipped[job_type] = 0
@@ -165,7 +207,7 @@ class Executor:
         # because we still need it for uninstalls
         for i, op in enumerate(operations):
             if op.package.name == "pip":
-                wait([self._executor.submit(self._execute_operation, op)])
+                wait([self._submit(op)])
                 del operations[i]
                 break
 
@@ -202,9 +244,7 @@ class Executor:
                         operation
                     )
                 else:
-                    tasks.append(
-                        self._executor.submit(self._execute_operation, operation)
-                    )
+                    tasks.append(self._submit(operation))
 
             def _serialize(
                 repository_serial_operations: list[Operation],
@@ -236,6 +276,8 @@ class Executor:
                 self._executor.shutdown(wait=True, cancel_futures=True)
                 break
 
+        self._wheel_installer.compile_bytecode()
+
         for warning in self._yanked_warnings:
             self._io.write_error_line(f"<warning>Warning: {warning}</warning>")
         for path, issues in self._wheel_installer.invalid_wheels.items():
@@ -249,6 +291,79 @@ class Executor:
 
         return 1 if self._shutdown else 0
 
+    def _submit(self, operation: Operation) -> Future[None]:
+        if self._timing:
+            self._submitted[id(operation)] = time.perf_counter()
+        return self._executor.submit(self._execute_operation, operation)
+
+    def _display_timing(self, profiler: profiling.Profiler, limit: int = 10) -> None:
+        phases = ("queue wait", "download", "hash check", "build", "install", "compile")
+        slowest = profiler.slowest_subjects(limit)
+        if slowest:
+            rows = [("Package", "Total", *(phase.capitalize() for phase in phases))]
+            for name, seconds in slowest:
+                subject_phases = profiler.subject_phases[name]
+                rows.append(
+                    (
+                        name,
+                        f"{seconds:.2f}s",
+                        *(
+                            f"{subject_phases[phase]:.2f}s"
+                            if phase in subject_phases
+                            else "-"
+                            for phase in phases
+                        ),
+                    )
+                )
+            self._display_table(
+                f"<b>Slowest packages</b> ({profiler.seconds:.2f}s in total):", rows
+            )
+
+        host_stats = self._download_scheduler.host_stats
+        if host_stats:
+            self._display_table(
+                "<b>Download hosts</b>:",
+                [
+                    ("Host", "Requests", "Downloaded", "Throughput", "Queue wait"),
+                    *(
+                        (
+                            host,
+                            str(stats.requests),
+                            f"{stats.bytes / 1024**2:.1f} MiB",
+                            f"{stats.throughput / 1024**2:.1f} MiB/s",
+                            f"{stats.queue_seconds:.2f}s",
+                        )
+                        for host, stats in sorted(
+                            host_stats.items(), key=lambda item: -item[1].bytes
+                        )
+                    ),
+                ],
+            )
+
+        if self._timing_output is not None:
+            trace = profiler.to_chrome_trace()
+            trace["otherData"] = profiler.to_dict()
+            trace["otherData"]["hosts"] = {
+                host: {**dataclasses.asdict(stats), "throughput": stats.throughput}
+                for host, stats in host_stats.items()
+            }
+            self._timing_output.write_text(json.dumps(trace), encoding="utf-8")
+            self._io.write_line("")
+            self._io.write_line(f"Wrote timings to <c1>{self._timing_output}</c1>")
+
+    def _display_table(self, title: str, rows: Sequence[Sequence[str]]) -> None:
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+
+        self._io.write_line("")
+        self._io.write_line(title)
+        self._io.write_line("")
+        for i, row in enumerate(rows):
+            cells = [row[0].ljust(widths[0])] + [
+                cell.rjust(width) for cell, width in zip(row[1:], widths[1:])
+            ]
+            line = "  ".join(cells)
+            self._io.write_line(f"<b>{line}</>" if i == 0 else line)
+
     def _write(self, operation: Operation, line: str) -> None:
         if not self.supports_fancy_output() or not self._should_write_operation(
             operation
@@ -268,6 +383,14 @@ class Executor:
             section.write(line)
 
     def _execute_operation(self, operation: Operation) -> None:
+        submitted = self._submitted.pop(id(operation), None)
+        if submitted is not None:
+            profiling.record(
+                "queue wait",
+                submitted,
+                time.perf_counter() - submitted,
+                subject=operation.package.name,
+            )
         if self._shutdown:
             return
         try:
@@ -297,7 +420,8 @@ class Executor:
                         )
 
             try:
-                result = self._do_execute_operation(operation)
+                with profiling.phase("operation", subject=operation.package.name):
+                    result = self._do_execute_operation(operation)
             except EnvCommandError as e:
                 if e.e.returncode == -2:
                     result = -2
@@ -611,7 +735,8 @@ class Executor:
                 assert isinstance(operation, Update)
                 self._remove(operation.initial_package)
 
-            self._wheel_installer.install(archive)
+            with profiling.phase("install", subject=package.name):
+                self._wheel_installer.install(archive)
         finally:
             if cleanup_archive:
                 archive.unlink()
@@ -629,7 +754,8 @@ class Executor:
                 remove_directory(src_dir, force=True)
 
         try:
-            return self.run_pip("uninstall", package.name, "-y")
+            with profiling.phase("uninstall", subject=package.name):
+                return self.run_pip("uninstall", package.name, "-y")
         except EnvCommandError as e:
             if "not installed" in str(e):
                 return 0
@@ -658,13 +784,14 @@ class Executor:
         self._populate_hashes_dict(archive, package)
 
         name = operation.package.name
-        return self._chef.prepare(
-            archive,
-            editable=package.develop,
-            output_dir=output_dir,
-            config_settings=self._build_config_settings.get(name),
-            build_constraints=self._build_constraints.get(name),
-        )
+        with profiling.phase("build", subject=name):
+            return self._chef.prepare(
+                archive,
+                editable=package.develop,
+                output_dir=output_dir,
+                config_settings=self._build_config_settings.get(name),
+                build_constraints=self._build_constraints.get(name),
+            )
 
     def _prepare_git_archive(self, operation: Install | Update) -> Path:
         package = operation.package
@@ -689,11 +816,12 @@ class Executor:
         )
         self._write(operation, message)
 
-        source = Git.clone(
-            url=package.source_url,
-            source_root=self._env.path / "src",
-            revision=package.source_resolved_reference or package.source_reference,
-        )
+        with profiling.phase("clone", subject=package.name):
+            source = Git.clone(
+                url=package.source_url,
+                source_root=self._env.path / "src",
+                revision=package.source_resolved_reference or package.source_reference,
+            )
 
         # Now we just need to install from the source directory
         original_url = package.source_url
@@ -774,12 +902,13 @@ class Executor:
             self._write(operation, message)
 
             name = operation.package.name
-            archive = self._chef.prepare(
-                archive,
-                output_dir=original_archive.parent,
-                config_settings=self._build_config_settings.get(name),
-                build_constraints=self._build_constraints.get(name),
-            )
+            with profiling.phase("build", subject=name):
+                archive = self._chef.prepare(
+                    archive,
+                    output_dir=original_archive.parent,
+                    config_settings=self._build_config_settings.get(name),
+                    build_constraints=self._build_constraints.get(name),
+                )
 
         # Use the original archive to provide the correct hash.
         self._populate_hashes_dict(original_archive, package)
@@ -788,7 +917,8 @@ class Executor:
 
     def _populate_hashes_dict(self, archive: Path, package: Package) -> None:
         if package.files and archive.name in {f["file"] for f in package.files}:
-            archive_hash = self._validate_archive_hash(archive, package)
+            with profiling.phase("hash check", subject=package.name):
+                archive_hash = self._validate_archive_hash(archive, package)
             self._hashes[package.name] = archive_hash
 
     @staticmethod
@@ -820,7 +950,12 @@ class Executor:
         dest: Path,
     ) -> None:
         downloader = Downloader(
-            url, dest, self._authenticator, max_retries=self._max_retries
+            url,
+            dest,
+            self._authenticator,
+            max_retries=self._max_retries,
+            segments=self._download_segments,
+            scheduler=self._download_scheduler,
         )
         wheel_size = downloader.total_size
 
@@ -845,10 +980,11 @@ class Executor:
                 self._sections[id(operation)].clear()
                 progress.start()
 
-        for fetched_size in downloader.download_with_progress(chunk_size=4096):
-            if progress:
-                with self._lock:
-                    progress.set_progress(fetched_size)
+        with profiling.phase("download", subject=operation.package.name):
+            for fetched_size in downloader.download_with_progress(chunk_size=4096):
+                if progress:
+                    with self._lock:
+                        progress.set_progress(fetched_size)
 
         if progress:
             with self._lock:
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from packaging.utils import canonicalize_name
+
+from poetry.__version__ import __version__
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from packaging.utils import NormalizedName
+
+    from poetry.utils.env import Env
+
+
+logger = logging.getLogger(__name__)
+
+
+class InstallFingerprint:
+    """
+    Fingerprint of the last successful installation from a lock file
+    into a virtual environment.
+
+    The fingerprint consists of the given state (e.g. the hash of the lock file
+    and the selected groups and extras) and a digest of the distributions
+    installed in the environment. If the stored fingerprint matches the current
+    one, installing from the lock file again would not change anything.
+    """
+
+    FILENAME = ".poetry-install-fingerprint"
+
+    def __init__(
+        self, env: Env, state: dict[str, Any], *, root_name: NormalizedName
+    ) -> None:
+        self._env = env
+        self._path = env.path / self.FILENAME
+        self._state = {"poetry": __version__, **state}
+        # The root package is installed (in editable mode) after the dependencies,
+        # so its metadata must not be part of the fingerprint.
+        self._root_name = root_name
+
+    def matches(self) -> bool:
+        try:
+            stored = json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.debug("Unable to read install fingerprint %s: %s", self._path, e)
+            return False
+
+        if not isinstance(stored, dict) or stored.get("state") != self._state:
+            return False
+
+        # The site-packages directories are taken from the stored fingerprint
+        # because determining them for the environment requires a subprocess.
+        site_packages = [Path(p) for p in stored.get("site-packages", [])]
+        return bool(site_packages) and stored.get(
+            "distributions"
+        ) == self._distributions_digest(site_packages)
+
+    def save(self) -> None:
+        site_packages = sorted({self._env.purelib, self._env.platlib})
+        data = {
+            "state": self._state,
+            "site-packages": [str(p) for p in site_packages],
+            "distributions": self._distributions_digest(site_packages),
+        }
+        try:
+            self._path.write_text(json.dumps(data), encoding="utf-8")
+        except OSError as e:
+            logger.debug("Unable to write install fingerprint %s: %s", self._path, e)
+
+    def clear(self) -> None:
+        try:
+            self._path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug("Unable to remove install fingerprint %s: %s", self._path, e)
+
+    def _distributions_digest(self, site_packages: Iterable[Path]) -> str:
+        entries: list[tuple[str, int]] = []
+        for directory in site_packages:
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if not entry.name.endswith(".dist-info"):
+                            continue
+                        name = canonicalize_name(entry.name.split("-", 1)[0])
+                        if name == self._root_name:
+                            continue
+                        entries.append((entry.path, entry.stat().st_mtime_ns))
+            except FileNotFoundError:
+                continue
+
+        return hashlib.sha256(json.dumps(sorted(entries)).encode()).hexdigest()
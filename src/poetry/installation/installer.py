@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+
 from typing import TYPE_CHECKING
 from typing import cast
 
@@ -27,6 +29,7 @@ if TYPE_CHECKING:
     from poetry.core.packages.project_package import ProjectPackage
 
     from poetry.config.config import Config
+    from poetry.installation.fingerprint import InstallFingerprint
     from poetry.installation.operations.operation import Operation
     from poetry.packages import Locker
     from poetry.packages.transitive_package_info import TransitivePackageInfo
@@ -78,16 +81,19 @@ class Installer:
             )
 
         self._executor = executor
-
-        if installed is None:
-            installed = self._get_installed()
-
-        self._installed_repository = installed
+        self._installed = installed
 
     @property
     def executor(self) -> Executor:
         return self._executor
 
+    @property
+    def _installed_repository(self) -> InstalledRepository:
+        if self._installed is None:
+            self._installed = self._get_installed()
+
+        return self._installed
+
     def set_package(self, package: ProjectPackage) -> Installer:
         self._package = package
 
@@ -110,7 +116,28 @@ class Installer:
         if self.is_dry_run():
             self.verbose(True)
 
-        return self._do_install()
+        fingerprint = self._get_fingerprint()
+        if fingerprint is not None and fingerprint.matches():
+            self._io.write_line("<info>Installing dependencies from lock file</>")
+            if self._io.is_verbose():
+                self._io.write_line("")
+                self._io.write_line(
+                    "<info>The environment has not changed since the last"
+                    " installation from the lock file</>"
+                )
+            self._io.write_line("")
+            self._io.write_line("No dependencies to install or update")
+            return 0
+
+        status = self._do_install()
+
+        if fingerprint is not None:
+            if status == 0:
+                fingerprint.save()
+            else:
+                fingerprint.clear()
+
+        return status
 
     def dry_run(self, dry_run: bool = True) -> Installer:
         self._dry_run = dry_run
@@ -285,11 +312,14 @@ class Installer:
                 if extra not in locker_extras:
                     raise ValueError(f"Extra [{extra}] is not specified.")
 
-            locked_repository = self._locker.locked_repository()
             if reresolve:
+                locked_repository = self._locker.locked_repository()
                 lockfile_repo = locked_repository
             else:
+                # Dependencies of locked packages are not required to calculate
+                # the operations, so we can skip parsing them.
                 solved_packages = self._locker.locked_packages()
+                locked_repository = Repository("poetry-locked", list(solved_packages))
 
         if self._io.is_verbose():
             self._io.write_line("")
@@ -381,6 +411,36 @@ class Installer:
 
         return status
 
+    def _get_fingerprint(self) -> InstallFingerprint | None:
+        """
+        Returns the fingerprint of an installation from the lock file
+        or None if the current run may change the lock file or is not executed.
+        """
+        from poetry.installation.fingerprint import InstallFingerprint
+
+        if (
+            self._update
+            or self._lock
+            or self.is_dry_run()
+            or not self.executor.enabled
+            or not self._env.is_venv()
+            or not self._locker.lock.exists()
+        ):
+            return None
+
+        return InstallFingerprint(
+            self._env,
+            {
+                "lock": hashlib.sha256(self._locker.lock.read_bytes()).hexdigest(),
+                "content-hash": self._locker.content_hash,
+                "groups": None if self._groups is None else sorted(self._groups),
+                "extras": sorted(self._extras),
+                "synchronize": self._requires_synchronization,
+                "skip-directory": self._skip_directory,
+            },
+            root_name=self._package.name,
+        )
+
     def _lock_fix_command(self) -> str:
         # `poetry self` commands operate on Poetry's own system project. When the lock
         # file is outdated, users should run `poetry self lock` rather than `poetry lock`.
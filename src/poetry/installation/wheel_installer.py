@@ -1,10 +1,24 @@
 from __future__ import annotations
 
+import base64
+import contextlib
+import csv
+import dataclasses
+import functools
+import hashlib
+import importlib.util
 import logging
+import mmap
+import multiprocessing
 import os
 import platform
+import posixpath
+import struct
 import sys
+import zipfile
+import zlib
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -14,6 +28,7 @@ from installer.sources import WheelFile
 from installer.sources import _WheelFileValidationError
 
 from poetry.__version__ import __version__
+from poetry.utils import profiling
 from poetry.utils._compat import WINDOWS
 
 
@@ -21,18 +36,198 @@ logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from collections.abc import Collection
+    from collections.abc import Iterable
+    from types import TracebackType
     from typing import BinaryIO
 
     from installer.records import RecordEntry
     from installer.scripts import LauncherKind
     from installer.utils import Scheme
+    from typing_extensions import Self
 
     from poetry.utils.env import Env
 
 
+# Bigger than the buffers of installer and shutil because
+# wheels often contain large shared libraries.
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# The layout of the local file header of a member of a zip file, see
+# https://pkware.cachefly.net/webdocs/casestudies/APPNOTE.TXT section 4.3.7
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_SIZE = _LOCAL_HEADER.size
+_LOCAL_HEADER_SIGNATURE = b"PK\003\004"
+
+
+def _encode_hash(hasher: hashlib._Hash) -> str:
+    return base64.urlsafe_b64encode(hasher.digest()).decode("ascii").rstrip("=")
+
+
+def _copyfileobj_with_hashing(
+    source: BinaryIO, dest: BinaryIO, hash_algorithm: str
+) -> tuple[str, int]:
+    hasher = hashlib.new(hash_algorithm)
+    size = 0
+    while buf := source.read(COPY_BUFFER_SIZE):
+        hasher.update(buf)
+        dest.write(buf)
+        size += len(buf)
+
+    return _encode_hash(hasher), size
+
+
+def _copy_range(
+    source: mmap.mmap, source_fd: int, dest_fd: int, start: int, end: int
+) -> None:
+    """
+    Append a range of the source file to the destination file.
+
+    The data is copied by the kernel if the platform and the file systems support it.
+    """
+    offset = start
+    if hasattr(os, "copy_file_range"):
+        # not supported by all file systems (and between some file systems)
+        with contextlib.suppress(OSError):
+            while offset < end:
+                copied = os.copy_file_range(source_fd, dest_fd, end - offset, offset)
+                if not copied:
+                    break
+                offset += copied
+
+    if offset < end and sys.platform == "linux":
+        # only Linux supports regular files as destination of sendfile()
+        with contextlib.suppress(OSError):
+            while offset < end:
+                sent = os.sendfile(dest_fd, source_fd, offset, end - offset)
+                if not sent:
+                    break
+                offset += sent
+
+    with memoryview(source) as view:
+        while offset < end:
+            offset += os.write(
+                dest_fd, view[offset : min(end, offset + COPY_BUFFER_SIZE)]
+            )
+
+
+class WheelArchive:
+    """
+    Copies the members of a wheel that are stored without compression directly
+    from the wheel file instead of reading them through :mod:`zipfile`.
+    """
+
+    def __init__(self, path: Path, zip_file: zipfile.ZipFile) -> None:
+        self._zip_file = zip_file
+        self._file = path.open("rb")
+        self._mmap: mmap.mmap | None = None
+        # empty files cannot be mapped
+        with contextlib.suppress(OSError, ValueError):
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def copy_member(
+        self, stream: BinaryIO, dest: BinaryIO, hash_algorithm: str
+    ) -> tuple[str, int]:
+        """
+        Copy the member of the wheel that is read by the given stream
+        to the destination and return the hash and the size of its content.
+        """
+        data_range = self._stored_data_range(stream)
+        if data_range is None:
+            return _copyfileobj_with_hashing(stream, dest, hash_algorithm)
+
+        assert self._mmap is not None
+        info, start, end = data_range
+        hasher = hashlib.new(hash_algorithm)
+        crc = 0
+        with memoryview(self._mmap) as view:
+            for offset in range(start, end, COPY_BUFFER_SIZE):
+                chunk = view[offset : min(end, offset + COPY_BUFFER_SIZE)]
+                hasher.update(chunk)
+                crc = zlib.crc32(chunk, crc)
+                chunk.release()
+        if crc != info.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+
+        dest.flush()
+        _copy_range(self._mmap, self._file.fileno(), dest.fileno(), start, end)
+
+        return _encode_hash(hasher), info.file_size
+
+    def _stored_data_range(
+        self, stream: BinaryIO
+    ) -> tuple[zipfile.ZipInfo, int, int] | None:
+        if self._mmap is None or not isinstance(stream, zipfile.ZipExtFile):
+            return None
+
+        try:
+            info = self._zip_file.getinfo(stream.name)
+        except KeyError:
+            return None
+
+        # encrypted members are not supported by installer anyway
+        if (
+            info.compress_type != zipfile.ZIP_STORED
+            or info.flag_bits & 0x1
+            or not info.file_size
+        ):
+            return None
+
+        # The size of the extra field in the local file header
+        # may differ from the one in the central directory.
+        header = self._mmap[
+            info.header_offset : info.header_offset + _LOCAL_HEADER_SIZE
+        ]
+        if len(header) != _LOCAL_HEADER_SIZE:
+            return None
+        fields = _LOCAL_HEADER.unpack(header)
+        if fields[0] != _LOCAL_HEADER_SIGNATURE:
+            return None
+
+        # the header is followed by the file name and the extra field
+        start = info.header_offset + _LOCAL_HEADER_SIZE + fields[10] + fields[11]
+        end = start + info.file_size
+        if end > len(self._mmap):
+            return None
+
+        return info, start, end
+
+
+@dataclasses.dataclass
+class PendingCompilation:
+    """
+    Python source files of an installed wheel whose bytecode has not been compiled.
+    """
+
+    record_file: Path
+    # tuples of the path of a source file and its path in the RECORD file
+    sources: list[tuple[str, str]]
+
+
 class WheelDestination(SchemeDictionaryDestination):
     """ """
 
+    # If set, bytecode is not compiled when the installation is finalized
+    # but the source files are collected to be compiled later.
+    pending_compilations: list[PendingCompilation] | None = None
+    # If set, members are copied directly from the wheel file if possible.
+    archive: WheelArchive | None = None
+
     def write_to_fs(
         self,
         scheme: Scheme,
@@ -42,7 +237,6 @@ class WheelDestination(SchemeDictionaryDestination):
     ) -> RecordEntry:
         from installer.records import Hash
         from installer.records import RecordEntry
-        from installer.utils import copyfileobj_with_hashing
         from installer.utils import make_file_executable
 
         # See https://docs.python.org/3/library/zipfile.html#zipfile.Path:
@@ -77,13 +271,81 @@ class WheelDestination(SchemeDictionaryDestination):
             parent_folder.mkdir(parents=True, exist_ok=True)
 
         with target_path.open("wb") as f:
-            hash_, size = copyfileobj_with_hashing(stream, f, self.hash_algorithm)
+            if self.archive is not None:
+                hash_, size = self.archive.copy_member(stream, f, self.hash_algorithm)
+            else:
+                hash_, size = _copyfileobj_with_hashing(stream, f, self.hash_algorithm)
 
         if is_executable:
             make_file_executable(target_path)
 
         return RecordEntry(path, Hash(self.hash_algorithm, hash_), size)
 
+    def finalize_installation(
+        self,
+        scheme: Scheme,
+        record_file_path: str,
+        records: Iterable[tuple[Scheme, RecordEntry]],
+    ) -> None:
+        if self.pending_compilations is not None:
+            record_list = list(records)
+            super().finalize_installation(scheme, record_file_path, record_list)
+            self.pending_compilations.append(
+                self._pending_compilation(scheme, record_file_path, record_list)
+            )
+            return
+
+        if not self.bytecode_optimization_levels:
+            super().finalize_installation(scheme, record_file_path, records)
+            return
+
+        # bytecode is compiled when the installation is finalized
+        with profiling.phase("compile"):
+            super().finalize_installation(scheme, record_file_path, records)
+
+    def _pending_compilation(
+        self,
+        scheme: Scheme,
+        record_file_path: str,
+        records: list[tuple[Scheme, RecordEntry]],
+    ) -> PendingCompilation:
+        sources = []
+        for file_scheme, record in records:
+            if file_scheme not in ("purelib", "platlib") or not record.path.endswith(
+                ".py"
+            ):
+                continue
+
+            # paths in the RECORD file are relative to the scheme of the RECORD file
+            if file_scheme == scheme:
+                record_path = record.path
+            elif WINDOWS:
+                record_path = (
+                    os.path.abspath(self.scheme_dict[file_scheme]) + "/" + record.path
+                )
+            else:
+                record_path = posixpath.join(
+                    os.path.relpath(
+                        self.scheme_dict[file_scheme], start=self.scheme_dict[scheme]
+                    ),
+                    record.path,
+                )
+            sources.append(
+                (os.path.join(self.scheme_dict[file_scheme], record.path), record_path)
+            )
+
+        return PendingCompilation(
+            Path(self.scheme_dict[scheme]) / record_file_path, sources
+        )
+
+
+def _bytecode_record_path(record_path: str, optimization_level: int) -> str:
+    directory, name = posixpath.split(record_path)
+    bytecode_file = importlib.util.cache_from_source(
+        name, optimization="" if optimization_level <= 0 else optimization_level
+    )
+    return posixpath.join(directory, "__pycache__", os.path.basename(bytecode_file))
+
 
 class WheelInstaller:
     def __init__(self, env: Env) -> None:
@@ -100,13 +362,87 @@ class WheelInstaller:
         self._script_kind = script_kind
 
         self._bytecode_optimization_levels: Collection[int] = ()
+        self._pending_compilations: list[PendingCompilation] | None = None
         self.invalid_wheels: dict[Path, list[str]] = {}
 
-    def enable_bytecode_compilation(self, enable: bool = True) -> None:
+    def enable_bytecode_compilation(
+        self, enable: bool = True, defer: bool = False
+    ) -> None:
+        """
+        Compile the bytecode of installed Python source files.
+
+        :param defer: do not compile the bytecode while installing a wheel
+            but when calling :meth:`compile_bytecode`
+        """
         self._bytecode_optimization_levels = (-1,) if enable else ()
+        self._pending_compilations = [] if enable and defer else None
+
+    def compile_bytecode(self) -> None:
+        """
+        Compile the bytecode of all wheels that have been installed since
+        the last call in a process pool and add the compiled files to the
+        RECORD files of the wheels.
+
+        Does nothing unless compilation has been deferred.
+        """
+        if not self._pending_compilations:
+            return
+
+        pending, self._pending_compilations = self._pending_compilations, []
+        sources = [
+            source for compilation in pending for source, _ in compilation.sources
+        ]
+        if not sources:
+            return
+
+        import compileall
+
+        max_workers = min(os.cpu_count() or 1, len(sources))
+        chunksize = max(1, len(sources) // (max_workers * 4))
+        # Spawn the workers because forking a process with running threads
+        # (e.g. the workers of the executor) is not safe.
+        with (
+            profiling.phase("compile"),
+            ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor,
+        ):
+            results = [
+                list(
+                    executor.map(
+                        functools.partial(
+                            compileall.compile_file, quiet=1, optimize=level
+                        ),
+                        sources,
+                        chunksize=chunksize,
+                    )
+                )
+                for level in self._bytecode_optimization_levels
+            ]
+
+        compiled = iter(zip(*results))
+        for compilation in pending:
+            rows = []
+            for _, record_path in compilation.sources:
+                for level, success in zip(
+                    self._bytecode_optimization_levels, next(compiled)
+                ):
+                    if success:
+                        rows.append((_bytecode_record_path(record_path, level), "", ""))
+
+            if rows:
+                with compilation.record_file.open(
+                    "a", encoding="utf-8", newline=""
+                ) as f:
+                    csv.writer(f, lineterminator="\n").writerows(rows)
 
     def install(self, wheel: Path) -> None:
-        with WheelFile.open(wheel) as source:
+        with (
+            zipfile.ZipFile(wheel) as zip_file,
+            WheelArchive(wheel, zip_file) as archive,
+        ):
+            source = WheelFile(zip_file)
             try:
                 # Content validation is temporarily disabled because of
                 # pypa/installer's out of memory issues with big wheels. See
@@ -123,8 +459,14 @@ class WheelInstaller:
                 scheme_dict,
                 interpreter=str(self._env.python),
                 script_kind=self._script_kind,
-                bytecode_optimization_levels=self._bytecode_optimization_levels,
+                bytecode_optimization_levels=(
+                    ()
+                    if self._pending_compilations is not None
+                    else self._bytecode_optimization_levels
+                ),
             )
+            destination.pending_compilations = self._pending_compilations
+            destination.archive = archive
 
             install(
                 source=source,
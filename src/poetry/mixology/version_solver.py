@@ -21,6 +21,7 @@ from poetry.mixology.result import SolverResult
 from poetry.mixology.set_relation import SetRelation
 from poetry.mixology.term import Term
 from poetry.packages import PackageCollection
+from poetry.utils import profiling
 
 
 if TYPE_CHECKING:
@@ -200,8 +201,10 @@ class VersionSolver:
         try:
             next: str | None = self._root.name
             while next is not None:
-                self._propagate(next)
-                next = self._choose_package_version()
+                with profiling.phase("propagate"):
+                    self._propagate(next)
+                with profiling.phase("choose package version"):
+                    next = self._choose_package_version()
 
             return self._result()
         except Exception:
@@ -239,7 +242,8 @@ class VersionSolver:
                     # It also backjumps to a point in the solution
                     # where that incompatibility will allow us to derive new assignments
                     # that avoid the conflict.
-                    root_cause = self._resolve_conflict(incompatibility)
+                    with profiling.phase("resolve conflict"):
+                        root_cause = self._resolve_conflict(incompatibility)
 
                     # Back jumping erases all the assignments we did at the previous
                     # decision level, so we clear [changed] and refill it with the
@@ -309,6 +313,7 @@ class VersionSolver:
 
         adverb = "not " if unsatisfied.is_positive() else ""
         self._log(f"derived: {adverb}{unsatisfied.dependency}")
+        profiling.count("derivations")
 
         self._solution.derive(
             unsatisfied.dependency, not unsatisfied.is_positive(), incompatibility
@@ -330,6 +335,7 @@ class VersionSolver:
         https://github.com/dart-lang/pub/tree/master/doc/solver.md#conflict-resolution
         """
         self._log(f"conflict: {incompatibility}")
+        profiling.count("conflicts")
 
         new_incompatibility = False
         while not incompatibility.is_failure():
@@ -696,6 +702,7 @@ class VersionSolver:
 
         if not conflict:
             self._solution.decide(package.package)
+            profiling.count("decisions")
             self._log(
                 f"selecting {package.package.complete_name}"
                 f" ({package.package.full_pretty_version})"
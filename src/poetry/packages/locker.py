@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 import os
@@ -69,16 +70,30 @@ class Locker:
         "optional-dependencies",
     ]
 
-    def __init__(self, lock: Path, pyproject_data: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        lock: Path,
+        pyproject_data: dict[str, Any],
+        *,
+        cache_dir: Path | None = None,
+    ) -> None:
         self._lock = lock
         self._pyproject_data = pyproject_data
         self._lock_data: dict[str, Any] | None = None
         self._content_hash = self._get_content_hash()
+        self._cache_dir = cache_dir
 
     @property
     def lock(self) -> Path:
         return self._lock
 
+    @property
+    def content_hash(self) -> str:
+        """
+        The hash of the relevant content of the pyproject file.
+        """
+        return self._content_hash
+
     @property
     def lock_data(self) -> dict[str, Any]:
         if self._lock_data is None:
@@ -96,8 +111,7 @@ class Locker:
         """
         Checks whether the lock file is still up to date with the current hash.
         """
-        with self.lock.open("rb") as f:
-            lock = tomllib.load(f)
+        lock = self._read_lock_file()
         metadata = lock.get("metadata", {})
 
         if "content-hash" in metadata:
@@ -344,11 +358,10 @@ class Locker:
         if not self.lock.exists():
             raise RuntimeError("No lockfile found. Unable to read locked packages")
 
-        with self.lock.open("rb") as f:
-            try:
-                lock_data = tomllib.load(f)
-            except tomllib.TOMLDecodeError as e:
-                raise RuntimeError(f"Unable to read the lock file ({e}).")
+        try:
+            lock_data = self._read_lock_file()
+        except tomllib.TOMLDecodeError as e:
+            raise RuntimeError(f"Unable to read the lock file ({e}).")
 
         # if the lockfile doesn't contain a metadata section at all,
         # it probably needs to be rebuilt completely
@@ -384,6 +397,58 @@ class Locker:
 
         return lock_data
 
+    def _read_lock_file(self) -> dict[str, Any]:
+        """
+        Parses the lock file.
+
+        If a cache directory is configured, the parsed content is stored
+        as JSON in a sidecar file together with the hash of the lock file,
+        so that subsequent reads of an unchanged lock file can skip parsing.
+        """
+        content = self.lock.read_bytes()
+        if self._cache_dir is None:
+            return tomllib.loads(content.decode("utf-8"))
+
+        digest = sha256(content).hexdigest()
+        path_digest = sha256(str(self.lock.resolve()).encode()).hexdigest()
+        sidecar = self._cache_dir / f"{path_digest}.json"
+
+        try:
+            cached = json.loads(sidecar.read_bytes())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring invalid lock file cache %s: %s", sidecar, e)
+        else:
+            if (
+                isinstance(cached, dict)
+                and cached.get("digest") == digest
+                and isinstance(cached.get("data"), dict)
+            ):
+                return cast("dict[str, Any]", cached["data"])
+
+        lock_data = tomllib.loads(content.decode("utf-8"))
+
+        try:
+            serialized = json.dumps({"digest": digest, "data": lock_data})
+        except (TypeError, ValueError) as e:
+            # e.g. TOML datetimes cannot be represented in JSON
+            logger.debug("Unable to cache lock file %s: %s", self.lock, e)
+            return lock_data
+
+        tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(serialized, encoding="utf-8")
+            os.replace(tmp, sidecar)
+        except OSError as e:
+            logger.debug("Unable to write lock file cache %s: %s", sidecar, e)
+        finally:
+            with contextlib.suppress(OSError):
+                tmp.unlink(missing_ok=True)
+
+        return lock_data
+
     def _get_locked_package(
         self, info: dict[str, Any], with_dependencies: bool = True
     ) -> Package:
@@ -12,20 +12,10 @@ from pathlib import Path
 from site import addsitedir
 from typing import TYPE_CHECKING
 
-import tomlkit
-
-from poetry.core.packages.project_package import ProjectPackage
-
 from poetry.__version__ import __version__
-from poetry.installation import Installer
-from poetry.packages import Locker
 from poetry.plugins.application_plugin import ApplicationPlugin
 from poetry.plugins.plugin import Plugin
-from poetry.repositories.installed_repository import InstalledRepository
-from poetry.toml import TOMLFile
 from poetry.utils._compat import tomllib
-from poetry.utils.env import Env
-from poetry.utils.env import EnvManager
 
 
 if TYPE_CHECKING:
@@ -37,6 +27,7 @@ if TYPE_CHECKING:
     from poetry.core.packages.package import Package
 
     from poetry.poetry import Poetry
+    from poetry.utils.env import Env
 
 
 logger = logging.getLogger(__name__)
@@ -63,6 +54,8 @@ class PluginManager:
 
         plugin_path = pyproject_toml.parent / ProjectPluginCache.PATH
         if plugin_path.exists():
+            from poetry.utils.env import EnvManager
+
             # insert at the beginning to allow overriding dependencies
             EnvManager.get_system_env(naive=True).sys_path.insert(0, str(plugin_path))
             # process .pth files (among other things)
@@ -134,6 +127,8 @@ class ProjectPluginCache:
 
     def ensure_plugins(self) -> None:
         from poetry.factory import Factory
+        from poetry.repositories.installed_repository import InstalledRepository
+        from poetry.utils.env import EnvManager
 
         # parse project plugins
         plugins = []
@@ -267,6 +262,12 @@ class ProjectPluginCache:
         poetry_env: Env,
         installed_packages: Sequence[Package],
     ) -> None:
+        from poetry.core.packages.project_package import ProjectPackage
+
+        from poetry.installation import Installer
+        from poetry.packages import Locker
+        from poetry.repositories.installed_repository import InstalledRepository
+
         project = ProjectPackage(name="poetry-project-instance", version="0")
         project.python_versions = ".".join(str(v) for v in poetry_env.version_info[:3])
         # consider all packages in Poetry's environment pinned
@@ -296,6 +297,10 @@ class ProjectPluginCache:
             raise RuntimeError("Failed to install required Poetry plugins")
 
     def _write_config(self) -> None:
+        import tomlkit
+
+        from poetry.toml import TOMLFile
+
         self._ensure_cache_directory()
 
         document = tomlkit.document()
@@ -12,6 +12,7 @@ from poetry.pyproject.toml import PyProjectTOML
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from collections.abc import Mapping
     from pathlib import Path
 
@@ -40,13 +41,12 @@ class Poetry(BasePoetry):
         *,
         build_constraints: Mapping[NormalizedName, list[Dependency]] | None = None,
     ) -> None:
-        from poetry.repositories.repository_pool import RepositoryPool
-
         super().__init__(file, local_config, package, pyproject_type=PyProjectTOML)
 
         self._locker = locker
         self._config = config
-        self._pool = RepositoryPool(config=config)
+        self._pool: RepositoryPool | None = None
+        self._pool_factory: Callable[[], RepositoryPool] | None = None
         self._plugin_manager: PluginManager | None = None
         self._disable_cache = disable_cache
         self._build_constraints = build_constraints or {}
@@ -66,6 +66,15 @@ class Poetry(BasePoetry):
 
     @property
     def pool(self) -> RepositoryPool:
+        if self._pool is None:
+            if self._pool_factory is not None:
+                self._pool = self._pool_factory()
+                self._pool_factory = None
+            else:
+                from poetry.repositories.repository_pool import RepositoryPool
+
+                self._pool = RepositoryPool(config=self._config)
+
         return self._pool
 
     @property
@@ -87,6 +96,16 @@ class Poetry(BasePoetry):
 
     def set_pool(self, pool: RepositoryPool) -> Poetry:
         self._pool = pool
+        self._pool_factory = None
+
+        return self
+
+    def set_pool_factory(self, pool_factory: Callable[[], RepositoryPool]) -> Poetry:
+        """
+        Sets a callable that creates the pool when it is accessed for the first time.
+        """
+        self._pool = None
+        self._pool_factory = pool_factory
 
         return self
 
@@ -0,0 +1,113 @@
+"""
+Memoized marker operations for the hot paths of dependency resolution.
+
+Resolving a project with many environment markers calculates the same
+intersections, unions and inversions of structurally identical markers again
+and again. The functions in this module cache the results of these operations
+(keyed by marker equality) and intern the results, so that equal markers are
+represented by the same object. Interned markers are cheap to compare
+because dictionary lookups check identity before equality.
+
+All caches are bounded and evicted in least-recently-used order.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from poetry.core.packages.utils.utils import get_python_constraint_from_marker
+from poetry.core.version.markers import union as marker_union
+
+
+if TYPE_CHECKING:
+    from poetry.core.constraints.version import VersionConstraint
+    from poetry.core.version.markers import BaseMarker
+
+
+MARKER_CACHE_SIZE = 2**14
+
+
+@functools.lru_cache(maxsize=MARKER_CACHE_SIZE)
+def intern_marker(marker: BaseMarker) -> BaseMarker:
+    """
+    Return the canonical instance of all markers that are equal to the given one.
+    """
+    return marker
+
+
+@functools.lru_cache(maxsize=MARKER_CACHE_SIZE)
+def intersect(marker: BaseMarker, other: BaseMarker) -> BaseMarker:
+    return intern_marker(marker.intersect(other))
+
+
+@functools.lru_cache(maxsize=MARKER_CACHE_SIZE)
+def union(marker: BaseMarker, other: BaseMarker) -> BaseMarker:
+    return intern_marker(marker.union(other))
+
+
+@functools.lru_cache(maxsize=MARKER_CACHE_SIZE)
+def invert(marker: BaseMarker) -> BaseMarker:
+    return intern_marker(marker.invert())
+
+
+@functools.lru_cache(maxsize=MARKER_CACHE_SIZE)
+def union_all(*markers: BaseMarker) -> BaseMarker:
+    """
+    Return the normalized union of all given markers.
+    """
+    return intern_marker(marker_union(*markers))
+
+
+@functools.lru_cache(maxsize=MARKER_CACHE_SIZE)
+def get_python_constraint(marker: BaseMarker) -> VersionConstraint:
+    return get_python_constraint_from_marker(marker)
+
+
+@functools.lru_cache(maxsize=MARKER_CACHE_SIZE)
+def simplify_marker(
+    marker: BaseMarker, python_constraint: VersionConstraint
+) -> BaseMarker:
+    """
+    Remove constraints from markers that are covered by the projects Python constraint.
+    """
+    return intern_marker(marker.reduce_by_python_constraint(python_constraint))
+
+
+_CACHED_FUNCTIONS: dict[str, functools._lru_cache_wrapper[Any]] = {
+    "intern": intern_marker,
+    "intersect": intersect,
+    "union": union,
+    "invert": invert,
+    "union_all": union_all,
+    "python_constraint": get_python_constraint,
+    "simplify": simplify_marker,
+}
+
+
+def cache_info() -> dict[str, functools._CacheInfo]:
+    """
+    Return the statistics of the marker caches by operation.
+    """
+    return {name: func.cache_info() for name, func in _CACHED_FUNCTIONS.items()}
+
+
+def format_cache_info() -> str:
+    """
+    Return a one-line summary of the hit rates of the marker caches.
+    """
+    parts = []
+    for name, info in cache_info().items():
+        calls = info.hits + info.misses
+        if not calls:
+            continue
+        parts.append(f"{name} {info.hits}/{calls} ({info.hits / calls:.0%})")
+
+    return "Marker cache hits: " + (", ".join(parts) or "none")
+
+
+def cache_clear() -> None:
+    for func in _CACHED_FUNCTIONS.values():
+        func.cache_clear()
@@ -17,12 +17,11 @@ from cleo.ui.progress_indicator import ProgressIndicator
 from poetry.core.constraints.version import EmptyConstraint
 from poetry.core.constraints.version import Version
 from poetry.core.constraints.version import VersionRange
+from poetry.core.constraints.version import VersionUnion
 from poetry.core.packages.dependency import Dependency
 from poetry.core.packages.package import Package
-from poetry.core.packages.utils.utils import get_python_constraint_from_marker
 from poetry.core.version.markers import AnyMarker
 from poetry.core.version.markers import parse_marker
-from poetry.core.version.markers import union as marker_union
 
 from poetry.mixology.incompatibility import Incompatibility
 from poetry.mixology.incompatibility_cause import DependencyCauseError
@@ -32,7 +31,13 @@ from poetry.packages import DependencyPackage
 from poetry.packages.direct_origin import DirectOrigin
 from poetry.packages.package_collection import PackageCollection
 from poetry.puzzle.exceptions import OverrideNeededError
+from poetry.puzzle.markers import get_python_constraint
+from poetry.puzzle.markers import intersect
+from poetry.puzzle.markers import invert
+from poetry.puzzle.markers import union
+from poetry.puzzle.markers import union_all
 from poetry.repositories.repository_pool import Priority
+from poetry.utils import profiling
 
 
 if TYPE_CHECKING:
@@ -59,6 +64,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Above this number of markers, their union is built one after the other
+# instead of normalizing the union of all markers at once, see
+# Provider._merge_dependencies_by_constraint().
+_MAX_MARKERS_FOR_NORMALIZED_UNION = 8
+
+_PackageKey = tuple[str, str | None, str | None, str | None, str | None]
+_DependencyKey = tuple[Dependency, "BaseMarker", "BaseMarker"]
+
 
 # A package is sometimes required at conflicting versions under markers that are
 # mutually exclusive (e.g. one requirement applies only on Windows and the other
@@ -169,6 +182,14 @@ class Provider:
 
         self.get_package_from_pool = functools.cache(self._pool.package)
         self._refreshed: set[tuple[str, Version, str | None]] = set()
+        # Packages whose metadata has been prefetched already.
+        self._prefetched: set[tuple[str, Version, str | None]] = set()
+        # The dependencies of the package versions returned by
+        # incompatibilities_for(), which are used to coalesce incompatibilities
+        # of consecutive versions with the same dependencies.
+        self._dependencies_by_version: defaultdict[
+            _PackageKey, dict[Version, set[_DependencyKey]]
+        ] = defaultdict(dict)
 
     @property
     def pool(self) -> RepositoryPool:
@@ -217,7 +238,7 @@ class Provider:
     @functools.cached_property
     def _python_constraint(self) -> VersionConstraint:
         return self._package_python_constraint.intersect(
-            get_python_constraint_from_marker(self._overrides_marker_intersection)
+            get_python_constraint(self._overrides_marker_intersection)
         )
 
     def is_debugging(self) -> bool:
@@ -225,6 +246,7 @@ class Provider:
 
     def set_overrides(self, overrides: dict[Package, dict[str, Dependency]]) -> None:
         self._overrides = overrides
+        self._dependencies_by_version.clear()
         self.__dict__.pop("_python_constraint", None)
         self.__dict__.pop("_overrides_marker_intersection", None)
 
@@ -252,12 +274,14 @@ class Provider:
         self._package_python_constraint = Version.parse(
             env.marker_env["python_full_version"]
         ).stable
+        self._dependencies_by_version.clear()
 
         try:
             yield self
         finally:
             self._env = None
             self._package_python_constraint = original_python_constraint
+            self._dependencies_by_version.clear()
 
     @contextmanager
     def use_latest_for(self, names: Collection[NormalizedName]) -> Iterator[Provider]:
@@ -341,8 +365,19 @@ class Provider:
             packages = [direct_origin_package]
             return PackageCollection(dependency, packages)
 
-        packages = self._pool.find_packages(dependency)
+        with profiling.phase("find packages", subject=dependency.name):
+            packages = self._pool.find_packages(dependency)
+
+        self._sort_packages(packages, dependency)
+
+        return PackageCollection(dependency, packages)
 
+    @staticmethod
+    def _sort_packages(packages: list[Package], dependency: Dependency) -> None:
+        """
+        Sort the packages found for a dependency so that the package
+        that should be chosen first comes first.
+        """
         packages.sort(
             key=lambda p: (
                 not p.yanked,
@@ -352,8 +387,6 @@ class Provider:
             reverse=True,
         )
 
-        return PackageCollection(dependency, packages)
-
     def _search_for_vcs(self, dependency: VCSDependency) -> Package:
         """
         Search for the specifications that match the given VCS dependency.
@@ -458,7 +491,7 @@ class Provider:
             dependencies = package.requires
 
             if not package.python_constraint.allows_all(self._python_constraint):
-                transitive_python_constraint = get_python_constraint_from_marker(
+                transitive_python_constraint = get_python_constraint(
                     dependency_package.dependency.transitive_marker
                 )
                 intersection = package.python_constraint.intersect(
@@ -486,14 +519,69 @@ class Provider:
                         )
                     ]
 
+        dependencies = self._get_dependencies_with_overrides(dependencies, package)
+        if package.is_root() or package.is_direct_origin():
+            return [
+                Incompatibility(
+                    [Term(package.to_dependency(), True), Term(dep, False)],
+                    DependencyCauseError(),
+                )
+                for dep in dependencies
+            ]
+
         return [
             Incompatibility(
-                [Term(package.to_dependency(), True), Term(dep, False)],
-                DependencyCauseError(),
+                [Term(dependency, True), Term(dep, False)], DependencyCauseError()
             )
-            for dep in self._get_dependencies_with_overrides(dependencies, package)
+            for dependency, dep in self._coalesce_versions(package, dependencies)
         ]
 
+    def _coalesce_versions(
+        self, package: Package, dependencies: list[Dependency]
+    ) -> Iterator[tuple[Dependency, Dependency]]:
+        """
+        Yields the given dependencies of a package together with a dependency
+        on the package that covers all consecutive versions of the package
+        which have been seen before with the same dependency.
+
+        Only versions that have been returned by incompatibilities_for() before
+        are taken into account. Instead of a version range, the dependency on the
+        package is restricted to the exact versions because other versions
+        in such a range (e.g. yanked ones) might have different dependencies.
+        """
+        package_key = (
+            package.complete_name,
+            package.source_type,
+            package.source_url,
+            package.source_reference,
+            package.source_subdirectory,
+        )
+        dependencies_by_version = self._dependencies_by_version[package_key]
+        dependencies_by_version[package.version] = {
+            (dep, dep.marker, dep.transitive_marker) for dep in dependencies
+        }
+        versions = sorted(dependencies_by_version)
+        index = versions.index(package.version)
+
+        for dep in dependencies:
+            key = (dep, dep.marker, dep.transitive_marker)
+            lower = index
+            while lower > 0 and key in dependencies_by_version[versions[lower - 1]]:
+                lower -= 1
+            upper = index
+            while (
+                upper < len(versions) - 1
+                and key in dependencies_by_version[versions[upper + 1]]
+            ):
+                upper += 1
+
+            dependency = package.to_dependency()
+            if lower < upper:
+                dependency = dependency.with_constraint(
+                    VersionUnion.of(*versions[lower : upper + 1])
+                )
+            yield dependency, dep
+
     @staticmethod
     def _files_list_for_cmp(files: Sequence[PackageFile]) -> list[str]:
         """
@@ -518,23 +606,24 @@ class Provider:
         elif package.is_direct_origin():
             requires = package.requires
         else:
-            if (
-                package.pretty_name,
-                package.version,
-                dependency.source_name,
-            ) in self._refreshed:
-                # circumvent lru_cache to avoid unnecessary refresh
-                pool_package = self.pool.package(
-                    package.pretty_name,
-                    package.version,
-                    repository_name=dependency.source_name,
-                )
-            else:
-                pool_package = self.get_package_from_pool(
+            with profiling.phase("fetch package", subject=package.name):
+                if (
                     package.pretty_name,
                     package.version,
-                    repository_name=dependency.source_name,
-                )
+                    dependency.source_name,
+                ) in self._refreshed:
+                    # circumvent lru_cache to avoid unnecessary refresh
+                    pool_package = self.pool.package(
+                        package.pretty_name,
+                        package.version,
+                        repository_name=dependency.source_name,
+                    )
+                else:
+                    pool_package = self.get_package_from_pool(
+                        package.pretty_name,
+                        package.version,
+                        repository_name=dependency.source_name,
+                    )
             if package.files and self._files_list_for_cmp(
                 package.files
             ) != self._files_list_for_cmp(pool_package.files):
@@ -828,8 +917,53 @@ class Provider:
                 if dep.source_name:
                     self._explicit_sources[dep.name] = dep.source_name
 
+        self._prefetch_metadata(clean_dependencies)
+
         return dependency_package
 
+    def _prefetch_metadata(self, dependencies: Iterable[Dependency]) -> None:
+        """
+        Let the pool read the metadata of the packages that will be chosen first
+        for the given dependencies all at once.
+
+        The solver looks at the dependencies of these packages one after another
+        to decide which dependency to resolve next. If the metadata has to be read
+        from remote wheels, it is faster to read all of it concurrently in advance.
+        """
+        if not self._pool.can_prefetch_metadata():
+            return
+
+        packages: list[Package] = []
+        for dependency in dependencies:
+            if dependency.is_direct_origin() or dependency.name in (
+                self._direct_origin_packages
+            ):
+                continue
+            if dependency.source_name and not self._pool.has_repository(
+                dependency.source_name
+            ):
+                continue
+
+            # get_locked() might set the source of the dependency.
+            locked = self.get_locked(dependency.clone())
+            if locked is not None:
+                package = locked.package
+            else:
+                candidates = self._pool.find_packages(dependency)
+                if not candidates:
+                    continue
+                self._sort_packages(candidates, dependency)
+                package = candidates[0]
+
+            key = (package.name, package.version, package.source_reference)
+            if key not in self._prefetched:
+                self._prefetched.add(key)
+                packages.append(package)
+
+        if packages:
+            with profiling.phase("prefetch metadata"):
+                self._pool.prefetch_metadata(packages)
+
     def get_locked(self, dependency: Dependency) -> DependencyPackage | None:
         if dependency.name in self._use_latest:
             return None
@@ -978,9 +1112,15 @@ class Provider:
                 by_constraint[dep.constraint].append(dep)
             for deps in by_constraint.values():
                 dep = deps[0]
-                if len(deps) > 1:
-                    new_markers = (dep.marker for dep in deps)
-                    dep.marker = marker_union(*new_markers)
+                if len(deps) > _MAX_MARKERS_FOR_NORMALIZED_UNION:
+                    # Normalizing the union of many markers at once is
+                    # exponential in the number of markers.
+                    marker = dep.marker
+                    for other in deps[1:]:
+                        marker = union(marker, other.marker)
+                    dep.marker = marker
+                elif len(deps) > 1:
+                    dep.marker = union_all(*(dep.marker for dep in deps))
                 merged_dependencies.append(dep)
 
         return merged_dependencies
@@ -997,9 +1137,7 @@ class Provider:
         """
         return (
             not marker.is_empty()
-            and self._python_constraint.allows_any(
-                get_python_constraint_from_marker(marker)
-            )
+            and self._python_constraint.allows_any(get_python_constraint(marker))
             and (active_extras is None or marker.validate({"extra": active_extras}))
             and (not self._env or marker.validate(self._env.marker_env))
         )
@@ -1028,21 +1166,9 @@ class Provider:
         dependencies = self._merge_dependencies_by_constraint(dependencies)
 
         new_dependencies = []
-        for uses in itertools.product([True, False], repeat=len(dependencies)):
-            # intersection of markers
-            # For performance optimization, we don't just intersect all markers at once,
-            # but intersect them one after the other to get empty markers early.
-            # Further, we intersect the inverted markers at last because
-            # they are more likely to overlap than the non-inverted ones.
-            markers = (
-                dep.marker if use else dep.marker.invert()
-                for use, dep in sorted(
-                    zip(uses, dependencies), key=lambda ud: ud[0], reverse=True
-                )
-            )
-            used_marker_intersection: BaseMarker = AnyMarker()
-            for m in markers:
-                used_marker_intersection = used_marker_intersection.intersect(m)
+        for uses, used_marker_intersection in self._partition_markers(
+            [dep.marker for dep in dependencies]
+        ):
             if not self._is_relevant_marker(used_marker_intersection, active_extras):
                 continue
 
@@ -1101,6 +1227,50 @@ class Provider:
         # resolved, there might be new dependencies with the same constraint.
         return self._merge_dependencies_by_constraint(new_dependencies)
 
+    @staticmethod
+    def _partition_markers(
+        markers: list[BaseMarker],
+    ) -> list[tuple[tuple[bool, ...], BaseMarker]]:
+        """
+        Partition the marker space by the given markers.
+
+        Returns the non-empty intersections of all combinations of markers
+        and inverted markers together with the information which markers were
+        not inverted. The combinations are in the same order as with
+        ``itertools.product([True, False], repeat=len(markers))``.
+
+        Instead of intersecting all 2^n combinations, the cells of the partition
+        are split by one marker after the other, so that empty cells are pruned
+        early and the effort scales with the number of non-empty cells.
+        """
+        inverted_markers = [invert(marker) for marker in markers]
+        cells: list[tuple[tuple[bool, ...], BaseMarker]] = [((), AnyMarker())]
+        for marker, inverted_marker in zip(markers, inverted_markers):
+            new_cells = []
+            for uses, cell in cells:
+                for use, m in ((True, marker), (False, inverted_marker)):
+                    intersection = intersect(cell, m)
+                    if not intersection.is_empty():
+                        new_cells.append(((*uses, use), intersection))
+            cells = new_cells
+
+        partition = []
+        for uses, _ in cells:
+            # The representation of an intersection depends on the order of the
+            # operands. For stable results, the markers of a cell are intersected
+            # again with the inverted markers at last because they are more likely
+            # to overlap than the non-inverted ones.
+            marker_intersection: BaseMarker = AnyMarker()
+            for m in itertools.chain(
+                itertools.compress(markers, uses),
+                (m for m, use in zip(inverted_markers, uses) if not use),
+            ):
+                marker_intersection = intersect(marker_intersection, m)
+            if not marker_intersection.is_empty():
+                partition.append((uses, marker_intersection))
+
+        return partition
+
     def _marker_values(
         self, extras: Collection[NormalizedName] | None = None
     ) -> dict[str, Any]:
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import functools
 import time
 
 from collections import defaultdict
@@ -18,8 +17,13 @@ from poetry.mixology.failure import SolveFailureError
 from poetry.packages.transitive_package_info import TransitivePackageInfo
 from poetry.puzzle.exceptions import OverrideNeededError
 from poetry.puzzle.exceptions import SolverProblemError
+from poetry.puzzle.markers import format_cache_info
+from poetry.puzzle.markers import intersect
+from poetry.puzzle.markers import simplify_marker
+from poetry.puzzle.markers import union
 from poetry.puzzle.provider import Indicator
 from poetry.puzzle.provider import Provider
+from poetry.utils import profiling
 
 
 if TYPE_CHECKING:
@@ -29,6 +33,7 @@ if TYPE_CHECKING:
 
     from cleo.io.io import IO
     from packaging.utils import NormalizedName
+    from poetry.core.constraints.version import Version
     from poetry.core.constraints.version import VersionConstraint
     from poetry.core.packages.dependency import Dependency
     from poetry.core.packages.package import Package
@@ -40,6 +45,9 @@ if TYPE_CHECKING:
     from poetry.repositories import RepositoryPool
     from poetry.utils.env import Env
 
+    # (dependency, child_package, marker of the edge)
+    PackageEdge = tuple[Dependency, Package, BaseMarker]
+
     # markers[child_package][parent_package][groups] -> BaseMarker
     MarkerOriginDict = defaultdict[
         Package,
@@ -91,12 +99,14 @@ class Solver:
                 start = time.time()
                 packages = self._solve()
                 # simplify markers by removing redundant information
-                for transitive_info in packages.values():
-                    for group, marker in transitive_info.markers.items():
-                        transitive_info.markers[group] = simplify_marker(
-                            marker, self._package.python_constraint
-                        )
+                with profiling.phase("simplify markers"):
+                    for transitive_info in packages.values():
+                        for group, marker in transitive_info.markers.items():
+                            transitive_info.markers[group] = simplify_marker(
+                                marker, self._package.python_constraint
+                            )
                 end = time.time()
+                self._provider.debug(format_cache_info())
 
                 if len(self._overrides) > 1:
                     self._provider.debug(
@@ -177,7 +187,8 @@ class Solver:
             self._overrides.append(self._provider._overrides)
 
         try:
-            result = resolve_version(self._package, self._provider)
+            with profiling.phase("version solving"):
+                result = resolve_version(self._package, self._provider)
 
             packages = result.packages
         except OverrideNeededError as e:
@@ -185,7 +196,8 @@ class Solver:
         except SolveFailureError as e:
             raise SolverProblemError(e)
 
-        return self._aggregate_solved_packages(packages)
+        with profiling.phase("aggregate solved packages"):
+            return self._aggregate_solved_packages(packages)
 
     def _aggregate_solved_packages(
         self, packages: list[Package]
@@ -197,28 +209,30 @@ class Solver:
         calculate_markers(results, markers)
 
         # Merging feature packages with base packages
+        base_packages: dict[tuple[NormalizedName, Version], list[Package]] = (
+            defaultdict(list)
+        )
+        for package in packages:
+            if not package.features:
+                base_packages[package.name, package.version].append(package)
+
         solved_packages = {}
         for package in packages:
             if package.features:
-                for _package in packages:
-                    if (
-                        not _package.features
-                        and _package.name == package.name
-                        and _package.version == package.version
-                    ):
-                        for dep in package.requires:
-                            # Prevent adding base package as a dependency to itself
-                            if _package.name == dep.name:
-                                continue
-
-                            # Avoid duplication.
-                            if any(
-                                _dep == dep and _dep.marker == dep.marker
-                                for _dep in _package.requires
-                            ):
-                                continue
-
-                            _package.add_dependency(dep)
+                for _package in base_packages.get((package.name, package.version), []):
+                    for dep in package.requires:
+                        # Prevent adding base package as a dependency to itself
+                        if _package.name == dep.name:
+                            continue
+
+                        # Avoid duplication.
+                        if any(
+                            _dep == dep and _dep.marker == dep.marker
+                            for _dep in _package.requires
+                        ):
+                            continue
+
+                        _package.add_dependency(dep)
             else:
                 solved_packages[package] = results[package]
 
@@ -255,6 +269,7 @@ def depth_first_search(
     topo_sorted_nodes: list[PackageNode] = []
 
     dfs_visit(source, back_edges, visited, topo_sorted_nodes, markers)
+    topo_sorted_nodes.reverse()
 
     # Combine the nodes by name
     combined_nodes: dict[str, list[PackageNode]] = defaultdict(list)
@@ -291,11 +306,55 @@ def dfs_visit(
             if node.package.is_root()
             else out_neighbor.marker.without_extras()
         )
-        markers[out_neighbor.package][node.package][groups] = prev_marker.union(
-            new_marker
+        markers[out_neighbor.package][node.package][groups] = union(
+            prev_marker, new_marker
         )
         dfs_visit(out_neighbor, back_edges, visited, sorted_nodes, markers)
-    sorted_nodes.insert(0, node)
+    # nodes are collected in post-order, the caller reverses the list
+    sorted_nodes.append(node)
+
+
+class PackageGraph:
+    """
+    The dependency graph of the solved packages.
+
+    The packages are indexed by name and the edges of a package are only
+    calculated once, no matter how many nodes (i.e. paths) lead to the package.
+    """
+
+    def __init__(self, packages: list[Package]) -> None:
+        self._packages_by_name: dict[str, list[Package]] = defaultdict(list)
+        for package in packages:
+            self._packages_by_name[package.complete_name].append(package)
+        self._edges: dict[Package, list[PackageEdge]] = {}
+
+    def edges(self, package: Package) -> list[PackageEdge]:
+        """
+        Returns the dependencies of the given package together with
+        the packages satisfying them and the markers of the edges.
+        """
+        edges = self._edges.get(package)
+        if edges is not None:
+            return edges
+
+        edges = []
+        for dependency in package.all_requires:
+            for pkg in self._packages_by_name.get(dependency.complete_name, []):
+                if pkg.satisfies(dependency):
+                    marker = dependency.marker
+                    if package.is_root() and dependency.in_extras:
+                        marker = marker.intersect(
+                            parse_marker(
+                                " or ".join(
+                                    f'extra == "{extra}"'
+                                    for extra in dependency.in_extras
+                                )
+                            )
+                        )
+                    edges.append((dependency, pkg, marker))
+
+        self._edges[package] = edges
+        return edges
 
 
 class PackageNode(DFSNode):
@@ -317,9 +376,11 @@ class PackageNode(DFSNode):
         if not previous:
             self.groups: frozenset[NormalizedName] = frozenset()
             self.optional = True
+            self.graph = PackageGraph(packages)
         elif dep:
             self.groups = dep.groups
             self.optional = dep.is_optional()
+            self.graph = previous.graph
         else:
             raise ValueError("Both previous and dep must be passed")
 
@@ -331,34 +392,10 @@ class PackageNode(DFSNode):
         )
 
     def reachable(self) -> Sequence[PackageNode]:
-        children: list[PackageNode] = []
-
-        for dependency in self.package.all_requires:
-            for pkg in self.packages:
-                if pkg.complete_name == dependency.complete_name and pkg.satisfies(
-                    dependency
-                ):
-                    marker = dependency.marker
-                    if self.package.is_root() and dependency.in_extras:
-                        marker = marker.intersect(
-                            parse_marker(
-                                " or ".join(
-                                    f'extra == "{extra}"'
-                                    for extra in dependency.in_extras
-                                )
-                            )
-                        )
-                    children.append(
-                        PackageNode(
-                            pkg,
-                            self.packages,
-                            self,
-                            self.dep or dependency,
-                            marker,
-                        )
-                    )
-
-        return children
+        return [
+            PackageNode(pkg, self.packages, self, self.dep or dependency, marker)
+            for dependency, pkg, marker in self.graph.edges(self.package)
+        ]
 
     def visit(self, parents: list[PackageNode]) -> None:
         # The root package, which has no parents, is defined as having depth -1
@@ -425,10 +462,9 @@ def calculate_markers(
                             continue
                         for group in parent_info.groups:
                             for edge_marker in group_markers.values():
-                                transitive_marker[group] = transitive_marker[
-                                    group
-                                ].union(
-                                    parent_info.markers[group].intersect(edge_marker)
+                                transitive_marker[group] = union(
+                                    transitive_marker[group],
+                                    intersect(parent_info.markers[group], edge_marker),
                                 )
                     else:
                         # Parent is the root (no groups). Edge markers specify which
@@ -441,9 +477,9 @@ def calculate_markers(
                             )
                             for group in transitive_info.groups:
                                 if group in groups:
-                                    transitive_marker[group] = transitive_marker[
-                                        group
-                                    ].union(edge_marker)
+                                    transitive_marker[group] = union(
+                                        transitive_marker[group], edge_marker
+                                    )
                 transitive_info.markers = transitive_marker
 
 
@@ -463,7 +499,9 @@ def merge_override_packages(
         override_marker: BaseMarker = AnyMarker()
         for deps in override.values():
             for dep in deps.values():
-                override_marker = override_marker.intersect(dep.marker.without_extras())
+                override_marker = intersect(
+                    override_marker, dep.marker.without_extras()
+                )
         override_marker = simplify_marker(override_marker, python_constraint)
         for package, info in o_packages.items():
             for group, marker in info.markers.items():
@@ -494,20 +532,21 @@ def merge_override_packages(
             # we can use less expensive marker operations
             override_marker = EmptyMarker()
             for _, _, marker in package_duplicates:
-                override_marker = override_marker.union(marker)
+                override_marker = union(override_marker, marker)
             package_info.markers = {
-                group: override_marker.intersect(marker)
+                group: intersect(override_marker, marker)
                 for group, marker in package_info.markers.items()
             }
         else:
             # fallback / general algorithm with performance issues
             for group, marker in package_info.markers.items():
-                package_info.markers[group] = first_override_marker.intersect(marker)
+                package_info.markers[group] = intersect(first_override_marker, marker)
             for _, info, override_marker in remaining:
                 for group, marker in info.markers.items():
-                    package_info.markers[group] = package_info.markers.get(
-                        group, EmptyMarker()
-                    ).union(override_marker.intersect(marker))
+                    package_info.markers[group] = union(
+                        package_info.markers.get(group, EmptyMarker()),
+                        intersect(override_marker, marker),
+                    )
         for duplicate_package, _, _ in remaining:
             for dep in duplicate_package.requires:
                 if dep not in package.requires:
@@ -525,15 +564,3 @@ def remove_other_from_marker(marker: BaseMarker, other: BaseMarker) -> BaseMarke
     if isinstance(marker, MultiMarker) and other_markers.issubset(marker.markers):
         return MultiMarker.of(*(m for m in marker.markers if m not in other_markers))
     return marker
-
-
-@functools.cache
-def simplify_marker(
-    marker: BaseMarker, python_constraint: VersionConstraint
-) -> BaseMarker:
-    """
-    Remove constraints from markers that are covered by the projects Python constraint.
-
-    Use cache because we call this function often for the same markers.
-    """
-    return marker.reduce_by_python_constraint(python_constraint)
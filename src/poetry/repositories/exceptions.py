@@ -9,5 +9,9 @@ class PackageNotFoundError(Exception):
     pass
 
 
+class MetadataUnavailableError(Exception):
+    pass
+
+
 class InvalidSourceError(Exception):
     pass
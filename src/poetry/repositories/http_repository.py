@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import bisect
+import codecs
 import functools
 import hashlib
 
@@ -21,20 +23,29 @@ from packaging.metadata import parse_email
 from packaging.utils import canonicalize_name
 from poetry.core.constraints.version import Version
 from poetry.core.constraints.version import VersionConstraint
+from poetry.core.constraints.version import VersionRangeConstraint
+from poetry.core.constraints.version import VersionUnion
 from poetry.core.constraints.version import parse_marker_version_constraint
 from poetry.core.packages.dependency import Dependency
 from poetry.core.version.markers import parse_marker
+from requests.models import CONTENT_CHUNK_SIZE
 
 from poetry.config.config import Config
 from poetry.inspection.info import PackageInfo
 from poetry.inspection.lazy_wheel import LazyWheelUnsupportedError
 from poetry.inspection.lazy_wheel import metadata_from_wheel_url
+from poetry.inspection.lazy_wheel import metadata_from_wheel_urls
 from poetry.repositories.cached_repository import CachedRepository
+from poetry.repositories.exceptions import MetadataUnavailableError
 from poetry.repositories.exceptions import PackageNotFoundError
 from poetry.repositories.exceptions import RepositoryError
 from poetry.repositories.link_sources.html import HTMLPage
 from poetry.repositories.link_sources.json import SimpleJsonPage
+from poetry.utils import profiling
 from poetry.utils.authenticator import Authenticator
+from poetry.utils.cache import ArtifactCache
+from poetry.utils.cache import FileCache
+from poetry.utils.cache import MetadataCache
 from poetry.utils.constants import REQUESTS_TIMEOUT
 from poetry.utils.helpers import HTTPRangeRequestSupportedError
 from poetry.utils.helpers import download_file
@@ -46,6 +57,7 @@ if TYPE_CHECKING:
     from collections.abc import Iterable
     from collections.abc import Iterator
 
+    from packaging.metadata import RawMetadata
     from packaging.utils import NormalizedName
     from poetry.core.packages.package import Package
     from poetry.core.packages.package import PackageFile
@@ -55,6 +67,60 @@ if TYPE_CHECKING:
     from poetry.utils.authenticator import RepositoryCertificateConfig
 
 
+class _VersionIndex:
+    """
+    Sorted versions of a package together with the packages that have been
+    created for them, so that each constraint can be looked up by bisecting
+    instead of checking every version and packages are only created once.
+    """
+
+    def __init__(self, versions: Iterable[Version]) -> None:
+        self.versions = sorted(versions)
+        # None means that the version has been filtered out
+        self.packages: dict[Version, Package | None] = {}
+
+    def allowed_versions(self, constraint: VersionConstraint) -> Iterator[Version]:
+        if constraint.is_empty():
+            return
+
+        if not isinstance(constraint, (VersionRangeConstraint, VersionUnion)):
+            yield from filter(constraint.allows, self.versions)
+            return
+
+        # The ranges of a union are sorted and do not overlap,
+        # but their bounds might share versions.
+        end = 0
+        ranges = (
+            constraint.ranges if isinstance(constraint, VersionUnion) else [constraint]
+        )
+        for version_range in ranges:
+            start, range_end = self._bounds(version_range)
+            # Check the whole constraint because a union might allow more
+            # than its ranges, e.g. "!=1.0" allows "1.0.post1".
+            for version in self.versions[max(start, end) : range_end]:
+                if constraint.allows(version):
+                    yield version
+            end = max(end, range_end)
+
+    def _bounds(self, version_range: VersionRangeConstraint) -> tuple[int, int]:
+        start = 0
+        if version_range.min is not None:
+            start = bisect.bisect_left(self.versions, version_range.min)
+
+        end = len(self.versions)
+        if version_range.max is not None:
+            end = bisect.bisect_right(self.versions, version_range.max, lo=start)
+            # local versions of the upper bound may be allowed, too
+            while (
+                end < len(self.versions)
+                and self.versions[end].is_local()
+                and self.versions[end].without_local() == version_range.max
+            ):
+                end += 1
+
+        return start, end
+
+
 class HTTPRepository(CachedRepository):
     def __init__(
         self,
@@ -67,6 +133,7 @@ class HTTPRepository(CachedRepository):
     ) -> None:
         super().__init__(name, disable_cache=disable_cache, config=config)
         self._url = url
+        self._pool_size = pool_size
         if config is None:
             config = Config.create()
         self._authenticator = Authenticator(
@@ -76,9 +143,43 @@ class HTTPRepository(CachedRepository):
             pool_size=pool_size,
         )
         self._authenticator.add_repository(name, url)
-        self.get_page = functools.cache(self._get_page)
+        self._get_memoized_page = functools.cache(self._get_page_or_error)
         self._find_packages = functools.cache(self._find_packages_uncached)  # type: ignore[method-assign]
+        self._get_version_index = functools.cache(self._get_version_index_or_none)
 
+        self._metadata_cache = (
+            None
+            if disable_cache
+            else MetadataCache(cache_dir=config.metadata_cache_directory)
+        )
+        # Metadata that has been read from remote wheels via range requests
+        # is stored so that it does not have to be read again.
+        self._wheel_metadata_cache: FileCache[RawMetadata] | None = (
+            None
+            if disable_cache
+            else FileCache(path=config.metadata_cache_directory / "_wheels_")
+        )
+        # Metadata that has been read from remote wheels in advance,
+        # until the wheels are inspected.
+        self._prefetched_wheel_metadata: dict[
+            str, RawMetadata | LazyWheelUnsupportedError
+        ] = {}
+        # Distributions that have to be downloaded to inspect their metadata
+        # are stored in the artifact cache so that they can be reused
+        # when installing them.
+        self._artifact_cache = (
+            None
+            if disable_cache
+            else ArtifactCache(cache_dir=config.artifacts_cache_directory)
+        )
+        # Pages that do not exist (e.g. packages that are not provided by a private
+        # source) are remembered for the configured number of minutes.
+        self._missing_package_ttl = config.get("solver.missing-package-ttl", 0)
+        self._missing_pages: FileCache[bool] | None = (
+            FileCache(path=self._cache_dir / "_missing_")
+            if self._missing_package_ttl and not disable_cache
+            else None
+        )
         self._lazy_wheel = config.get("solver.lazy-wheel", True)
         self._max_retries = config.get("requests.max-retries", 0)
 
@@ -105,12 +206,8 @@ class HTTPRepository(CachedRepository):
             defaultdict(set)
         )
         # We are tracking if a domain supports range requests or not to avoid
-        # unnecessary requests.
-        # ATTENTION: A domain might support range requests only for some files, so the
-        # meaning is as follows:
-        # - Domain not in dict: We don't know anything.
-        # - True: The domain supports range requests for at least some files.
-        # - False: The domain does not support range requests for the files we tried.
+        # unnecessary requests. This is shared with the lazy wheels of this
+        # repository, see LazyWheelOverHTTP for the meaning of the values.
         self._supports_range_requests: dict[str, bool] = {}
 
     def _is_name_excluded_from_min_release_age(self, exclude_sources: set[str]) -> bool:
@@ -151,6 +248,16 @@ class HTTPRepository(CachedRepository):
         self, link: Link, *, raise_accepts_ranges: bool = False
     ) -> Iterator[Path]:
         self._log(f"Downloading: {link.url}", level="debug")
+        if self._artifact_cache is not None:
+            yield self._artifact_cache.get_cached_archive_for_link(
+                link,
+                strict=True,
+                download_func=functools.partial(
+                    self._download, raise_accepts_ranges=raise_accepts_ranges
+                ),
+            )
+            return
+
         with TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
             filepath = Path(temp_dir) / link.filename
             self._download(
@@ -179,60 +286,149 @@ class HTTPRepository(CachedRepository):
                 return True
         return False
 
+    def _get_version_index_or_none(self, name: NormalizedName) -> _VersionIndex | None:
+        try:
+            page = self.get_page(name)
+        except PackageNotFoundError:
+            return None
+
+        return _VersionIndex(page.versions(name))
+
     def _find_packages_uncached(
         self, name: NormalizedName, constraint: VersionConstraint
     ) -> list[Package]:
         """
         Find packages on the remote server.
         """
-        try:
-            page = self.get_page(name)
-        except PackageNotFoundError:
+        index = self._get_version_index(name)
+        if index is None:
             self._log(f"No packages found for {name}", level="debug")
             return []
 
-        versions = [
-            (version, page.yanked(name, version))
-            for version in page.versions(name)
-            if constraint.allows(version)
-        ]
+        packages: list[Package] = []
+        filtered_out: set[Version] = set()
+        for version in index.allowed_versions(constraint):
+            if version not in index.packages:
+                index.packages[version] = self._create_package(name, version)
+            package = index.packages[version]
+            if package is None:
+                filtered_out.add(version)
+            else:
+                packages.append(package)
+
+        if filtered_out:
+            self._age_filtered_versions[name] |= filtered_out
+            version_list = ", ".join(str(v) for v in sorted(filtered_out))
+            self._log(
+                f"Ignoring {name} version(s) due to "
+                f"solver.min-release-age={self._min_release_age}: {version_list}",
+                level="debug",
+            )
+
+        return packages
 
+    def _create_package(self, name: NormalizedName, version: Version) -> Package | None:
+        """
+        Create the package for the given version of a page
+        or return None if the version is too recent.
+        """
+        page = self.get_page(name)
         if (
             self._min_release_age_cutoff is not None
             and name not in self._min_release_age_exclude
+            and self._is_version_too_recent(page.links_for_version(name, version))
         ):
-            filtered_out: set[Version] = set()
-            accepted: list[tuple[Version, str | bool]] = []
-            for version, yanked in versions:
-                if self._is_version_too_recent(page.links_for_version(name, version)):
-                    filtered_out.add(version)
-                else:
-                    accepted.append((version, yanked))
-            if filtered_out:
-                self._age_filtered_versions[name] |= filtered_out
-                version_list = ", ".join(str(v) for v in sorted(filtered_out))
-                self._log(
-                    f"Ignoring {name} version(s) due to "
-                    f"solver.min-release-age={self._min_release_age}: {version_list}",
-                    level="debug",
-                )
-            versions = accepted
+            return None
+
+        return self._package(name, version, page.yanked(name, version))
+
+    def _get_wheel_metadata_cache_key(self, link: Link) -> str | None:
+        """
+        Return the key of the metadata of a wheel in the wheel metadata cache.
+
+        The key consists of the URL and the hash of the wheel. Wheels
+        without a hash are not cached because the file might change.
+        """
+        if self._wheel_metadata_cache is None or not link.hashes:
+            return None
+
+        hash_name = get_highest_priority_hash_type(link.hashes, link.filename)
+        if hash_name is None:
+            return None
+
+        return f"{link.url_without_fragment}#{hash_name}={link.hashes[hash_name]}"
+
+    def _get_cached_wheel_metadata(self, link: Link) -> RawMetadata | None:
+        cache_key = self._get_wheel_metadata_cache_key(link)
+        if cache_key is None:
+            return None
+
+        assert self._wheel_metadata_cache is not None
+        return self._wheel_metadata_cache.get(cache_key)
+
+    def _prefetch_wheel_metadata(self, links: Iterable[Link]) -> None:
+        """
+        Read the metadata of the given wheels via range requests concurrently.
+
+        The results are kept until the wheels are inspected by
+        _get_info_from_wheel(), which then does not have to wait for any requests.
+        Wheels whose metadata is cached or whose domain does not support
+        range requests are skipped.
+        """
+        if not self._lazy_wheel:
+            return
 
-        return [self._package(name, version, yanked) for version, yanked in versions]
+        wheels = {
+            link.url: link
+            for link in links
+            if link.url not in self._prefetched_wheel_metadata
+            and self._supports_range_requests.get(link.netloc, True)
+            and self._get_cached_wheel_metadata(link) is None
+        }
+        if not wheels:
+            return
+
+        self._log(
+            f"Reading metadata of {len(wheels)} wheel(s) via range requests",
+            level="debug",
+        )
+        self._prefetched_wheel_metadata.update(
+            metadata_from_wheel_urls(
+                [(link.filename, link.url) for link in wheels.values()],
+                self.session,
+                supports_range_requests=self._supports_range_requests,
+                max_workers=self._pool_size,
+            )
+        )
 
     def _get_info_from_wheel(self, link: Link) -> PackageInfo:
         from poetry.inspection.info import PackageInfo
 
         netloc = link.netloc
 
+        cached = self._get_cached_wheel_metadata(link)
+        if cached is not None:
+            profiling.count("metadata cache hits")
+            return PackageInfo.from_metadata(cached)
+
         # If "lazy-wheel" is enabled and the domain supports range requests
         # or we don't know yet, we try range requests.
         raise_accepts_ranges = self._lazy_wheel
         if self._lazy_wheel and self._supports_range_requests.get(netloc, True):
+            prefetched = self._prefetched_wheel_metadata.pop(link.url, None)
             try:
-                package_info = PackageInfo.from_metadata(
-                    metadata_from_wheel_url(link.filename, link.url, self.session)
-                )
+                if isinstance(prefetched, LazyWheelUnsupportedError):
+                    raise prefetched
+                if prefetched is None:
+                    metadata = metadata_from_wheel_url(
+                        link.filename,
+                        link.url,
+                        self.session,
+                        supports_range_requests=self._supports_range_requests,
+                    )
+                else:
+                    metadata = prefetched
+                package_info = PackageInfo.from_metadata(metadata)
             except LazyWheelUnsupportedError as e:
                 # Do not set to False if we already know that the domain supports
                 # range requests for some URLs!
@@ -244,6 +440,10 @@ class HTTPRepository(CachedRepository):
                 self._supports_range_requests.setdefault(netloc, False)
             else:
                 self._supports_range_requests[netloc] = True
+                cache_key = self._get_wheel_metadata_cache_key(link)
+                if cache_key is not None:
+                    assert self._wheel_metadata_cache is not None
+                    self._wheel_metadata_cache.put(cache_key, metadata)
                 return package_info
 
         try:
@@ -272,39 +472,89 @@ class HTTPRepository(CachedRepository):
     def _get_info_from_metadata(self, link: Link) -> PackageInfo | None:
         if link.has_metadata:
             try:
-                assert link.metadata_url is not None
-                response = self.session.get(link.metadata_url)
-                if link.metadata_hashes and (
-                    hash_name := get_highest_priority_hash_type(
-                        link.metadata_hashes, f"{link.filename}.metadata"
-                    )
-                ):
-                    metadata_hash = getattr(hashlib, hash_name)(
-                        response.content
-                    ).hexdigest()
-                    if metadata_hash != link.metadata_hashes[hash_name]:
-                        self._log(
-                            f"Metadata file hash ({metadata_hash}) does not match"
-                            f" expected hash ({link.metadata_hashes[hash_name]})."
-                            f" Metadata file for {link.filename} will be ignored.",
-                            level="warning",
-                        )
-                        return None
-
-                metadata, _ = parse_email(response.content)
-                return PackageInfo.from_metadata(metadata)
-
+                content = self._get_metadata_content(link)
             except requests.HTTPError:
                 self._log(
                     f"Failed to retrieve metadata at {link.metadata_url}",
                     level="warning",
                 )
+                return None
+
+            if content is not None:
+                metadata, _ = parse_email(content)
+                return PackageInfo.from_metadata(metadata)
 
         return None
 
-    def _get_info_from_links(
-        self, links: list[Link], *, ignore_yanked: bool
+    def _get_metadata_content(self, link: Link) -> bytes | None:
+        assert link.metadata_url is not None
+
+        hash_name = None
+        if link.metadata_hashes:
+            hash_name = get_highest_priority_hash_type(
+                link.metadata_hashes, f"{link.filename}.metadata"
+            )
+        if hash_name and self._metadata_cache is not None:
+            cached = self._metadata_cache.get(
+                hash_name, link.metadata_hashes[hash_name]
+            )
+            if cached is not None:
+                profiling.count("metadata cache hits")
+                return cached
+
+        with profiling.phase("http request"):
+            response = self.session.get(link.metadata_url)
+        self._profile_response(response)
+        if hash_name:
+            metadata_hash = getattr(hashlib, hash_name)(response.content).hexdigest()
+            if metadata_hash != link.metadata_hashes[hash_name]:
+                self._log(
+                    f"Metadata file hash ({metadata_hash}) does not match"
+                    f" expected hash ({link.metadata_hashes[hash_name]})."
+                    f" Metadata file for {link.filename} will be ignored.",
+                    level="warning",
+                )
+                return None
+
+            if self._metadata_cache is not None:
+                self._metadata_cache.put(hash_name, metadata_hash, response.content)
+
+        return response.content
+
+    def _get_info_from_link(
+        self, link: Link, *, metadata_only: bool = False
     ) -> PackageInfo:
+        """
+        Return the information of a distribution, preferably from its core metadata.
+
+        If ``metadata_only`` is set, the distribution is never downloaded.
+        Instead, a ``MetadataUnavailableError`` is raised
+        if its core metadata is not available.
+        """
+        info = self._get_info_from_metadata(link)
+        if info is not None:
+            return info
+
+        if metadata_only:
+            raise MetadataUnavailableError(
+                f"No core metadata available for {link.filename}"
+            )
+
+        if link.is_wheel:
+            return self._get_info_from_wheel(link)
+        return self._get_info_from_sdist(link)
+
+    @staticmethod
+    def _get_links_to_inspect(
+        links: Iterable[Link], *, ignore_yanked: bool
+    ) -> list[Link]:
+        """
+        Return the distributions whose metadata is used for the information
+        of a release.
+
+        This is a single distribution, preferably a wheel, or a python 2 and
+        a python 3 wheel whose metadata has to be combined.
+        """
         # Sort links by distribution type
         wheels: list[Link] = []
         sdists: list[Link] = []
@@ -355,92 +605,92 @@ class HTTPRepository(CachedRepository):
                     platform_specific_wheels.append(wheel)
 
             if universal_wheel is not None:
-                return self._get_info_from_metadata(
-                    universal_wheel
-                ) or self._get_info_from_wheel(universal_wheel)
+                return [universal_wheel]
 
-            info = None
             if universal_python2_wheel and universal_python3_wheel:
-                info = self._get_info_from_metadata(
-                    universal_python2_wheel
-                ) or self._get_info_from_wheel(universal_python2_wheel)
-
-                py3_info = self._get_info_from_metadata(
-                    universal_python3_wheel
-                ) or self._get_info_from_wheel(universal_python3_wheel)
-
-                if info.requires_python or py3_info.requires_python:
-                    info.requires_python = str(
-                        parse_marker_version_constraint(
-                            info.requires_python or "^2.7"
-                        ).union(
-                            parse_marker_version_constraint(
-                                py3_info.requires_python or "^3"
-                            )
-                        )
-                    )
-
-                if py3_info.requires_dist:
-                    if not info.requires_dist:
-                        info.requires_dist = py3_info.requires_dist
-
-                        return info
-
-                    py2_requires_dist = {
-                        Dependency.create_from_pep_508(r).to_pep_508()
-                        for r in info.requires_dist
-                    }
-                    py3_requires_dist = {
-                        Dependency.create_from_pep_508(r).to_pep_508()
-                        for r in py3_info.requires_dist
-                    }
-                    base_requires_dist = py2_requires_dist & py3_requires_dist
-                    py2_only_requires_dist = py2_requires_dist - py3_requires_dist
-                    py3_only_requires_dist = py3_requires_dist - py2_requires_dist
-
-                    # Normalizing requires_dist
-                    requires_dist = list(base_requires_dist)
-                    for requirement in py2_only_requires_dist:
-                        dep = Dependency.create_from_pep_508(requirement)
-                        dep.marker = dep.marker.intersect(
-                            parse_marker("python_version == '2.7'")
-                        )
-                        requires_dist.append(dep.to_pep_508())
-
-                    for requirement in py3_only_requires_dist:
-                        dep = Dependency.create_from_pep_508(requirement)
-                        dep.marker = dep.marker.intersect(
-                            parse_marker("python_version >= '3'")
-                        )
-                        requires_dist.append(dep.to_pep_508())
-
-                    info.requires_dist = sorted(set(requires_dist))
-
-            if info:
-                return info
+                return [universal_python2_wheel, universal_python3_wheel]
 
             # Prefer non platform specific wheels
             if universal_python3_wheel:
-                return self._get_info_from_metadata(
-                    universal_python3_wheel
-                ) or self._get_info_from_wheel(universal_python3_wheel)
+                return [universal_python3_wheel]
 
             if universal_python2_wheel:
-                return self._get_info_from_metadata(
-                    universal_python2_wheel
-                ) or self._get_info_from_wheel(universal_python2_wheel)
+                return [universal_python2_wheel]
 
             if platform_specific_wheels:
-                first_wheel = platform_specific_wheels[0]
-                return self._get_info_from_metadata(
-                    first_wheel
-                ) or self._get_info_from_wheel(first_wheel)
+                return platform_specific_wheels[:1]
+
+        return sdists[:1]
 
-        return self._get_info_from_metadata(sdists[0]) or self._get_info_from_sdist(
-            sdists[0]
+    def _get_info_from_links(
+        self, links: list[Link], *, ignore_yanked: bool, metadata_only: bool = False
+    ) -> PackageInfo:
+        links_to_inspect = self._get_links_to_inspect(
+            links, ignore_yanked=ignore_yanked
         )
+        if len(links_to_inspect) < 2:
+            return self._get_info_from_link(
+                links_to_inspect[0], metadata_only=metadata_only
+            )
 
-    def _links_to_data(self, links: list[Link], data: PackageInfo) -> dict[str, Any]:
+        # Both wheels have to be inspected, so their metadata is read concurrently.
+        if not metadata_only:
+            self._prefetch_wheel_metadata(
+                link for link in links_to_inspect if not link.has_metadata
+            )
+        info, py3_info = (
+            self._get_info_from_link(link, metadata_only=metadata_only)
+            for link in links_to_inspect
+        )
+
+        if (
+            info.requires_python or py3_info.requires_python
+        ) and info.requires_python != py3_info.requires_python:
+            info.requires_python = str(
+                parse_marker_version_constraint(info.requires_python or "^2.7").union(
+                    parse_marker_version_constraint(py3_info.requires_python or "^3")
+                )
+            )
+
+        if py3_info.requires_dist:
+            if not info.requires_dist:
+                info.requires_dist = py3_info.requires_dist
+
+                return info
+
+            py2_requires_dist = {
+                Dependency.create_from_pep_508(r).to_pep_508()
+                for r in info.requires_dist
+            }
+            py3_requires_dist = {
+                Dependency.create_from_pep_508(r).to_pep_508()
+                for r in py3_info.requires_dist
+            }
+            base_requires_dist = py2_requires_dist & py3_requires_dist
+            py2_only_requires_dist = py2_requires_dist - py3_requires_dist
+            py3_only_requires_dist = py3_requires_dist - py2_requires_dist
+
+            # Normalizing requires_dist
+            requires_dist = list(base_requires_dist)
+            for requirement in py2_only_requires_dist:
+                dep = Dependency.create_from_pep_508(requirement)
+                dep.marker = dep.marker.intersect(
+                    parse_marker("python_version == '2.7'")
+                )
+                requires_dist.append(dep.to_pep_508())
+
+            for requirement in py3_only_requires_dist:
+                dep = Dependency.create_from_pep_508(requirement)
+                dep.marker = dep.marker.intersect(parse_marker("python_version >= '3'"))
+                requires_dist.append(dep.to_pep_508())
+
+            info.requires_dist = sorted(set(requires_dist))
+
+        return info
+
+    def _links_to_data(
+        self, links: list[Link], data: PackageInfo, *, metadata_only: bool = False
+    ) -> dict[str, Any]:
         if not links:
             raise PackageNotFoundError(
                 f'No valid distribution links found for package: "{data.name}" version:'
@@ -497,7 +747,9 @@ class HTTPRepository(CachedRepository):
         data.files = files
 
         # drop yanked files unless the entire release is yanked
-        info = self._get_info_from_links(links, ignore_yanked=not data.yanked)
+        info = self._get_info_from_links(
+            links, ignore_yanked=not data.yanked, metadata_only=metadata_only
+        )
 
         data.summary = info.summary
         data.requires_dist = info.requires_dist
@@ -534,20 +786,40 @@ class HTTPRepository(CachedRepository):
         return None
 
     def _get_response(
-        self, endpoint: str, *, headers: dict[str, str] | None = None
+        self,
+        endpoint: str,
+        *,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
     ) -> requests.Response | None:
         url = self._url + endpoint
+        if self._missing_pages is not None and self._missing_pages.has(url):
+            self._log(f"Skipping {url}, which was not found recently", level="debug")
+            return None
+
         try:
-            response: requests.Response = self.session.get(
-                url, raise_for_status=False, timeout=REQUESTS_TIMEOUT, headers=headers
-            )
+            with profiling.phase("http request"):
+                response: requests.Response = self.session.get(
+                    url,
+                    raise_for_status=False,
+                    timeout=REQUESTS_TIMEOUT,
+                    headers=headers,
+                    stream=stream,
+                )
+            self._profile_response(response)
             if response.status_code in (401, 403):
                 self._log(
                     f"Authorization error accessing {url}",
                     level="warning",
                 )
+                response.close()
                 return None
             if response.status_code == 404:
+                response.close()
+                if self._missing_pages is not None:
+                    self._missing_pages.put(
+                        url, True, minutes=self._missing_package_ttl
+                    )
                 return None
             response.raise_for_status()
         except requests.exceptions.HTTPError as e:
@@ -560,6 +832,35 @@ class HTTPRepository(CachedRepository):
             )
         return response
 
+    @staticmethod
+    def _profile_response(response: requests.Response) -> None:
+        if not profiling.is_active():
+            return
+
+        profiling.count("http requests")
+        # for streamed responses, the content has not been read yet
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit():
+            profiling.count("http bytes", int(content_length))
+        if getattr(response, "from_cache", False):
+            profiling.count("http cache hits")
+
+    @staticmethod
+    def _iter_text(response: requests.Response) -> Iterator[str]:
+        """
+        Decode the content of a (streamed) response chunk by chunk
+        so that it can be parsed while it is being received.
+        """
+        # Guessing the encoding would require the whole content.
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(
+            errors="replace"
+        )
+        for chunk in response.iter_content(CONTENT_CHUNK_SIZE):
+            if text := decoder.decode(chunk):
+                yield text
+        if text := decoder.decode(b"", final=True):
+            yield text
+
     def _get_prefer_json_header(self) -> dict[str, str]:
         # Prefer json, but accept anything for backwards compatibility.
         # Although the more specific value should be preferred to the less specific one
@@ -573,15 +874,36 @@ class HTTPRepository(CachedRepository):
             == "application/vnd.pypi.simple.v1+json"
         )
 
+    def get_page(self, name: str) -> LinkSource:
+        """
+        Return the page of the given package.
+
+        Pages are memoized for the lifetime of the repository. This includes
+        packages that do not exist so that the repository is asked only once
+        for a package it does not provide.
+        """
+        page = self._get_memoized_page(name)
+        if isinstance(page, PackageNotFoundError):
+            raise PackageNotFoundError(*page.args)
+        return page
+
+    def _get_page_or_error(
+        self, name: NormalizedName
+    ) -> LinkSource | PackageNotFoundError:
+        try:
+            return self._get_page(name)
+        except PackageNotFoundError as e:
+            return e.with_traceback(None)
+
     def _get_page(self, name: NormalizedName) -> LinkSource:
         response = self._get_response(
-            f"/{name}/", headers=self._get_prefer_json_header()
+            f"/{name}/", headers=self._get_prefer_json_header(), stream=True
         )
         if not response:
             raise PackageNotFoundError(f"Package [{name}] not found.")
         if self._is_json_response(response):
             return SimpleJsonPage(response.url, response.json())
-        return HTMLPage(response.url, response.text)
+        return HTMLPage(response.url, self._iter_text(response))
 
     def log_age_filtered_versions(self, *, level: str, reset: bool) -> None:
         if not self._age_filtered_versions:
@@ -1,23 +1,30 @@
 from __future__ import annotations
 
-from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from typing import TYPE_CHECKING
 from typing import Any
 
+import requests
 import requests.adapters
 
 from poetry.core.packages.package import Package
 
+from poetry.console.exceptions import PoetryRuntimeError
 from poetry.inspection.info import PackageInfo
 from poetry.repositories.exceptions import PackageNotFoundError
+from poetry.repositories.exceptions import RepositoryError
 from poetry.repositories.http_repository import HTTPRepository
+from poetry.repositories.link_sources.base import PackageNameIndex
 from poetry.repositories.link_sources.base import SimpleRepositoryRootPage
 from poetry.repositories.link_sources.html import SimpleRepositoryHTMLRootPage
 from poetry.repositories.link_sources.json import SimpleRepositoryJsonRootPage
+from poetry.utils.cache import FileCache
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from packaging.utils import NormalizedName
     from poetry.core.constraints.version import Version
     from poetry.core.packages.utils.link import Link
@@ -26,6 +33,9 @@ if TYPE_CHECKING:
 
 
 class LegacyRepository(HTTPRepository):
+    # maximum number of project pages that are fetched for a search
+    SEARCH_LIMIT = 100
+
     def __init__(
         self,
         name: str,
@@ -45,6 +55,9 @@ class LegacyRepository(HTTPRepository):
             disable_cache=disable_cache,
             pool_size=pool_size,
         )
+        self._name_index_cache: FileCache[dict[str, Any]] | None = (
+            None if disable_cache else FileCache(path=self._cache_dir / "_index_")
+        )
 
     def package(self, name: str, version: Version) -> Package:
         """
@@ -78,6 +91,52 @@ class LegacyRepository(HTTPRepository):
 
         return list(page.links_for_version(package.name, package.version))
 
+    def prefetch_metadata(self, packages: Iterable[Package]) -> None:
+        """
+        Read the metadata of the given packages from their wheels all at once.
+
+        Without core metadata (PEP 658), the metadata of each package
+        is read from its wheel via several range requests, which would
+        otherwise happen one package after another when the packages
+        are retrieved. Packages whose release information is cached are skipped.
+
+        Prefetching is only an optimization: packages whose page cannot be
+        retrieved are skipped, so that errors are raised when the packages
+        are actually retrieved.
+        """
+        if not self._lazy_wheel:
+            return
+
+        links: list[Link] = []
+        for package in packages:
+            if (
+                not self._disable_cache
+                and self._release_cache.get(f"{package.name}:{package.version}")
+                is not None
+            ):
+                continue
+
+            try:
+                page = self.get_page(package.name)
+            except PackageNotFoundError:
+                continue
+            except (RepositoryError, PoetryRuntimeError) as e:
+                self._log(
+                    f"Not prefetching metadata of {package.name}: {e}", level="debug"
+                )
+                continue
+
+            links += (
+                link
+                for link in self._get_links_to_inspect(
+                    page.links_for_version(package.name, package.version),
+                    ignore_yanked=not page.yanked(package.name, package.version),
+                )
+                if link.is_wheel and not link.has_metadata
+            )
+
+        self._prefetch_wheel_metadata(links)
+
     def _package(
         self, name: NormalizedName, version: Version, yanked: str | bool
     ) -> Package:
@@ -115,7 +174,9 @@ class LegacyRepository(HTTPRepository):
     @cached_property
     def root_page(self) -> SimpleRepositoryRootPage:
         if not (
-            response := self._get_response("/", headers=self._get_prefer_json_header())
+            response := self._get_response(
+                "/", headers=self._get_prefer_json_header(), stream=True
+            )
         ):
             self._log(
                 f"Unable to retrieve package listing from package source {self.name}",
@@ -123,19 +184,74 @@ class LegacyRepository(HTTPRepository):
             )
             return SimpleRepositoryRootPage()
 
+        return self._root_page_from_response(response)
+
+    def _root_page_from_response(
+        self, response: requests.Response
+    ) -> SimpleRepositoryRootPage:
         if self._is_json_response(response):
             return SimpleRepositoryJsonRootPage(response.json())
 
-        return SimpleRepositoryHTMLRootPage(response.text)
+        return SimpleRepositoryHTMLRootPage(self._iter_text(response))
 
-    def search(self, query: str | list[str]) -> list[Package]:
-        results: list[Package] = []
+    @cached_property
+    def name_index(self) -> PackageNameIndex:
+        """
+        Index of the project names listed on the root page.
+
+        The index is persisted together with the ETag of the root page,
+        so that it only has to be rebuilt if the root page has changed.
+        """
+        cached = (
+            self._name_index_cache.get("root")
+            if self._name_index_cache is not None
+            else None
+        )
+        headers = self._get_prefer_json_header()
+        if cached and cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+
+        response = self._get_response("/", headers=headers, stream=True)
+        if not response:
+            self._log(
+                f"Unable to retrieve package listing from package source {self.name}",
+                level="error",
+            )
+            return PackageNameIndex.from_dict(cached) if cached else PackageNameIndex()
+
+        etag = response.headers.get("ETag")
+        if cached and (
+            response.status_code == 304 or (etag and etag == cached["etag"])
+        ):
+            response.close()
+            return PackageNameIndex.from_dict(cached)
+
+        index = self._root_page_from_response(response).index
+        if self._name_index_cache is not None:
+            self._name_index_cache.put("root", {"etag": etag, **index.to_dict()})
 
-        for candidate in self.root_page.search(query):
-            with suppress(PackageNotFoundError):
-                page = self.get_page(candidate)
+        return index
+
+    def search(self, query: str | list[str]) -> list[Package]:
+        candidates = self.name_index.search(query)
+        if len(candidates) > self.SEARCH_LIMIT:
+            self._log(
+                f"Found {len(candidates)} matching projects,"
+                f" only the first {self.SEARCH_LIMIT} are searched."
+                " Please refine your query.",
+                level="warning",
+            )
+            candidates = candidates[: self.SEARCH_LIMIT]
 
-                for package in page.packages:
-                    results.append(package)
+        def get_packages(name: str) -> list[Package]:
+            try:
+                return list(self.get_page(name).packages)
+            except PackageNotFoundError:
+                return []
 
-        return results
+        with ThreadPoolExecutor(max_workers=self._pool_size) as executor:
+            return [
+                package
+                for packages in executor.map(get_packages, candidates)
+                for package in packages
+            ]
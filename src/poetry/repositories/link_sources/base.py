@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import bisect
+import itertools
 import logging
 import re
 import urllib.parse
@@ -21,6 +23,7 @@ from poetry.utils.patterns import wheel_file_re
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Iterable
     from collections.abc import Iterator
 
     from packaging.utils import NormalizedName
@@ -181,21 +184,81 @@ class LinkSource:
         raise NotImplementedError
 
 
+class PackageNameIndex:
+    """
+    Index of the project names of a "simple" repository that supports
+    prefix and substring queries.
+
+    Queries are matched against normalized names, but the names are returned
+    as listed by the repository. The normalized names are kept in a sorted list
+    for prefix queries and joined into a single string so that substring queries
+    do not have to loop over all names in Python.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        entries = sorted({canonicalize_name(name): name for name in names}.items())
+        self._set_entries(
+            [name for name, _ in entries], [pretty for _, pretty in entries]
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, list[str]]) -> PackageNameIndex:
+        index = cls.__new__(cls)
+        index._set_entries(data["names"], data["pretty_names"])
+        return index
+
+    def to_dict(self) -> dict[str, list[str]]:
+        return {"names": self._names, "pretty_names": self._pretty_names}
+
+    def _set_entries(self, names: list[str], pretty_names: list[str]) -> None:
+        self._names = names
+        self._pretty_names = pretty_names
+        self._text = "\n".join(names)
+        self._offsets = [0, *itertools.accumulate(len(name) + 1 for name in names)]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def prefix(self, query: str) -> list[str]:
+        query = canonicalize_name(query)
+        start = end = bisect.bisect_left(self._names, query)
+        while end < len(self._names) and self._names[end].startswith(query):
+            end += 1
+
+        return self._pretty_names[start:end]
+
+    def search(self, query: str | list[str]) -> list[str]:
+        tokens = [query] if isinstance(query, str) else query
+        indices: set[int] = set()
+        for token in tokens:
+            indices.update(self._find(canonicalize_name(token)))
+
+        return [self._pretty_names[i] for i in sorted(indices)]
+
+    def _find(self, token: str) -> Iterator[int]:
+        if not token:
+            yield from range(len(self._names))
+            return
+
+        pos = self._text.find(token)
+        while pos >= 0:
+            i = bisect.bisect_right(self._offsets, pos) - 1
+            yield i
+            # continue with the next name
+            pos = self._text.find(token, self._offsets[i + 1])
+
+
 class SimpleRepositoryRootPage:
     """
     This class represents the parsed content of a "simple" repository's root page.
     """
 
+    @cached_property
+    def index(self) -> PackageNameIndex:
+        return PackageNameIndex(self.package_names)
+
     def search(self, query: str | list[str]) -> list[str]:
-        if isinstance(query, str):
-            # performance shortcut
-            # We could also create a list from query and use the more general code below,
-            # but this is a common case that we can optimize for.
-            return [name for name in self.package_names if query in name]
-
-        return [
-            name for name in self.package_names if any(token in name for token in query)
-        ]
+        return self.index.search(query)
 
     @cached_property
     def package_names(self) -> list[str]:
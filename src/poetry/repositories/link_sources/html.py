@@ -10,10 +10,12 @@ from poetry.core.packages.utils.link import Link
 from poetry.repositories.link_sources.base import LinkSource
 from poetry.repositories.link_sources.base import SimpleRepositoryRootPage
 from poetry.repositories.link_sources.base import make_absolute_url
-from poetry.repositories.parsers.html_page_parser import HTMLPageParser
+from poetry.repositories.parsers.anchor_scanner import AnchorScanner
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from poetry.repositories.link_sources.base import LinkFactory
     from poetry.repositories.link_sources.base import LinkFactoryCache
 
@@ -23,14 +25,22 @@ def _const_factory(link: Link) -> LinkFactory:
     return lambda: link
 
 
+def _scan(content: str | Iterable[str]) -> AnchorScanner:
+    """Scan the given content, which may be passed in chunks."""
+    scanner = AnchorScanner()
+    for chunk in (content,) if isinstance(content, str) else content:
+        scanner.feed(chunk)
+    scanner.close()
+    return scanner
+
+
 class HTMLPage(LinkSource):
-    def __init__(self, url: str, content: str) -> None:
+    def __init__(self, url: str, content: str | Iterable[str]) -> None:
         super().__init__(url=url)
 
-        parser = HTMLPageParser()
-        parser.feed(content)
-        self._parsed = parser.anchors
-        self._base_url: str | None = parser.base_url
+        scanner = _scan(content)
+        self._parsed = scanner.anchors
+        self._base_url: str | None = scanner.base_url
 
     @cached_property
     def _link_factory_cache(self) -> LinkFactoryCache:
@@ -87,10 +97,8 @@ class SimpleRepositoryHTMLRootPage(SimpleRepositoryRootPage):
     See: https://peps.python.org/pep-0503/
     """
 
-    def __init__(self, content: str | None = None) -> None:
-        parser = HTMLPageParser()
-        parser.feed(content or "")
-        self._parsed = parser.anchors
+    def __init__(self, content: str | Iterable[str] | None = None) -> None:
+        self._parsed = _scan(content or "").anchors
 
     @cached_property
     def package_names(self) -> list[str]:
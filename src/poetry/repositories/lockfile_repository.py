@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from poetry.repositories import Repository
 
 
 if TYPE_CHECKING:
+    from packaging.utils import NormalizedName
+    from poetry.core.packages.dependency import Dependency
     from poetry.core.packages.package import Package
 
 
@@ -13,10 +16,62 @@ class LockfileRepository(Repository):
     """
     Special repository that distinguishes packages not only by name and version,
     but also by source type, url, etc.
+
+    In addition, it provides a forward and a reverse index of the dependency graph
+    of its packages, which is built on first use and reset whenever a package is
+    added.
     """
 
     def __init__(self) -> None:
         super().__init__("poetry-lockfile")
+        self._packages_by_name: dict[NormalizedName, list[Package]] | None = None
+        self._required_by: (
+            dict[NormalizedName, list[tuple[Package, Dependency]]] | None
+        ) = None
 
     def has_package(self, package: Package) -> bool:
         return any(p == package for p in self.packages)
+
+    def add_package(self, package: Package) -> None:
+        super().add_package(package)
+        self._packages_by_name = None
+        self._required_by = None
+
+    def packages_with_name(self, name: NormalizedName) -> list[Package]:
+        """
+        Returns all packages with the given name in the order they were added.
+        """
+        if self._packages_by_name is None:
+            self._build_index()
+            assert self._packages_by_name is not None
+
+        return self._packages_by_name.get(name, [])
+
+    def required_by(self, name: NormalizedName) -> list[tuple[Package, Dependency]]:
+        """
+        Returns all packages that depend on a package with the given name
+        together with the respective dependency.
+
+        If a package has several dependencies with the given name,
+        only the last one is taken into account.
+        """
+        if self._required_by is None:
+            self._build_index()
+            assert self._required_by is not None
+
+        return self._required_by.get(name, [])
+
+    def _build_index(self) -> None:
+        packages_by_name: defaultdict[NormalizedName, list[Package]] = defaultdict(list)
+        required_by: defaultdict[NormalizedName, list[tuple[Package, Dependency]]] = (
+            defaultdict(list)
+        )
+
+        for package in self.packages:
+            packages_by_name[package.name].append(package)
+            dependencies = {d.name: d for d in package.requires}
+            for name, dependency in dependencies.items():
+                required_by[name].append((package, dependency))
+
+        self._packages_by_name = dict(packages_by_name)
+        self._required_by = dict(required_by)
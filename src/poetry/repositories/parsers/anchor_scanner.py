@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import re
+
+from html import unescape
+
+
+# An anchor or base start tag. Quoted attribute values may contain ">".
+# If the closing ">" is missing, the tag is incomplete (or malformed).
+_TAG = re.compile(
+    r"""<!--|<(a|base)(?=[\s/>])((?:[^>"']+|"[^"]*"|'[^']*')*)(>)?""",
+    re.IGNORECASE,
+)
+_ATTRIBUTE = re.compile(r"""([^\s"'>/=]+)(\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?""")
+
+
+class AnchorScanner:
+    """
+    Incremental scanner for the anchors of a simple repository page.
+
+    This is a faster replacement for :class:`HTMLPageParser` that only
+    understands the subset of HTML used by simple repository pages (PEP 503).
+    Instead of tokenizing the whole document, it only looks at ``<a>`` and
+    ``<base>`` start tags and only keeps their ``href`` and ``data-*``
+    attributes. Content can be fed in chunks as it is received.
+    """
+
+    def __init__(self) -> None:
+        self.base_url: str | None = None
+        self.anchors: list[dict[str, str | None]] = []
+        self._buffer = ""
+
+    def feed(self, data: str) -> None:
+        buffer = self._buffer + data if self._buffer else data
+        pos = 0
+
+        for match in _TAG.finditer(buffer):
+            start = match.start()
+            if start < pos:
+                # inside a comment that has already been skipped
+                continue
+
+            tag = match.group(1)
+            if tag is None:
+                end = buffer.find("-->", match.end())
+                if end < 0:
+                    pos = start
+                    break
+                pos = end + 3
+                continue
+
+            if match.group(3) is None:
+                pos = start
+                break
+
+            pos = match.end()
+            attributes = self._parse_attributes(match.group(2))
+            if tag.lower() == "a":
+                self.anchors.append(attributes)
+            elif self.base_url is None and attributes.get("href") is not None:
+                self.base_url = attributes["href"]
+        else:
+            # keep a start tag that might be cut off at the end of the chunk
+            tail = buffer.rfind("<", pos)
+            pos = len(buffer) if tail < 0 else tail
+
+        self._buffer = buffer[pos:]
+
+    def close(self) -> None:
+        self._buffer = ""
+
+    @staticmethod
+    def _parse_attributes(text: str) -> dict[str, str | None]:
+        attributes: dict[str, str | None] = {}
+        for name, assignment, *values in _ATTRIBUTE.findall(text):
+            name = name.lower()
+            if name != "href" and not name.startswith("data-"):
+                continue
+
+            if not assignment:
+                # attribute without value, e.g. "data-yanked"
+                attributes[name] = None
+                continue
+
+            value = values[0] or values[1] or values[2]
+            attributes[name] = unescape(value) if "&" in value else value
+
+        return attributes
@@ -16,6 +16,7 @@ from poetry.core.packages.utils.link import Link
 from poetry.core.version.exceptions import InvalidVersionError
 from poetry.core.version.requirements import InvalidRequirementError
 
+from poetry.repositories.exceptions import MetadataUnavailableError
 from poetry.repositories.exceptions import PackageNotFoundError
 from poetry.repositories.http_repository import HTTPRepository
 from poetry.repositories.link_sources.json import SimpleJsonPage
@@ -132,6 +133,10 @@ class PyPiRepository(HTTPRepository):
     ) -> dict[str, Any]:
         from poetry.inspection.info import PackageInfo
 
+        release_info = self._get_release_info_from_core_metadata(name, version)
+        if release_info is not None:
+            return release_info
+
         self._log(f"Getting info for {name} ({version}) from PyPI", "debug")
 
         json_data = self._get(f"pypi/{name}/{version}/json")
@@ -192,6 +197,49 @@ class PyPiRepository(HTTPRepository):
 
         return data.asdict()
 
+    def _get_release_info_from_core_metadata(
+        self, name: NormalizedName, version: Version
+    ) -> dict[str, Any] | None:
+        """
+        Return the release information based on the links of the simple page
+        and the core metadata (PEP 658) of the relevant distributions.
+
+        In contrast to the JSON API, this requires only small and immutable
+        metadata files, which can be cached independently of the release.
+        If the core metadata is not available, None is returned.
+        If the package does not exist, a PackageNotFoundError is raised.
+        """
+        from poetry.inspection.info import PackageInfo
+
+        # If the package does not exist at all,
+        # there is no need to ask the JSON API for a release.
+        page = self.get_page(name)
+
+        links = list(page.links_for_version(name, version))
+        if not links or not all(link.hashes.get("sha256") for link in links):
+            # hashes would have to be calculated by downloading the files
+            return None
+
+        self._log(
+            f"Getting info for {name} ({version}) from PyPI core metadata", "debug"
+        )
+
+        data = PackageInfo(
+            name=name,
+            version=version.text,
+            summary="",
+            requires_dist=[],
+            requires_python=None,
+            files=[],
+            yanked=page.yanked(name, version),
+            cache_version=str(self.CACHE_VERSION),
+        )
+        try:
+            return self._links_to_data(links, data, metadata_only=True)
+        except (MetadataUnavailableError, PackageNotFoundError) as e:
+            self._log(f"{e}, falling back to JSON API", "debug")
+            return None
+
     def _get_page(self, name: NormalizedName) -> SimpleJsonPage:
         source = self._base_url + f"simple/{name}/"
         info = self.get_package_info(name)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import enum
+import functools
 
 from collections import OrderedDict
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import TYPE_CHECKING
+from typing import TypeVar
 
 from poetry.config.config import Config
 from poetry.repositories.abstract_repository import AbstractRepository
@@ -16,10 +20,15 @@ from poetry.utils.cache import ArtifactCache
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
     from poetry.core.constraints.version import Version
     from poetry.core.packages.dependency import Dependency
     from poetry.core.packages.package import Package
 
+T = TypeVar("T")
+
 
 class Priority(IntEnum):
     # The order of the members below dictates the actual priority. The first member has
@@ -53,6 +62,8 @@ class RepositoryPool(AbstractRepository):
         self._artifact_cache = ArtifactCache(
             cache_dir=(config or Config.create()).artifacts_cache_directory
         )
+        # created on demand by _query()
+        self._executor: ThreadPoolExecutor | None = None
 
     @staticmethod
     def from_packages(packages: list[Package], config: Config | None) -> RepositoryPool:
@@ -158,6 +169,9 @@ class RepositoryPool(AbstractRepository):
         if repository_name:
             return self.repository(repository_name).package(name, version)
 
+        # Repositories are asked one after another because the first one
+        # that provides the package wins. Asking all of them at once
+        # would fetch release information that is thrown away.
         for repo in self.repositories:
             try:
                 return repo.package(name, version)
@@ -170,13 +184,81 @@ class RepositoryPool(AbstractRepository):
         if repository_name:
             return self.repository(repository_name).find_packages(dependency)
 
+        primary_repositories, supplemental_repositories = self._searched_repositories()
         packages: list[Package] = []
-        for repo in self.repositories:
-            if packages and self.get_priority(repo.name) is Priority.SUPPLEMENTAL:
+        for result in self._query(
+            primary_repositories, lambda repo: repo.find_packages(dependency)
+        ):
+            packages += result()
+        for repo in supplemental_repositories:
+            if packages:
                 break
             packages += repo.find_packages(dependency)
         return packages
 
+    def _searched_repositories(self) -> tuple[list[Repository], list[Repository]]:
+        """
+        Returns the primary and the supplemental repositories in the pool,
+        each in the order they will be searched for packages.
+        """
+        primary_repositories: list[Repository] = []
+        supplemental_repositories: list[Repository] = []
+        for prio_repo in self._sorted_repositories:
+            if prio_repo.priority is Priority.PRIMARY:
+                primary_repositories.append(prio_repo.repository)
+            elif prio_repo.priority is Priority.SUPPLEMENTAL:
+                supplemental_repositories.append(prio_repo.repository)
+        return primary_repositories, supplemental_repositories
+
+    def _query(
+        self, repositories: list[Repository], query: Callable[[Repository], T]
+    ) -> list[Callable[[], T]]:
+        """
+        Queries the given repositories and returns callables that return the
+        respective result (or raise the respective exception) in the order of
+        the repositories.
+
+        If more than one of the repositories has to query a remote server,
+        all repositories are queried concurrently so that the slowest
+        repository determines the duration instead of the sum of all.
+        Otherwise, the repositories are only queried when the callables are called.
+        """
+        if sum(isinstance(repo, CachedRepository) for repo in repositories) < 2:
+            return [functools.partial(query, repo) for repo in repositories]
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(thread_name_prefix="repository-pool")
+        futures = [self._executor.submit(query, repo) for repo in repositories]
+
+        return [future.result for future in futures]
+
+    def can_prefetch_metadata(self) -> bool:
+        """
+        Returns whether any repository in the pool supports prefetch_metadata().
+        """
+        from poetry.repositories.legacy_repository import LegacyRepository
+
+        return any(isinstance(repo, LegacyRepository) for repo in self.all_repositories)
+
+    def prefetch_metadata(self, packages: Iterable[Package]) -> None:
+        """
+        Lets the repositories of the given packages read their metadata
+        all at once if they support it.
+        """
+        from poetry.repositories.legacy_repository import LegacyRepository
+
+        packages_by_repository: defaultdict[str, list[Package]] = defaultdict(list)
+        for package in packages:
+            if package.source_reference and self.has_repository(
+                package.source_reference
+            ):
+                packages_by_repository[package.source_reference].append(package)
+
+        for name, repository_packages in packages_by_repository.items():
+            repository = self.repository(name)
+            if isinstance(repository, LegacyRepository):
+                repository.prefetch_metadata(repository_packages)
+
     def search(self, query: str | list[str]) -> list[Package]:
         results: list[Package] = []
         for repo in self.repositories:
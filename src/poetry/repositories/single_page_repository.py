@@ -16,7 +16,7 @@ class SinglePageRepository(LegacyRepository):
         """
         Single page repositories only have one page irrespective of endpoint.
         """
-        response = self._get_response("")
+        response = self._get_response("", stream=True)
         if not response:
             raise PackageNotFoundError(f"Package [{name}] not found.")
-        return HTMLPage(response.url, response.text)
+        return HTMLPage(response.url, self._iter_text(response))
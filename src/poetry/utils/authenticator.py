@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import calendar
 import dataclasses
 import functools
 import logging
+import threading
 import time
 import urllib.parse
+import zlib
 
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_tz
 from os.path import commonprefix
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -17,6 +22,7 @@ import requests.auth
 import requests.exceptions
 
 from cachecontrol import CacheControlAdapter
+from cachecontrol.cache import SeparateBodyBaseCache
 from cachecontrol.caches import SeparateBodyFileCache
 from requests_toolbelt import user_agent
 
@@ -25,6 +31,7 @@ from poetry.config.config import Config
 from poetry.console.exceptions import ConsoleMessage
 from poetry.console.exceptions import PoetryRuntimeError
 from poetry.exceptions import PoetryError
+from poetry.utils.cache import mark_as_used
 from poetry.utils.constants import REQUESTS_TIMEOUT
 from poetry.utils.constants import RETRY_AFTER_HEADER
 from poetry.utils.constants import STATUS_FORCELIST
@@ -33,12 +40,160 @@ from poetry.utils.password_manager import PasswordManager
 
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from cleo.io.io import IO
+    from urllib3 import HTTPResponse
 
 
 logger = logging.getLogger(__name__)
 
 
+class UsageTrackingFileCache(SeparateBodyFileCache):
+    """
+    HTTP cache that marks responses as used when they are read,
+    so that the least recently used responses can be pruned.
+    """
+
+    def get(self, key: str) -> bytes | None:
+        value = super().get(key)
+        if value is not None:
+            mark_as_used(self._path(key))
+        return value
+
+    def _path(self, key: str) -> Path:
+        # cachecontrol keeps this layout stable for tools that read its caches
+        hashed = self.encode(key)
+        return Path(self.directory, *hashed[:5], hashed)
+
+
+class StaleCacheControlAdapter(CacheControlAdapter):
+    """
+    Cache control adapter that can answer GET requests from cached responses
+    which are no longer fresh according to their cache headers.
+
+    If ``max_stale`` is set, a cached response that is younger than
+    ``max_stale`` seconds is returned right away and revalidated in the
+    background. In ``offline`` mode, every cached response is returned
+    regardless of its age and requests that cannot be answered from the cache
+    fail instead of reaching the network.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        max_stale: int = 0,
+        offline: bool = False,
+        executor: ThreadPoolExecutor | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._max_stale = max_stale
+        self._offline = offline
+        self._executor = executor
+        self._revalidating: set[str] = set()
+        self._lock = threading.Lock()
+
+    def send(  # type: ignore[override]
+        self,
+        request: requests.PreparedRequest,
+        cacheable_methods: Collection[str] | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        if request.method == "GET":
+            cached_response = self._get_cached_response(request, **kwargs)
+            if cached_response is not None:
+                return self.build_response(request, cached_response, from_cache=True)
+
+        if self._offline:
+            raise PoetryRuntimeError(
+                f"Unable to {request.method} {request.url} in offline mode"
+                " because no cached response is available."
+            )
+
+        return super().send(request, cacheable_methods=cacheable_methods, **kwargs)
+
+    def _get_cached_response(
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> HTTPResponse | None:
+        try:
+            cached_response = self._load_cached_response(request)
+            if (
+                cached_response is None
+                or self._offline
+                or self._age(cached_response) >= self._max_stale
+            ):
+                return cached_response if self._offline else None
+
+            # Checking the freshness may drop the response from the cache,
+            # which is why it has been loaded beforehand.
+            if not self.controller.cached_request(request):
+                self._revalidate(request, **kwargs)
+        except zlib.error:
+            return None
+
+        return cached_response
+
+    def _load_cached_response(
+        self, request: requests.PreparedRequest
+    ) -> HTTPResponse | None:
+        # partial content is not cached
+        if "Range" in request.headers:
+            return None
+
+        assert request.url is not None
+        cache = self.controller.cache
+        cache_url = self.controller.cache_url(request.url)
+        cache_data = cache.get(cache_url)
+        if cache_data is None:
+            return None
+
+        body_file = (
+            cache.get_body(cache_url)
+            if isinstance(cache, SeparateBodyBaseCache)
+            else None
+        )
+        return self.controller.serializer.loads(request, cache_data, body_file)
+
+    @staticmethod
+    def _age(response: HTTPResponse) -> float:
+        date = parsedate_tz(response.headers.get("date", ""))
+        if date is None:
+            return float("inf")
+
+        return time.time() - calendar.timegm(date[:6])
+
+    def _revalidate(self, request: requests.PreparedRequest, **kwargs: Any) -> None:
+        assert request.url is not None
+        url = request.url
+        with self._lock:
+            if url in self._revalidating:
+                return
+            self._revalidating.add(url)
+
+        request = request.copy()
+        # bypass the cache lookup, but send conditional headers
+        request.headers["Cache-Control"] = "max-age=0"
+
+        def revalidate() -> None:
+            try:
+                response = super(StaleCacheControlAdapter, self).send(request, **kwargs)
+                # the response is only cached once its body has been read
+                response.content  # noqa: B018
+                response.close()
+            except (requests.RequestException, OSError) as e:
+                logger.debug("Failed to revalidate %s: %s", url, e)
+            finally:
+                with self._lock:
+                    self._revalidating.discard(url)
+
+        logger.debug("Serving stale response for %s while revalidating it", url)
+        if self._executor is None:
+            revalidate()
+        else:
+            self._executor.submit(revalidate)
+
+
 @dataclasses.dataclass(frozen=True)
 class RepositoryCertificateConfig:
     cert: Path | None = dataclasses.field(default=None)
@@ -120,7 +275,7 @@ class Authenticator:
         # Poetry >= 2.4: SeparateBodyCache -> directory "_http_"
         # See https://github.com/python-poetry/poetry/pull/10816 for details.
         self._cache_control = (
-            SeparateBodyFileCache(
+            UsageTrackingFileCache(
                 self._config.repository_cache_directory
                 / (cache_id or "_default_cache")
                 / "_http_"
@@ -134,18 +289,36 @@ class Authenticator:
         )
         self._pool_size = pool_size
         self._user_agent = user_agent("poetry", __version__)
+        self._offline = self._config.get("requests.offline", False)
+        # the setting is given in minutes
+        self._max_stale = self._config.get("requests.stale-while-revalidate", 0) * 60
+        self._revalidation_executor: ThreadPoolExecutor | None = None
 
     def create_session(self) -> requests.Session:
         session = requests.Session()
         session.headers["User-Agent"] = self._user_agent
 
-        if self._cache_control is None:
+        if self._cache_control is None and not self._offline:
             return session
 
-        adapter = CacheControlAdapter(
-            cache=self._cache_control,
-            pool_maxsize=self._pool_size,
-        )
+        adapter: CacheControlAdapter
+        if self._offline or self._max_stale:
+            if self._max_stale and self._revalidation_executor is None:
+                self._revalidation_executor = ThreadPoolExecutor(
+                    thread_name_prefix="poetry-revalidate"
+                )
+            adapter = StaleCacheControlAdapter(
+                cache=self._cache_control,
+                pool_maxsize=self._pool_size,
+                max_stale=self._max_stale,
+                offline=self._offline,
+                executor=self._revalidation_executor,
+            )
+        else:
+            adapter = CacheControlAdapter(
+                cache=self._cache_control,
+                pool_maxsize=self._pool_size,
+            )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -165,6 +338,10 @@ class Authenticator:
         return self._sessions_for_netloc[netloc]
 
     def close(self) -> None:
+        if self._revalidation_executor is not None:
+            self._revalidation_executor.shutdown(wait=True)
+            self._revalidation_executor = None
+
         for session in self._sessions_for_netloc.values():
             if session is not None:
                 session.close()
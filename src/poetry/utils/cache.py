@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import contextlib
 import dataclasses
 import hashlib
 import json
 import logging
+import os
 import shutil
 import threading
 import time
+import uuid
 
 from collections import defaultdict
 from pathlib import Path
@@ -33,6 +36,9 @@ if TYPE_CHECKING:
 
 # Used by FileCache for items that do not expire.
 MAX_DATE = 9999999999
+# The time of last use of cache entries is only updated
+# if it is older than this many seconds.
+MARK_AS_USED_INTERVAL = 24 * 60 * 60
 T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
@@ -47,6 +53,27 @@ def _expiration(minutes: int) -> int:
     return round(time.time()) + minutes * 60
 
 
+def mark_as_used(path: Path) -> None:
+    """
+    Update the modification time of a cache file that has been read.
+
+    The modification time is used as time of last use when pruning the caches
+    (see :class:`CacheManager`) because the access time is not updated
+    on file systems that are mounted with ``noatime``. In order to avoid
+    a metadata write on every read, the modification time is only updated
+    once per :data:`MARK_AS_USED_INTERVAL`.
+    """
+    try:
+        if time.time() - path.stat().st_mtime < MARK_AS_USED_INTERVAL:
+            return
+        os.utime(path)
+    except PermissionError:
+        # e.g. a read-only cache that is shared between users
+        pass
+    except OSError as e:
+        logger.debug("Unable to update modification time of %s: %s", path, e)
+
+
 _HASHES = {
     "md5": (hashlib.md5, 2),
     "sha1": (hashlib.sha1, 4),
@@ -168,6 +195,7 @@ class FileCache(Generic[T]):
             self.forget(key)
             return None
         else:
+            mark_as_used(path)
             return payload.data
 
     def _path(self, key: str) -> Path:
@@ -271,6 +299,8 @@ class ArtifactCache:
                     except BaseException:
                         cached_archive.unlink(missing_ok=True)
                         raise
+        elif cached_archive is not None:
+            mark_as_used(cached_archive)
 
         return cached_archive
 
@@ -279,7 +309,11 @@ class ArtifactCache:
     ) -> Path | None:
         cache_dir = self.get_cache_directory_for_git(url, reference, subdirectory)
 
-        return self._get_cached_archive(cache_dir, strict=False, env=env)
+        cached_archive = self._get_cached_archive(cache_dir, strict=False, env=env)
+        if cached_archive is not None:
+            mark_as_used(cached_archive)
+
+        return cached_archive
 
     def _get_cached_archive(
         self,
@@ -338,3 +372,189 @@ class ArtifactCache:
             paths += cache_dir.glob(f"*.{archive_type}")
 
         return paths
+
+
+class MetadataCache:
+    """
+    Content-addressed cache for core metadata files (PEP 658).
+
+    Files are stored under their hash so that they can be shared between
+    repositories and never become stale.
+
+    :param cache_dir: The path that the cache starts at.
+    """
+
+    def __init__(self, *, cache_dir: Path) -> None:
+        self._cache_dir = cache_dir
+
+    def get(self, hash_name: str, digest: str) -> bytes | None:
+        """
+        Return the cached file with the given hash or None if there is no
+        (valid) file in the cache.
+        """
+        path = self._path(hash_name, digest)
+        try:
+            content = path.read_bytes()
+        except OSError:
+            return None
+
+        if hashlib.new(hash_name, content).hexdigest() != digest:
+            logger.debug("Removing corrupt metadata cache file %s", path)
+            path.unlink(missing_ok=True)
+            return None
+
+        mark_as_used(path)
+        return content
+
+    def put(self, hash_name: str, digest: str, content: bytes) -> None:
+        """
+        Store a file, which must match the given hash, in the cache.
+        """
+        path = self._path(hash_name, digest)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug("Unable to write metadata cache file %s: %s", path, e)
+            tmp_path.unlink(missing_ok=True)
+
+    def _path(self, hash_name: str, digest: str) -> Path:
+        return self._cache_dir.joinpath(hash_name, digest[:2], digest[2:4], digest)
+
+
+@dataclasses.dataclass(frozen=True)
+class _CacheEntry:
+    paths: tuple[Path, ...]
+    size: int
+    last_used: float
+
+
+class CacheManager:
+    """
+    Size-bounded view on the repository caches and the caches
+    that are shared by all repositories.
+
+    Each file in the caches is an entry, except for the HTTP caches,
+    which store the headers and the body of a response in separate files
+    that are treated as a single entry. The modification time of an entry
+    is the time of its last use (see :func:`mark_as_used`), so that entries
+    can be removed in least recently used order.
+
+    :param repository_cache_dir: The directory of the repository caches.
+    :param artifacts_cache_dir: The directory of the artifact cache.
+    :param metadata_cache_dir: The directory of the metadata cache.
+    :param lock_cache_dir: The directory of the cache of parsed lock files.
+    :param latest_versions_cache_dir: The directory of the cache
+        of latest version lookups.
+    """
+
+    ARTIFACTS = "_artifacts_"
+    METADATA = "_metadata_"
+    LOCKS = "_locks_"
+    LATEST_VERSIONS = "_latest-versions_"
+
+    def __init__(
+        self,
+        *,
+        repository_cache_dir: Path,
+        artifacts_cache_dir: Path,
+        metadata_cache_dir: Path,
+        lock_cache_dir: Path,
+        latest_versions_cache_dir: Path,
+    ) -> None:
+        self._repository_cache_dir = repository_cache_dir
+        self._shared_caches = {
+            self.ARTIFACTS: artifacts_cache_dir,
+            self.METADATA: metadata_cache_dir,
+            self.LOCKS: lock_cache_dir,
+            self.LATEST_VERSIONS: latest_versions_cache_dir,
+        }
+
+    def usage(self) -> dict[str, int]:
+        """
+        Return the size in bytes of each repository cache and of the caches
+        that are shared by all repositories.
+        """
+        usage = {path.name: self._size(path) for path in self._repository_caches()}
+        for name, path in self._shared_caches.items():
+            usage[name] = self._size(path)
+        return usage
+
+    def prune(self, max_size: int) -> tuple[int, int]:
+        """
+        Remove the least recently used entries until the total size
+        of the caches does not exceed the given number of bytes.
+
+        :returns: The number of removed entries and the number of freed bytes.
+        """
+        roots = [*self._repository_caches(), *self._shared_caches.values()]
+        entries = sorted(
+            (entry for root in roots for entry in self._entries(root)),
+            key=lambda entry: entry.last_used,
+        )
+        total = sum(entry.size for entry in entries)
+        removed = freed = 0
+
+        for entry in entries:
+            if total <= max_size:
+                break
+
+            try:
+                for path in entry.paths:
+                    path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug("Unable to remove cache entry %s: %s", entry.paths[0], e)
+                continue
+
+            total -= entry.size
+            freed += entry.size
+            removed += 1
+
+        for root in roots:
+            self._remove_empty_directories(root)
+
+        return removed, freed
+
+    def _repository_caches(self) -> list[Path]:
+        if not self._repository_cache_dir.is_dir():
+            return []
+
+        return sorted(p for p in self._repository_cache_dir.iterdir() if p.is_dir())
+
+    def _size(self, root: Path) -> int:
+        return sum(entry.size for entry in self._entries(root))
+
+    @staticmethod
+    def _entries(root: Path) -> list[_CacheEntry]:
+        # The HTTP caches store the body of a response in "<key>.body"
+        # next to "<key>" and lock files for writing in "<file>.lock".
+        groups: defaultdict[str, list[tuple[Path, os.stat_result]]] = defaultdict(list)
+        for directory, _, files in os.walk(root):
+            for name in files:
+                path = Path(directory, name)
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                key = str(path).removesuffix(".lock").removesuffix(".body")
+                groups[key].append((path, stat))
+
+        return [
+            _CacheEntry(
+                paths=tuple(path for path, _ in files),
+                size=sum(stat.st_size for _, stat in files),
+                last_used=max(stat.st_mtime for _, stat in files),
+            )
+            for files in groups.values()
+        ]
+
+    @staticmethod
+    def _remove_empty_directories(root: Path) -> None:
+        for directory, _, _ in os.walk(root, topdown=False):
+            if directory == str(root):
+                continue
+            # fails if the directory is not empty
+            with contextlib.suppress(OSError):
+                os.rmdir(directory)
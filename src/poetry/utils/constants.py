@@ -6,6 +6,9 @@ import os
 # Name of Poetry's own system project used by `poetry self` commands.
 POETRY_SYSTEM_PROJECT_NAME = "poetry-instance"
 
+# Name of the dependency group for build constraints.
+CONSTRAINTS_GROUP_NAME = "constraints"
+
 # Timeout for HTTP requests using the requests library.
 REQUESTS_TIMEOUT = int(os.getenv("POETRY_REQUESTS_TIMEOUT", 15))
 
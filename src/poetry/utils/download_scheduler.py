@@ -0,0 +1,192 @@
+"""
+Coordination of the downloads of concurrent installer workers.
+
+Without coordination, each worker opens as many connections as it likes,
+which can trigger the rate limiting of a single host while other hosts
+are underused. The :class:`DownloadScheduler` limits the number of
+connections per host, hands out free connections fairly between downloads,
+optionally limits the total download rate and collects throughput
+statistics per host.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import threading
+import time
+
+from collections import Counter
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+
+@dataclasses.dataclass
+class HostStats:
+    requests: int = 0
+    bytes: int = 0
+    # time during which at least one connection to the host was open
+    busy_seconds: float = 0.0
+    # time that requests waited for a free connection
+    queue_seconds: float = 0.0
+    max_connections: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """
+        The average number of bytes per second while connected to the host.
+        """
+        if not self.busy_seconds:
+            return 0.0
+        return self.bytes / self.busy_seconds
+
+
+@dataclasses.dataclass(eq=False)
+class _Waiter:
+    owner: int
+    sequence: int
+
+
+@dataclasses.dataclass
+class _Host:
+    stats: HostStats = dataclasses.field(default_factory=HostStats)
+    active: int = 0
+    active_by_owner: Counter[int] = dataclasses.field(default_factory=Counter)
+    waiting: list[_Waiter] = dataclasses.field(default_factory=list)
+    busy_since: float = 0.0
+
+
+class DownloadLease:
+    """
+    A connection to a host that has been granted by a :class:`DownloadScheduler`.
+    """
+
+    def __init__(self, scheduler: DownloadScheduler, host: str, owner: int) -> None:
+        self._scheduler = scheduler
+        self._host = host
+        self._owner = owner
+        self._released = False
+
+    def consume(self, size: int) -> None:
+        """
+        Record that a number of bytes has been received over the connection.
+        Blocks if the download rate is limited and has been exceeded.
+        """
+        self._scheduler._consume(self._host, size)
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._scheduler._release(self._host, self._owner)
+
+
+class DownloadScheduler:
+    """
+    Schedules the connections of concurrent downloads.
+
+    If a host has no free connections, waiting requests are granted a connection
+    in the order of their arrival, but requests of downloads that hold fewer
+    connections to the host go first. Thus, each download gets a connection
+    before a segmented download gets another one.
+
+    :param max_connections_per_host: the maximum number of concurrent
+        connections to a host, unlimited if ``None``
+    :param max_rate: the maximum total download rate in bytes per second,
+        unlimited if ``None``
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int | None = None,
+        max_rate: int | None = None,
+    ) -> None:
+        self._max_connections_per_host = max_connections_per_host
+        self._max_rate = max_rate
+        self._condition = threading.Condition()
+        self._hosts: dict[str, _Host] = defaultdict(_Host)
+        self._sequence = itertools.count()
+        self._rate_lock = threading.Lock()
+        # token bucket of the rate limit, allows bursts of up to one second
+        self._tokens = float(max_rate or 0)
+        self._last_refill = time.monotonic()
+
+    @property
+    def host_stats(self) -> dict[str, HostStats]:
+        with self._condition:
+            return {
+                name: dataclasses.replace(host.stats)
+                for name, host in self._hosts.items()
+            }
+
+    def acquire(self, url: str, owner: object) -> DownloadLease:
+        """
+        Wait for a free connection to the host of the given URL.
+
+        :param owner: the download that requests the connection,
+            used to share the connections of a host fairly between downloads
+        """
+        name = urlsplit(url).netloc
+        owner_id = id(owner)
+        with self._condition:
+            host = self._hosts[name]
+            waiter = _Waiter(owner_id, next(self._sequence))
+            host.waiting.append(waiter)
+            start = time.monotonic()
+            while not self._may_connect(host, waiter):
+                self._condition.wait()
+            host.waiting.remove(waiter)
+
+            now = time.monotonic()
+            if not host.active:
+                host.busy_since = now
+            host.active += 1
+            host.active_by_owner[owner_id] += 1
+            host.stats.requests += 1
+            host.stats.queue_seconds += now - start
+            host.stats.max_connections = max(host.stats.max_connections, host.active)
+            # another waiter may be next in line now
+            self._condition.notify_all()
+
+        return DownloadLease(self, name, owner_id)
+
+    def _may_connect(self, host: _Host, waiter: _Waiter) -> bool:
+        if self._max_connections_per_host is None:
+            return True
+        if host.active >= self._max_connections_per_host:
+            return False
+        next_waiter = min(
+            host.waiting,
+            key=lambda w: (host.active_by_owner[w.owner], w.sequence),
+        )
+        return next_waiter is waiter
+
+    def _release(self, name: str, owner: int) -> None:
+        with self._condition:
+            host = self._hosts[name]
+            host.active -= 1
+            host.active_by_owner[owner] -= 1
+            if not host.active_by_owner[owner]:
+                del host.active_by_owner[owner]
+            if not host.active:
+                host.stats.busy_seconds += time.monotonic() - host.busy_since
+            self._condition.notify_all()
+
+    def _consume(self, name: str, size: int) -> None:
+        with self._condition:
+            self._hosts[name].stats.bytes += size
+
+        if self._max_rate is None:
+            return
+
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self._max_rate),
+                self._tokens + (now - self._last_refill) * self._max_rate,
+            )
+            self._last_refill = now
+            self._tokens -= size
+            delay = -self._tokens / self._max_rate if self._tokens < 0 else 0.0
+
+        if delay:
+            time.sleep(delay)
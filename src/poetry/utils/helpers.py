@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import dataclasses
 import hashlib
 import io
+import itertools
 import logging
 import os
 import shutil
@@ -20,11 +22,6 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import overload
 
-from requests.exceptions import ChunkedEncodingError
-from requests.exceptions import ConnectionError
-from requests.utils import atomic_open
-
-from poetry.utils.authenticator import get_default_authenticator
 from poetry.utils.constants import REQUESTS_TIMEOUT
 
 
@@ -32,6 +29,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from collections.abc import Collection
     from collections.abc import Iterator
+    from threading import Event
     from types import TracebackType
 
     from poetry.core.packages.package import Package
@@ -39,6 +37,8 @@ if TYPE_CHECKING:
     from requests import Session
 
     from poetry.utils.authenticator import Authenticator
+    from poetry.utils.download_scheduler import DownloadLease
+    from poetry.utils.download_scheduler import DownloadScheduler
 
 logger = logging.getLogger(__name__)
 prioritised_hash_types: tuple[str, ...] = tuple(
@@ -129,6 +129,10 @@ class HTTPRangeRequestSupportedError(Exception):
     """Raised when server unexpectedly supports byte ranges."""
 
 
+class HTTPRangeRequestIgnoredError(Exception):
+    """Raised when server responds to a range request with the whole file."""
+
+
 def download_file(
     url: str,
     dest: Path,
@@ -166,19 +170,96 @@ def download_file(
                     update_context(f"Downloading {url} {percent:3}%")
 
 
+# Files are only downloaded in segments if each segment is at least this big.
+DOWNLOAD_SEGMENT_MIN_SIZE = 8 * 1024 * 1024
+# Upper bound of the adaptive chunk size of segmented downloads.
+DOWNLOAD_MAX_CHUNK_SIZE = 1024 * 1024
+# The chunk size of segmented downloads is adapted so that
+# reading a chunk takes about this long (in seconds).
+DOWNLOAD_CHUNK_TARGET_TIME = 0.1
+
+
+@contextmanager
+def _try_lock_file(path: Path) -> Iterator[bool]:
+    """
+    Try to take an exclusive lock on the given file without waiting and
+    yield whether the lock has been taken. The lock is shared between processes.
+
+    The file is removed when the lock is released. A process that has been
+    waiting for it does not get the lock because the file has been replaced.
+    """
+    try:
+        f = path.open("a+b")
+    except OSError:
+        yield False
+        return
+
+    with f:
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            # the file may have been removed by the previous owner of the lock
+            locked = os.path.samestat(os.fstat(f.fileno()), path.stat())
+        except OSError:
+            locked = False
+
+        try:
+            yield locked
+        finally:
+            if locked:
+                with suppress(OSError):
+                    path.unlink()
+
+
+@dataclasses.dataclass
+class DownloadSegment:
+    start: int
+    # exclusive
+    end: int
+    # the next byte to download
+    position: int
+
+    @property
+    def remaining(self) -> int:
+        return self.end - self.position
+
+
 class Downloader:
+    """
+    Downloads a file and resumes the download after connection errors
+    if the server supports range requests.
+
+    Big files are downloaded with up to ``segments`` concurrent range requests.
+    Segments are written to a part file next to the destination that is locked
+    by the downloading process. If another process holds the lock,
+    a temporary file is used instead and the download cannot be resumed.
+    If a scheduler is given, each connection has to be granted by it.
+    """
+
     def __init__(
         self,
         url: str,
         dest: Path,
         session: Authenticator | Session | None = None,
         max_retries: int = 0,
+        segments: int = 1,
+        scheduler: DownloadScheduler | None = None,
     ):
+        from poetry.utils.authenticator import get_default_authenticator
+
         self._dest = dest
         self._max_retries = max_retries
+        self._segments = segments
+        self._scheduler = scheduler
         self._session = session or get_default_authenticator()
         self._url = url
-        self._response = self._get()
+        self._connect()
 
     @cached_property
     def accepts_ranges(self) -> bool:
@@ -192,10 +273,47 @@ class Downloader:
                 total_size = int(self._response.headers["Content-Length"])
         return total_size
 
-    def _get(self, start: int = 0) -> Response:
+    @property
+    def _part_file(self) -> Path:
+        return self._dest.with_name(f"{self._dest.name}.part")
+
+    @property
+    def _state_file(self) -> Path:
+        return self._dest.with_name(f"{self._dest.name}.part.json")
+
+    @property
+    def _lock_file(self) -> Path:
+        return self._dest.with_name(f"{self._dest.name}.part.lock")
+
+    def _connect(self) -> None:
+        # the connection of self._response
+        self._lease = self._acquire()
+        try:
+            self._response = self._get()
+        except BaseException:
+            self._release(self._lease)
+            raise
+
+    def _acquire(self) -> DownloadLease | None:
+        if self._scheduler is None:
+            return None
+        return self._scheduler.acquire(self._url, owner=self)
+
+    @staticmethod
+    def _release(lease: DownloadLease | None) -> None:
+        if lease is not None:
+            lease.release()
+
+    def _get(
+        self, start: int = 0, end: int | None = None, if_range: str | None = None
+    ) -> Response:
         headers = {"Accept-Encoding": "Identity"}
-        if start > 0:
+        if end is not None:
+            headers["Range"] = f"bytes={start}-{end - 1}"
+        elif start > 0:
             headers["Range"] = f"bytes={start}-"
+        if if_range is not None:
+            headers["If-Range"] = if_range
 
         response = self._session.get(
             self._url, stream=True, headers=headers, timeout=REQUESTS_TIMEOUT
@@ -208,6 +326,9 @@ class Downloader:
             raise
 
     def _iter_content_with_resume(self, chunk_size: int) -> Iterator[bytes]:
+        from requests.exceptions import ChunkedEncodingError
+        from requests.exceptions import ConnectionError
+
         fetched_size = 0
         retries = 0
         while True:
@@ -233,13 +354,258 @@ class Downloader:
                 break
 
     def download_with_progress(self, chunk_size: int = 1024) -> Iterator[int]:
+        segments = self._split(self.total_size) if self.accepts_ranges else []
+        if len(segments) > 1:
+            try:
+                yield from self._download_in_segments(segments, chunk_size)
+                return
+            except HTTPRangeRequestIgnoredError:
+                logger.debug(
+                    "%s does not support range requests, downloading it at once",
+                    self._url,
+                )
+                self._connect()
+
+        from requests.utils import atomic_open
+
         fetched_size = 0
-        with atomic_open(self._dest) as f:
-            for chunk in self._iter_content_with_resume(chunk_size=chunk_size):
-                if chunk:
-                    f.write(chunk)
-                    fetched_size += len(chunk)
-                    yield fetched_size
+        try:
+            with atomic_open(self._dest) as f:
+                for chunk in self._iter_content_with_resume(chunk_size=chunk_size):
+                    if chunk:
+                        if self._lease is not None:
+                            self._lease.consume(len(chunk))
+                        f.write(chunk)
+                        fetched_size += len(chunk)
+                        yield fetched_size
+        finally:
+            self._release(self._lease)
+
+    def _split(self, size: int) -> list[DownloadSegment]:
+        count = max(1, min(self._segments, size // DOWNLOAD_SEGMENT_MIN_SIZE))
+        bounds = [size * i // count for i in range(count + 1)]
+        return [
+            DownloadSegment(start, end, start)
+            for start, end in itertools.pairwise(bounds)
+        ]
+
+    def _download_in_segments(
+        self, segments: list[DownloadSegment], chunk_size: int
+    ) -> Iterator[int]:
+        """
+        Download the file with concurrent range requests into a preallocated
+        part file. The progress of the segments is stored in a state file
+        so that an interrupted download can be resumed by a later run.
+        """
+        validator = self._response.headers.get("ETag") or self._response.headers.get(
+            "Last-Modified"
+        )
+        # the first response is not needed anymore
+        self._response.close()
+        self._release(self._lease)
+
+        # weak validators are not allowed in If-Range headers
+        if_range = validator if validator and not validator.startswith("W/") else None
+
+        with _try_lock_file(self._lock_file) as locked:
+            if not locked:
+                logger.debug(
+                    "%s is downloaded by another process, using a temporary file",
+                    self._url,
+                )
+                fd, name = tempfile.mkstemp(
+                    dir=self._dest.parent, prefix=self._dest.name, suffix=".part"
+                )
+                os.close(fd)
+                part_file = Path(name)
+                try:
+                    yield from self._download_segments_to(
+                        part_file, segments, if_range, chunk_size, resumable=False
+                    )
+                finally:
+                    part_file.unlink(missing_ok=True)
+                return
+
+            # Without a validator, it is impossible to tell
+            # whether the part file belongs to the current file.
+            resumable = if_range is not None
+            if not resumable:
+                self._state_file.unlink(missing_ok=True)
+            try:
+                yield from self._download_segments_to(
+                    self._part_file, segments, if_range, chunk_size, resumable=resumable
+                )
+            except HTTPRangeRequestIgnoredError:
+                self._part_file.unlink(missing_ok=True)
+                self._state_file.unlink(missing_ok=True)
+                raise
+            finally:
+                if not resumable:
+                    self._part_file.unlink(missing_ok=True)
+            self._state_file.unlink(missing_ok=True)
+
+    def _download_segments_to(
+        self,
+        part_file: Path,
+        segments: list[DownloadSegment],
+        if_range: str | None,
+        chunk_size: int,
+        *,
+        resumable: bool,
+    ) -> Iterator[int]:
+        import json
+        import threading
+        import time
+
+        from concurrent.futures import FIRST_EXCEPTION
+        from concurrent.futures import ThreadPoolExecutor
+        from concurrent.futures import wait
+
+        state = {"url": self._url, "size": self.total_size, "validator": if_range}
+        resumed = self._load_segments(state) if resumable else None
+        if resumed is not None:
+            segments = resumed
+            logger.debug("Resuming the download of %s", self._url)
+        else:
+            with part_file.open("wb") as f:
+                try:
+                    os.posix_fallocate(f.fileno(), 0, self.total_size)
+                except (AttributeError, OSError):
+                    # not supported by the platform or the file system
+                    f.truncate(self.total_size)
+
+        def save_state() -> None:
+            if not resumable:
+                return
+            state["segments"] = [
+                [segment.start, segment.end, segment.position] for segment in segments
+            ]
+            self._state_file.write_text(json.dumps(state), encoding="utf-8")
+
+        stop = threading.Event()
+        pending = [segment for segment in segments if segment.remaining]
+        save_state()
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, len(pending))) as executor:
+                futures = [
+                    executor.submit(
+                        self._download_segment,
+                        part_file,
+                        segment,
+                        if_range,
+                        chunk_size,
+                        stop,
+                    )
+                    for segment in pending
+                ]
+                try:
+                    last_saved = time.monotonic()
+                    while True:
+                        done, not_done = wait(
+                            futures, timeout=0.1, return_when=FIRST_EXCEPTION
+                        )
+                        yield sum(
+                            segment.position - segment.start for segment in segments
+                        )
+
+                        for future in done:
+                            # raise the exceptions of failed segments
+                            future.result()
+                        if not not_done:
+                            break
+
+                        if time.monotonic() - last_saved > 1:
+                            save_state()
+                            last_saved = time.monotonic()
+                finally:
+                    stop.set()
+        finally:
+            # keep the progress for the next run
+            if any(segment.remaining for segment in segments):
+                save_state()
+
+        os.replace(part_file, self._dest)
+
+    def _load_segments(self, state: dict[str, Any]) -> list[DownloadSegment] | None:
+        import json
+
+        try:
+            saved_state = json.loads(self._state_file.read_text(encoding="utf-8"))
+            if any(saved_state[key] != value for key, value in state.items()):
+                return None
+            if self._part_file.stat().st_size != self.total_size:
+                return None
+            segments = [
+                DownloadSegment(*segment) for segment in saved_state["segments"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if any(
+            not segment.start <= segment.position <= segment.end for segment in segments
+        ):
+            return None
+
+        return segments
+
+    def _download_segment(
+        self,
+        part_file: Path,
+        segment: DownloadSegment,
+        if_range: str | None,
+        chunk_size: int,
+        stop: Event,
+    ) -> None:
+        import time
+
+        from requests.exceptions import ChunkedEncodingError
+        from requests.exceptions import ConnectionError
+        from urllib3.exceptions import HTTPError
+
+        lease = self._acquire()
+        retries = 0
+        try:
+            while segment.remaining and not stop.is_set():
+                response = self._get(segment.position, segment.end, if_range)
+                try:
+                    with response, part_file.open("r+b") as f:
+                        if response.status_code != 206:
+                            raise HTTPRangeRequestIgnoredError(
+                                f"{self._url} responded with status"
+                                f" {response.status_code} to a range request"
+                            )
+
+                        f.seek(segment.position)
+                        while segment.remaining and not stop.is_set():
+                            start = time.monotonic()
+                            chunk = response.raw.read(
+                                min(chunk_size, segment.remaining),
+                                decode_content=True,
+                            )
+                            if not chunk:
+                                raise ConnectionError(
+                                    f"Incomplete response for {self._url}"
+                                )
+                            if lease is not None:
+                                lease.consume(len(chunk))
+                            f.write(chunk)
+                            f.flush()
+                            segment.position += len(chunk)
+
+                            # adapt the chunk size to the throughput of the connection
+                            elapsed = time.monotonic() - start
+                            if elapsed < DOWNLOAD_CHUNK_TARGET_TIME / 2:
+                                chunk_size = min(
+                                    chunk_size * 2, DOWNLOAD_MAX_CHUNK_SIZE
+                                )
+                            elif elapsed > DOWNLOAD_CHUNK_TARGET_TIME * 2:
+                                chunk_size = max(chunk_size // 2, 1024)
+                except (ChunkedEncodingError, ConnectionError, HTTPError):
+                    if retries >= self._max_retries:
+                        raise
+                    retries += 1
+        finally:
+            self._release(lease)
 
 
 def get_package_version_display_string(
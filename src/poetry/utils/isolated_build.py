@@ -13,6 +13,7 @@ from build.env import IsolatedEnv as BaseIsolatedEnv
 from poetry.core.packages.dependency_group import DependencyGroup
 
 from poetry.utils._compat import decode
+from poetry.utils.constants import CONSTRAINTS_GROUP_NAME
 from poetry.utils.env import Env
 from poetry.utils.env import EnvManager
 from poetry.utils.env import ephemeral_environment
@@ -30,9 +31,6 @@ if TYPE_CHECKING:
     from poetry.repositories import RepositoryPool
 
 
-CONSTRAINTS_GROUP_NAME = "constraints"
-
-
 class IsolatedBuildBaseError(Exception): ...
 
 
@@ -0,0 +1,200 @@
+"""
+Lightweight instrumentation of dependency resolution.
+
+Hot paths report phases and counters via the module level functions
+:func:`phase` and :func:`count`. They do nothing unless a profiler
+has been activated with :func:`profile`, e.g. by
+``poetry debug resolve --profile``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import threading
+import time
+
+from collections import Counter
+from collections import defaultdict
+from contextlib import contextmanager
+from contextlib import nullcontext
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+
+
+@dataclasses.dataclass
+class PhaseStats:
+    count: int = 0
+    seconds: float = 0.0
+
+
+class Profiler:
+    """
+    Collects the wall time of phases, counters and the time spent per subject
+    (e.g. per package).
+
+    The times of nested phases are included in the time of the outer phase.
+    Nested phases without a subject are attributed to the subject of the
+    enclosing phase, but the time of a subject only includes its outermost phases.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._start = time.perf_counter()
+        self._end: float | None = None
+        self.phases: dict[str, PhaseStats] = defaultdict(PhaseStats)
+        self.counters: Counter[str] = Counter()
+        self.subjects: dict[str, float] = defaultdict(float)
+        self.subject_phases: dict[str, dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self._events: list[dict[str, Any]] = []
+
+    @property
+    def seconds(self) -> float:
+        end = self._end if self._end is not None else time.perf_counter()
+        return end - self._start
+
+    def stop(self) -> None:
+        self._end = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str, subject: str | None = None) -> Iterator[None]:
+        active_subjects: list[str] | None = getattr(self._local, "subjects", None)
+        if active_subjects is None:
+            active_subjects = self._local.subjects = []
+        outermost = False
+        if subject is None:
+            # nested phases without a subject belong to the enclosing subject
+            if active_subjects:
+                subject = active_subjects[-1]
+        elif subject not in active_subjects:
+            active_subjects.append(subject)
+            outermost = True
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if outermost:
+                active_subjects.pop()
+            self._record(
+                name,
+                start,
+                time.perf_counter() - start,
+                subject,
+                count_for_subject=outermost,
+            )
+
+    def record(
+        self, name: str, start: float, seconds: float, subject: str | None = None
+    ) -> None:
+        """
+        Record a phase that has been measured by the caller.
+
+        :param start: the start of the phase as returned by time.perf_counter()
+        """
+        self._record(name, start, seconds, subject, count_for_subject=True)
+
+    def _record(
+        self,
+        name: str,
+        start: float,
+        seconds: float,
+        subject: str | None,
+        *,
+        count_for_subject: bool,
+    ) -> None:
+        event = {
+            "name": subject or name,
+            "cat": name,
+            "ph": "X",
+            "ts": (start - self._start) * 1e6,
+            "dur": seconds * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        with self._lock:
+            stats = self.phases[name]
+            stats.count += 1
+            stats.seconds += seconds
+            if subject is not None:
+                self.subject_phases[subject][name] += seconds
+                if count_for_subject:
+                    self.subjects[subject] += seconds
+            self._events.append(event)
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+    def slowest_subjects(self, limit: int = 10) -> list[tuple[str, float]]:
+        return sorted(self.subjects.items(), key=lambda item: -item[1])[:limit]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "seconds": self.seconds,
+            "phases": {
+                name: dataclasses.asdict(stats) for name, stats in self.phases.items()
+            },
+            "counters": dict(self.counters),
+            "slowest": [
+                {
+                    "name": name,
+                    "seconds": seconds,
+                    "phases": dict(self.subject_phases[name]),
+                }
+                for name, seconds in self.slowest_subjects()
+            ],
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Return the recorded phases in the Trace Event Format,
+        which can be loaded into chrome://tracing or https://ui.perfetto.dev.
+        """
+        return {"traceEvents": list(self._events), "displayTimeUnit": "ms"}
+
+
+_profiler: Profiler | None = None
+
+
+@contextmanager
+def profile() -> Iterator[Profiler]:
+    """
+    Activate a new profiler for the duration of the context.
+    """
+    global _profiler
+
+    previous = _profiler
+    profiler = _profiler = Profiler()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        _profiler = previous
+
+
+def is_active() -> bool:
+    return _profiler is not None
+
+
+def phase(name: str, subject: str | None = None) -> AbstractContextManager[None]:
+    if _profiler is None:
+        return nullcontext()
+    return _profiler.phase(name, subject)
+
+
+def record(name: str, start: float, seconds: float, subject: str | None = None) -> None:
+    if _profiler is not None:
+        _profiler.record(name, start, seconds, subject)
+
+
+def count(name: str, value: int = 1) -> None:
+    if _profiler is not None:
+        _profiler.count(name, value)
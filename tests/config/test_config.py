@@ -64,12 +64,16 @@ def test_package_filter_policy_normalizes_and_matches_packages() -> None:
 @pytest.mark.parametrize(
     ("name", "value"),
     [
+        ("cache-max-size", 0),
         ("installer.parallel", True),
         ("virtualenvs.create", True),
         ("requests.max-retries", 0),
+        ("requests.offline", False),
+        ("requests.stale-while-revalidate", 0),
         ("solver.min-release-age", 0),
         ("solver.min-release-age-exclude", None),
         ("solver.min-release-age-exclude-source", None),
+        ("solver.missing-package-ttl", 0),
     ],
 )
 def test_config_get_default_value(
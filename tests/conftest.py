@@ -104,16 +104,25 @@ def pytest_addoption(parser: Parser) -> None:
         default=False,
         help="enable integration tests",
     )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        dest="benchmark",
+        default=False,
+        help="enable benchmarks",
+    )
 
 
 def pytest_configure(config: PyTestConfig) -> None:
     config.addinivalue_line("markers", "integration: mark integration tests")
+    config.addinivalue_line("markers", "benchmark: mark benchmarks")
 
-    if not config.option.integration:
-        if config.option.markexpr:
-            config.option.markexpr += " and not integration"
-        else:
-            config.option.markexpr = "not integration"
+    for marker in ("integration", "benchmark"):
+        if not getattr(config.option, marker):
+            if config.option.markexpr:
+                config.option.markexpr += f" and not {marker}"
+            else:
+                config.option.markexpr = f"not {marker}"
 
 
 class Config(BaseConfig):
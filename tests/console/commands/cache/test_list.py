@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from cleo.testers.command_tester import CommandTester
 
     from poetry.utils.cache import FileCache
+    from tests.conftest import Config
     from tests.types import CommandTesterFactory
 
 
@@ -42,3 +43,30 @@ No caches found
 """
 
     assert tester.io.fetch_error() == expected
+
+
+def test_cache_list_usage(
+    tester: CommandTester,
+    caches: list[FileCache[dict[str, str]]],
+    repositories: list[str],
+    config: Config,
+) -> None:
+    config.merge({"cache-max-size": 100})
+    (config.artifacts_cache_directory / "ab").mkdir(parents=True)
+    (config.artifacts_cache_directory / "ab" / "demo-0.1.whl").write_bytes(b"x" * 2**20)
+
+    tester.execute("--usage")
+
+    width = max(len(repositories[0]), len("_latest-versions_"))
+    expected = f"""\
+{repositories[0]:{width}}  {0:10.1f} MiB
+{repositories[1]:{width}}  {0:10.1f} MiB
+{"_artifacts_":{width}}  {1:10.1f} MiB
+{"_metadata_":{width}}  {0:10.1f} MiB
+{"_locks_":{width}}  {0:10.1f} MiB
+{"_latest-versions_":{width}}  {0:10.1f} MiB
+{"Total":{width}}  {1:10.1f} MiB
+{"Limit":{width}}  {100:10.1f} MiB
+"""
+
+    assert tester.io.fetch_output() == expected
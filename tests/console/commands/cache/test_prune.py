@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cleo.testers.command_tester import CommandTester
+
+    from tests.conftest import Config
+    from tests.types import CommandTesterFactory
+
+
+@pytest.fixture
+def tester(command_tester_factory: CommandTesterFactory) -> CommandTester:
+    return command_tester_factory("cache prune")
+
+
+@pytest.fixture
+def artifacts(config: Config) -> list[Path]:
+    artifacts = []
+    for i in range(3):
+        path = config.artifacts_cache_directory / f"{i:02}" / f"demo-0.{i}.whl"
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"x" * 2**20)
+        os.utime(path, (i, i))
+        artifacts.append(path)
+
+    return artifacts
+
+
+def test_cache_prune(
+    tester: CommandTester, config: Config, artifacts: list[Path]
+) -> None:
+    config.merge({"cache-max-size": 2})
+
+    tester.execute()
+
+    assert tester.io.fetch_output() == "Removed 1 cache entries (1.0 MiB)\n"
+    assert [path.exists() for path in artifacts] == [False, True, True]
+
+
+def test_cache_prune_max_size_option(
+    tester: CommandTester, config: Config, artifacts: list[Path]
+) -> None:
+    config.merge({"cache-max-size": 2})
+
+    tester.execute("--max-size 1")
+
+    assert tester.io.fetch_output() == "Removed 2 cache entries (2.0 MiB)\n"
+    assert [path.exists() for path in artifacts] == [False, False, True]
+
+
+def test_cache_prune_within_limit(
+    tester: CommandTester, config: Config, artifacts: list[Path]
+) -> None:
+    config.merge({"cache-max-size": 3})
+
+    tester.execute()
+
+    assert tester.io.fetch_output() == "The caches already fit into the limit\n"
+    assert all(path.exists() for path in artifacts)
+
+
+def test_cache_prune_without_limit(
+    tester: CommandTester, artifacts: list[Path]
+) -> None:
+    tester.execute()
+
+    assert tester.io.fetch_output().startswith("The size of the caches is not limited.")
+    assert all(path.exists() for path in artifacts)
+
+
+def test_cache_prune_invalid_max_size(tester: CommandTester) -> None:
+    with pytest.raises(ValueError, match="--max-size must be a non-negative integer"):
+        tester.execute("--max-size foo")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from typing import TYPE_CHECKING
 
 import pytest
@@ -11,6 +13,8 @@ from tests.helpers import get_package
 
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from cleo.testers.command_tester import CommandTester
 
     from tests.helpers import DummyRepository
@@ -101,3 +105,67 @@ demo     0.1.2
 """
 
     assert tester.io.fetch_output() == expected
+
+
+def test_debug_resolve_profile(tester: CommandTester) -> None:
+    tester.execute("cachy --profile")
+
+    output = tester.io.fetch_output()
+    assert "Profile (" in output
+    assert "version solving" in output
+    assert "decisions" in output
+    assert "Slowest packages:" in output
+    assert output.endswith(
+        """\
+Resolution results:
+
+msgpack-python 0.5.3
+cachy          0.2.0
+"""
+    )
+
+
+@pytest.mark.parametrize("profile_format", ["json", "chrome"])
+def test_debug_resolve_profile_output(
+    tester: CommandTester, tmp_path: Path, profile_format: str
+) -> None:
+    output = tmp_path / "profile.json"
+
+    tester.execute(f"cachy --profile-output {output} --profile-format {profile_format}")
+
+    assert f"Wrote profile to {output}" in tester.io.fetch_output()
+    data = json.loads(output.read_text(encoding="utf-8"))
+    if profile_format == "json":
+        assert data["counters"]["decisions"] == 3
+        assert data["phases"]["version solving"]["count"] == 1
+    else:
+        assert {event["cat"] for event in data["traceEvents"]} >= {
+            "version solving",
+            "propagate",
+            "aggregate solved packages",
+        }
+
+
+def test_debug_resolve_profile_only_counts_marker_cache_usage_of_resolution(
+    tester: CommandTester, tmp_path: Path
+) -> None:
+    counters = []
+    for i in range(2):
+        output = tmp_path / f"profile{i}.json"
+        tester.execute(f"cachy --profile-output {output}")
+        counters.append(json.loads(output.read_text(encoding="utf-8"))["counters"])
+
+    first, second = (
+        (counter["marker cache hits"], counter["marker cache misses"])
+        for counter in counters
+    )
+    assert sum(first) > 0
+    # The second resolution does the same marker operations as the first one,
+    # but can use the results that have been cached by the first one.
+    assert sum(second) == sum(first)
+    assert second[0] >= first[0]
+
+
+def test_debug_resolve_profile_invalid_format(tester: CommandTester) -> None:
+    assert tester.execute("cachy --profile-format text") == 1
+    assert "Invalid profile format" in tester.io.fetch_error()
@@ -65,7 +65,12 @@ def test_list_displays_default_value_if_not_set(
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
     expected = f"""cache-dir = {cache_dir}
+cache-max-size = 0
 data-dir = {data_dir}
+installer.defer-compile = false
+installer.download-segments = 4
+installer.max-connections-per-host = 8
+installer.max-download-rate = null
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -74,10 +79,13 @@ installer.re-resolve = false
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+requests.offline = false
+requests.stale-while-revalidate = 0
 solver.lazy-wheel = true
 solver.min-release-age = 0
 solver.min-release-age-exclude = null
 solver.min-release-age-exclude-source = null
+solver.missing-package-ttl = 0
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
@@ -103,7 +111,12 @@ def test_list_displays_set_get_setting(
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
     expected = f"""cache-dir = {cache_dir}
+cache-max-size = 0
 data-dir = {data_dir}
+installer.defer-compile = false
+installer.download-segments = 4
+installer.max-connections-per-host = 8
+installer.max-download-rate = null
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -112,10 +125,13 @@ installer.re-resolve = false
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+requests.offline = false
+requests.stale-while-revalidate = 0
 solver.lazy-wheel = true
 solver.min-release-age = 0
 solver.min-release-age-exclude = null
 solver.min-release-age-exclude-source = null
+solver.missing-package-ttl = 0
 system-git-client = false
 virtualenvs.create = false
 virtualenvs.in-project = null
@@ -162,7 +178,12 @@ def test_unset_setting(
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
     expected = f"""cache-dir = {cache_dir}
+cache-max-size = 0
 data-dir = {data_dir}
+installer.defer-compile = false
+installer.download-segments = 4
+installer.max-connections-per-host = 8
+installer.max-download-rate = null
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -171,10 +192,13 @@ installer.re-resolve = false
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+requests.offline = false
+requests.stale-while-revalidate = 0
 solver.lazy-wheel = true
 solver.min-release-age = 0
 solver.min-release-age-exclude = null
 solver.min-release-age-exclude-source = null
+solver.missing-package-ttl = 0
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
@@ -199,7 +223,12 @@ def test_unset_repo_setting(
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
     expected = f"""cache-dir = {cache_dir}
+cache-max-size = 0
 data-dir = {data_dir}
+installer.defer-compile = false
+installer.download-segments = 4
+installer.max-connections-per-host = 8
+installer.max-download-rate = null
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -208,10 +237,13 @@ installer.re-resolve = false
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+requests.offline = false
+requests.stale-while-revalidate = 0
 solver.lazy-wheel = true
 solver.min-release-age = 0
 solver.min-release-age-exclude = null
 solver.min-release-age-exclude-source = null
+solver.missing-package-ttl = 0
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
@@ -383,7 +415,12 @@ def test_list_displays_set_get_local_setting(
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
     expected = f"""cache-dir = {cache_dir}
+cache-max-size = 0
 data-dir = {data_dir}
+installer.defer-compile = false
+installer.download-segments = 4
+installer.max-connections-per-host = 8
+installer.max-download-rate = null
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -392,10 +429,13 @@ installer.re-resolve = false
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+requests.offline = false
+requests.stale-while-revalidate = 0
 solver.lazy-wheel = true
 solver.min-release-age = 0
 solver.min-release-age-exclude = null
 solver.min-release-age-exclude-source = null
+solver.missing-package-ttl = 0
 system-git-client = false
 virtualenvs.create = false
 virtualenvs.in-project = null
@@ -429,7 +469,12 @@ def test_list_must_not_display_sources_from_pyproject_toml(
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
     expected = f"""cache-dir = {cache_dir}
+cache-max-size = 0
 data-dir = {data_dir}
+installer.defer-compile = false
+installer.download-segments = 4
+installer.max-connections-per-host = 8
+installer.max-download-rate = null
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -439,10 +484,13 @@ keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 repositories.foo.url = "https://foo.bar/simple/"
 requests.max-retries = 0
+requests.offline = false
+requests.stale-while-revalidate = 0
 solver.lazy-wheel = true
 solver.min-release-age = 0
 solver.min-release-age-exclude = null
 solver.min-release-age-exclude-source = null
+solver.missing-package-ttl = 0
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
@@ -197,7 +198,33 @@ def test_compile_option_is_passed_to_the_installer(
 
     tester.execute("--compile" if compile else "")
 
-    enable_bytecode_compilation_mock.assert_called_once_with(compile)
+    enable_bytecode_compilation_mock.assert_called_once_with(compile, defer=False)
+
+
+@pytest.mark.parametrize(
+    ("options", "enabled", "output"),
+    [
+        ("", False, None),
+        ("--timing", True, None),
+        ("--timing-output timing.json", False, Path("timing.json")),
+    ],
+)
+def test_timing_options_are_passed_to_the_executor(
+    tester: CommandTester,
+    mocker: MockerFixture,
+    options: str,
+    enabled: bool,
+    output: Path | None,
+) -> None:
+    assert isinstance(tester.command, InstallerCommand)
+    mocker.patch.object(tester.command.installer, "run", return_value=1)
+    enable_timing_mock = mocker.patch.object(
+        tester.command.installer.executor, "enable_timing"
+    )
+
+    tester.execute(options)
+
+    enable_timing_mock.assert_called_once_with(enabled, output)
 
 
 @pytest.mark.parametrize("skip_directory_cli_value", [True, False])
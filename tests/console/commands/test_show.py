@@ -13,6 +13,7 @@ import pytest
 from poetry.core.packages.dependency_group import MAIN_GROUP
 from poetry.core.packages.dependency_group import DependencyGroup
 
+from poetry.console.commands.show import ShowCommand
 from poetry.factory import Factory
 from poetry.utils._compat import tomllib
 from tests.helpers import MOCK_DEFAULT_GIT_REVISION
@@ -898,6 +899,87 @@ cachy 0.1.0 0.2.0 Cachy package
         assert tester.io.fetch_output() == expected
 
 
+def test_show_outdated_caches_latest_versions(
+    tester: CommandTester,
+    poetry: Poetry,
+    installed: Repository,
+    repo: DummyRepository,
+) -> None:
+    poetry.package.add_dependency(Factory.create_dependency("cachy", "^0.1.0"))
+
+    cachy_010 = get_package("cachy", "0.1.0")
+    cachy_010.description = "Cachy package"
+    cachy_020 = get_package("cachy", "0.2.0")
+
+    installed.add_package(cachy_010)
+    repo.add_package(cachy_010)
+    repo.add_package(cachy_020)
+
+    assert isinstance(poetry.locker, DummyLocker)
+    poetry.locker.mock_lock_data(
+        {
+            "package": [
+                {
+                    "name": "cachy",
+                    "version": "0.1.0",
+                    "description": "Cachy package",
+                    "optional": False,
+                    "platform": "*",
+                    "python-versions": "*",
+                    "checksum": [],
+                },
+            ],
+            "metadata": {
+                "python-versions": "*",
+                "platform": "*",
+                "content-hash": "123456789",
+                "files": {"cachy": []},
+            },
+        }
+    )
+
+    tester.execute("--outdated")
+    assert tester.io.fetch_output() == "cachy 0.1.0 0.2.0 Cachy package\n"
+
+    # the result of the lookup is cached, the repository is not queried again
+    repo.packages.remove(cachy_020)
+    tester.execute("--outdated")
+    assert tester.io.fetch_output() == "cachy 0.1.0 0.2.0 Cachy package\n"
+
+    # the cache is not mistaken for the cache of a repository
+    assert poetry.config.latest_versions_cache_directory.exists()
+    assert not poetry.config.repository_cache_directory.exists()
+
+
+def test_find_latest_packages_restores_displayed_fields_from_cache(
+    tester: CommandTester, poetry: Poetry, repo: DummyRepository
+) -> None:
+    poetry.package.add_dependency(Factory.create_dependency("cachy", "^0.1.0"))
+    cachy_010 = get_package("cachy", "0.1.0")
+    cachy_020 = get_package("cachy", "0.2.0")
+    cachy_020.description = "Cachy package"
+    repo.add_package(cachy_010)
+    repo.add_package(cachy_020)
+    command = tester.command
+    assert isinstance(command, ShowCommand)
+
+    (latest,) = command.find_latest_packages([cachy_010], poetry.package)
+    (cached,) = command.find_latest_packages([cachy_010], poetry.package)
+
+    assert latest is cachy_020
+    assert cached is not None
+    assert cached is not latest
+    # only the fields that are displayed are restored
+    for attribute in (
+        "full_pretty_version",
+        "source_type",
+        "source_url",
+        "source_reference",
+    ):
+        assert getattr(cached, attribute) == getattr(latest, attribute)
+    assert cached.description == ""
+
+
 @output_format_parametrize
 def test_show_outdated_with_only_up_to_date_packages(
     output_format: str,
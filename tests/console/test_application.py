@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import re
 import shutil
+import subprocess
+import sys
 
 from typing import TYPE_CHECKING
 from typing import ClassVar
@@ -16,7 +18,9 @@ from poetry.console.commands.command import Command
 from poetry.plugins.application_plugin import ApplicationPlugin
 from poetry.plugins.plugin_manager import ProjectPluginCache
 from poetry.repositories.cached_repository import CachedRepository
+from poetry.repositories.http_repository import HTTPRepository
 from poetry.utils.authenticator import Authenticator
+from poetry.utils.authenticator import StaleCacheControlAdapter
 from poetry.utils.env import EnvManager
 from poetry.utils.env import MockEnv
 from tests.helpers import mock_metadata_entry_points
@@ -157,6 +161,32 @@ def test_application_verify_source_cache_flag(
             assert repo._disable_cache == disable_cache
 
 
+@pytest.mark.parametrize("offline", [True, False])
+def test_application_offline_flag_reaches_authenticators(
+    offline: bool, set_project_context: SetProjectContext
+) -> None:
+    with set_project_context("sample_project"):
+        app = Application()
+
+        tester = ApplicationTester(app)
+        command = "debug info"
+
+        if offline:
+            command = f"{command} --offline"
+
+        tester.execute(command)
+
+        assert app.poetry.pool.repositories
+
+        for repo in app.poetry.pool.repositories:
+            assert isinstance(repo, HTTPRepository)
+            adapter = repo.session.get_session().get_adapter(repo.url)
+            assert isinstance(adapter, StaleCacheControlAdapter) is offline
+
+        # authenticators that are created outside of the project see the flag, too
+        assert Authenticator()._offline is offline
+
+
 @pytest.mark.parametrize("disable_cache", [True, False])
 def test_application_verify_cache_flag_at_install(
     mocker: MockerFixture,
@@ -245,3 +275,39 @@ def test_application_input_configuration_and_sorting(
 
     io_input = cast("ArgvInput", app._io.input)
     assert io_input._tokens == result
+
+
+@pytest.mark.parametrize("command", [["version"], ["env", "info", "-p"]])
+def test_application_does_not_import_heavy_modules_on_startup(
+    command: list[str], fixture_dir: FixtureDirGetter
+) -> None:
+    # Commands that do not need to resolve, install or access repositories
+    # must not pay for importing the corresponding modules.
+    script = (
+        "import sys\n"
+        "from cleo.io.inputs.argv_input import ArgvInput\n"
+        "from poetry.console.application import Application\n"
+        "app = Application()\n"
+        "app.auto_exits(False)\n"
+        "app.run(ArgvInput(sys.argv))\n"
+        "print('\\n'.join(sys.modules))\n"
+    )
+    project = fixture_dir("simple_project")
+    result = subprocess.run(
+        [sys.executable, "-c", script, "-C", str(project), *command],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set(result.stdout.splitlines())
+
+    for module in (
+        "requests",
+        "cachecontrol",
+        "dulwich",
+        "keyring",
+        "poetry.installation.installer",
+        "poetry.puzzle.solver",
+        "poetry.repositories.http_repository",
+    ):
+        assert module not in modules
@@ -24,6 +24,7 @@ from poetry.inspection.lazy_wheel import LazyWheelOverHTTP
 from poetry.inspection.lazy_wheel import LazyWheelUnsupportedError
 from poetry.inspection.lazy_wheel import UnsupportedWheelError
 from poetry.inspection.lazy_wheel import metadata_from_wheel_url
+from poetry.inspection.lazy_wheel import metadata_from_wheel_urls
 from tests.helpers import http_setup_redirect
 
 
@@ -476,6 +477,67 @@ def test_metadata_from_wheel_url_handles_unexpected_errors(
         )
 
 
+def test_metadata_from_wheel_url_skips_domain_without_range_requests(
+    http: responses.RequestsMock,
+) -> None:
+    domain = "known-no-range-requests.com"
+    supports_range_requests = {domain: False}
+
+    with pytest.raises(HTTPRangeRequestUnsupportedError):
+        metadata_from_wheel_url(
+            "poetry-core",
+            f"https://{domain}/poetry_core-1.5.0-py3-none-any.whl",
+            requests.Session(),
+            supports_range_requests=supports_range_requests,
+        )
+
+    assert len(http.calls) == 0
+    assert supports_range_requests == {domain: False}
+
+
+def test_metadata_from_wheel_urls(
+    http: responses.RequestsMock,
+    handle_request_factory: RequestCallbackFactory,
+) -> None:
+    supported = "batch-range-requests.com"
+    unsupported = "batch-no-range-requests.com"
+    for domain, accept_ranges in ((supported, "bytes"), (unsupported, None)):
+        uri_regex = re.compile(f"^https://{domain}/.*$")
+        request_callback = handle_request_factory(accept_ranges=accept_ranges)
+        http.add_callback(responses.GET, uri_regex, callback=request_callback)
+        http.add_callback(responses.HEAD, uri_regex, callback=request_callback)
+
+    wheels = [
+        (name, f"https://{domain}/{filename}")
+        for domain in (supported, unsupported)
+        for name, filename in (
+            ("poetry-core", "poetry_core-1.5.0-py3-none-any.whl"),
+            ("zipp", "zipp-3.5.0-py3-none-any.whl"),
+        )
+    ]
+    supports_range_requests: dict[str, bool] = {}
+
+    results = metadata_from_wheel_urls(
+        wheels, requests.Session(), supports_range_requests=supports_range_requests
+    )
+
+    assert supports_range_requests == {supported: True, unsupported: False}
+    assert results.keys() == {url for _, url in wheels}
+    for name, url in wheels:
+        result = results[url]
+        if urlparse(url).netloc == supported:
+            assert not isinstance(result, LazyWheelUnsupportedError)
+            assert result["name"] == name
+        else:
+            assert isinstance(result, HTTPRangeRequestUnsupportedError)
+    # only one wheel is requested from the domain without range requests
+    assert [
+        call.request.url
+        for call in http.calls
+        if urlparse(call.request.url).netloc == unsupported
+    ] == [wheels[2][1]]
+
+
 def test_prefetch_metadata_closes_zipfile_on_error(mocker: MockerFixture) -> None:
     """ZipFile opened in _prefetch_metadata must be closed even if an error occurs."""
     mock_zf = mocker.MagicMock()
@@ -893,6 +893,85 @@ def test_executor_should_write_pep610_url_references_for_wheel_files(
     assert url.exists(), "source file should not be deleted"
 
 
+def test_executor_timing(
+    tmp_venv: VirtualEnv,
+    pool: RepositoryPool,
+    config: Config,
+    io: BufferedIO,
+    fixture_dir: FixtureDirGetter,
+    tmp_path: Path,
+) -> None:
+    url = (fixture_dir("distributions") / "demo-0.1.0-py2.py3-none-any.whl").resolve()
+    package = Package("demo", "0.1.0", source_type="file", source_url=url.as_posix())
+    package.files = [
+        {
+            "file": "demo-0.1.0-py2.py3-none-any.whl",
+            "hash": (
+                "sha256:70e704135718fffbcbf61ed1fc45933cfd86951a744b681000eaaa75da31f17a"
+            ),
+        }
+    ]
+    output = tmp_path / "timing.json"
+
+    executor = Executor(tmp_venv, pool, config, io)
+    executor.enable_bytecode_compilation()
+    executor.enable_timing(output=output)
+    assert executor.execute([Install(package)]) == 0
+
+    lines = io.fetch_output().splitlines()
+    header = next(
+        i for i, line in enumerate(lines) if line.startswith("Slowest packages")
+    )
+    assert lines[header + 2].split() == [
+        "Package",
+        "Total",
+        "Queue",
+        "wait",
+        "Download",
+        "Hash",
+        "check",
+        "Build",
+        "Install",
+        "Compile",
+    ]
+    assert lines[header + 3].startswith("demo ")
+
+    trace = json.loads(output.read_text(encoding="utf-8"))
+    assert {event["cat"] for event in trace["traceEvents"]} >= {
+        "queue wait",
+        "operation",
+        "hash check",
+        "install",
+        "compile",
+    }
+    [slowest] = trace["otherData"]["slowest"]
+    assert slowest["name"] == "demo"
+    assert set(slowest["phases"]) >= {"queue wait", "install", "compile"}
+
+
+def test_executor_defers_bytecode_compilation(
+    tmp_venv: VirtualEnv,
+    pool: RepositoryPool,
+    config: Config,
+    io: BufferedIO,
+    fixture_dir: FixtureDirGetter,
+    mocker: MockerFixture,
+) -> None:
+    config.merge({"installer": {"defer-compile": True}})
+    url = (fixture_dir("distributions") / "demo-0.1.0-py2.py3-none-any.whl").resolve()
+    package = Package("demo", "0.1.0", source_type="file", source_url=url.as_posix())
+    compile_bytecode = mocker.spy(WheelInstaller, "compile_bytecode")
+
+    executor = Executor(tmp_venv, pool, config, io)
+    executor.enable_bytecode_compilation()
+    assert executor.execute([Install(package)]) == 0
+
+    compile_bytecode.assert_called_once()
+    dist_info = tmp_venv.site_packages.find_distribution("demo")
+    assert dist_info is not None
+    assert any(str(file).endswith(".pyc") for file in dist_info.files or [])
+
+
 def test_executor_should_write_pep610_url_references_for_non_wheel_files(
     tmp_venv: VirtualEnv,
     pool: RepositoryPool,
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from packaging.utils import canonicalize_name
+
+from poetry.installation.fingerprint import InstallFingerprint
+from poetry.utils.env import MockEnv
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def env(tmp_path: Path) -> MockEnv:
+    env = MockEnv(path=tmp_path, is_venv=True)
+    env.purelib.mkdir()
+    env.platlib.mkdir()
+    return env
+
+
+def fingerprint(env: MockEnv, lock: str = "abc") -> InstallFingerprint:
+    return InstallFingerprint(
+        env, {"lock": lock, "groups": ["main"]}, root_name=canonicalize_name("root")
+    )
+
+
+def test_fingerprint_matches_after_save(env: MockEnv) -> None:
+    assert not fingerprint(env).matches()
+
+    fingerprint(env).save()
+
+    assert fingerprint(env).matches()
+    assert not fingerprint(env, lock="def").matches()
+
+
+def test_fingerprint_does_not_match_after_distribution_change(env: MockEnv) -> None:
+    (env.purelib / "foo-1.0.dist-info").mkdir()
+    fingerprint(env).save()
+
+    (env.platlib / "bar-2.0.dist-info").mkdir()
+
+    assert not fingerprint(env).matches()
+
+
+def test_fingerprint_ignores_root_package(env: MockEnv) -> None:
+    fingerprint(env).save()
+
+    (env.purelib / "root-1.0.dist-info").mkdir()
+
+    assert fingerprint(env).matches()
+
+
+def test_fingerprint_clear(env: MockEnv) -> None:
+    fingerprint(env).save()
+    fingerprint(env).clear()
+
+    assert not fingerprint(env).matches()
+
+
+def test_fingerprint_does_not_match_if_corrupt(env: MockEnv) -> None:
+    (env.path / InstallFingerprint.FILENAME).write_text("{", encoding="utf-8")
+
+    assert not fingerprint(env).matches()
@@ -465,6 +465,69 @@ def test_run_install_with_dependency_groups(
     assert installer.executor.removals_count == removals
 
 
+def test_run_install_is_skipped_if_environment_is_unchanged(
+    locker: Locker,
+    repo: Repository,
+    pool: RepositoryPool,
+    package: ProjectPackage,
+    installed: CustomInstalledRepository,
+    config: Config,
+    tmp_path: Path,
+) -> None:
+    env = MockEnv(path=tmp_path / "venv", is_venv=True)
+    env.path.mkdir()
+    env.purelib.mkdir()
+    lock_data = {
+        "package": [
+            {
+                "name": "A",
+                "version": "1.0",
+                "optional": False,
+                "platform": "*",
+                "python-versions": "*",
+                "checksum": [],
+            },
+        ],
+        "metadata": {
+            "lock-version": "2.1",
+            "python-versions": "*",
+            "content-hash": "123456789",
+            "files": {"A": []},
+        },
+    }
+    fix_lock_data(lock_data)
+    locker.set_lock_path(tmp_path).locked(True)
+    locker.lock.write_text("lock", encoding="utf-8")
+    locker.mock_lock_data(lock_data)
+    repo.add_package(get_package("A", "1.0"))
+    package.add_dependency(Factory.create_dependency("A", "~1.0"))
+
+    def run() -> TestExecutor:
+        executor = TestExecutor(env, pool, config, NullIO())
+        installer = Installer(
+            NullIO(),
+            env,
+            package,
+            locker,
+            pool,
+            config,
+            installed=installed,
+            executor=executor,
+        )
+        assert installer.run() == 0
+        return executor
+
+    assert run().installations_count == 1
+    assert run().installations_count == 0
+
+    # a change of the lock file or the environment invalidates the fingerprint
+    locker.lock.write_text("changed lock", encoding="utf-8")
+    assert run().installations_count == 1
+    (env.purelib / "b-1.0.dist-info").mkdir()
+    assert run().installations_count == 1
+    assert run().installations_count == 0
+
+
 @pytest.mark.parametrize("lock_version", ("1.1", "2.1"))
 def test_run_install_does_not_remove_locked_packages_if_installed_but_not_required(
     installer: Installer,
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import base64
+import hashlib
+import os
 import re
+import zipfile
 
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -9,6 +13,7 @@ import pytest
 
 from poetry.core.constraints.version import parse_constraint
 
+from poetry.installation import wheel_installer
 from poetry.installation.wheel_installer import WheelInstaller
 from poetry.utils._compat import WINDOWS
 from poetry.utils.env import MockEnv
@@ -16,6 +21,7 @@ from poetry.utils.env import MockEnv
 
 if TYPE_CHECKING:
     from pytest import TempPathFactory
+    from pytest_mock import MockerFixture
 
     from tests.types import FixtureDirGetter
 
@@ -84,6 +90,105 @@ def test_enable_bytecode_compilation(
         assert not cache_dir.exists()
 
 
+def test_deferred_bytecode_compilation(env: MockEnv, demo_wheel: Path) -> None:
+    installer = WheelInstaller(env)
+    installer.enable_bytecode_compilation(defer=True)
+    installer.install(demo_wheel)
+    cache_dir = Path(env.paths["purelib"]) / "demo" / "__pycache__"
+    assert not cache_dir.exists()
+
+    installer.compile_bytecode()
+
+    bytecode_files = list(cache_dir.glob("*.pyc"))
+    assert len(bytecode_files) == 1
+    record = Path(env.paths["purelib"]) / "demo-0.1.0.dist-info" / "RECORD"
+    assert (
+        f"demo/__pycache__/{bytecode_files[0].name},,"
+        in record.read_text(encoding="utf-8").splitlines()
+    )
+
+    # compiled files are only added once to the RECORD file
+    installer.compile_bytecode()
+    assert record.read_text(encoding="utf-8").count(".pyc") == 1
+
+
+@pytest.fixture
+def binary_wheel(tmp_path: Path) -> Path:
+    wheel = tmp_path / "binary-0.1-py3-none-any.whl"
+    files = {
+        # bigger than the copy buffer and not a multiple of it
+        "binary/_lib.so": (zipfile.ZIP_STORED, os.urandom(1024 * 1024 * 3 + 17)),
+        "binary/__init__.py": (zipfile.ZIP_DEFLATED, b"from ._lib import *\n" * 100),
+        "binary/empty.txt": (zipfile.ZIP_STORED, b""),
+        "binary-0.1.dist-info/WHEEL": (
+            zipfile.ZIP_STORED,
+            b"Wheel-Version: 1.0\nRoot-Is-Purelib: false\nTag: py3-none-any\n",
+        ),
+        "binary-0.1.dist-info/METADATA": (
+            zipfile.ZIP_STORED,
+            b"Metadata-Version: 2.1\nName: binary\nVersion: 0.1\n",
+        ),
+    }
+    record = "".join(f"{name},,\n" for name in files)
+    record += "binary-0.1.dist-info/RECORD,,\n"
+    with zipfile.ZipFile(wheel, "w") as z:
+        for name, (compress_type, content) in files.items():
+            info = zipfile.ZipInfo(name)
+            info.compress_type = compress_type
+            # the extra field of the local file header has to be skipped
+            info.extra = b"\xfe\xca\x04\x00test" if name.endswith(".so") else b""
+            z.writestr(info, content)
+        z.writestr("binary-0.1.dist-info/RECORD", record)
+
+    return wheel
+
+
+@pytest.mark.parametrize("kernel_copy", [True, False])
+def test_install_copies_members(
+    env: MockEnv, binary_wheel: Path, mocker: MockerFixture, kernel_copy: bool
+) -> None:
+    if not kernel_copy:
+        error = OSError("not supported")
+        if hasattr(os, "copy_file_range"):
+            mocker.patch("os.copy_file_range", side_effect=error)
+        if hasattr(os, "sendfile"):
+            mocker.patch("os.sendfile", side_effect=error)
+
+    copy_range = mocker.spy(wheel_installer, "_copy_range")
+
+    installer = WheelInstaller(env)
+    installer.install(binary_wheel)
+
+    # non-empty stored members: _lib.so, WHEEL and METADATA
+    assert copy_range.call_count == 3
+    platlib = Path(env.paths["platlib"])
+    record = (platlib / "binary-0.1.dist-info" / "RECORD").read_text(encoding="utf-8")
+    with zipfile.ZipFile(binary_wheel) as z:
+        for name in ("binary/_lib.so", "binary/__init__.py", "binary/empty.txt"):
+            content = z.read(name)
+            assert (platlib / name).read_bytes() == content
+            digest = base64.urlsafe_b64encode(hashlib.sha256(content).digest())
+            assert f"{name},sha256={digest.decode().rstrip('=')},{len(content)}" in (
+                record.splitlines()
+            )
+
+
+def test_install_detects_corrupt_stored_member(
+    env: MockEnv, binary_wheel: Path
+) -> None:
+    with zipfile.ZipFile(binary_wheel) as z:
+        info = z.getinfo("binary/_lib.so")
+    with binary_wheel.open("r+b") as f:
+        f.seek(info.header_offset + 4096)
+        byte = f.read(1)
+        f.seek(-1, os.SEEK_CUR)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+    installer = WheelInstaller(env)
+    with pytest.raises(zipfile.BadZipFile, match="Bad CRC-32"):
+        installer.install(binary_wheel)
+
+
 def test_install_dir_is_symlink(tmp_path: Path, demo_wheel: Path) -> None:
     target_dir = tmp_path / "target"
     target_dir.mkdir()
@@ -29,6 +29,7 @@ from poetry.factory import Factory
 from poetry.packages.locker import GENERATED_COMMENT
 from poetry.packages.locker import Locker
 from poetry.packages.transitive_package_info import TransitivePackageInfo
+from poetry.utils._compat import tomllib
 from tests.helpers import get_dependency
 from tests.helpers import get_package
 
@@ -1853,6 +1854,61 @@ content-hash = "115cf985d932e9bf5f540555bbdd75decbb62cac81e399375fc19f6277f8c1d8
     assert content == old_content
 
 
+def test_lock_data_is_read_from_cache_if_lock_file_is_unchanged(
+    root: ProjectPackage,
+    transitive_info: TransitivePackageInfo,
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    lock_path = tmp_path / "poetry.lock"
+    cache_dir = tmp_path / "cache"
+    Locker(lock_path, {}).set_lock_data(root, {Package("a", "1.0"): transitive_info})
+    loads = mocker.spy(tomllib, "loads")
+
+    assert (
+        Locker(lock_path, {}, cache_dir=cache_dir).lock_data["package"][0]["name"]
+        == "a"
+    )
+    assert loads.call_count == 1
+    assert len(list(cache_dir.iterdir())) == 1
+
+    locker = Locker(lock_path, {}, cache_dir=cache_dir)
+    assert locker.lock_data["package"][0]["name"] == "a"
+    assert locker.is_fresh()
+    assert loads.call_count == 1
+
+    # the cache is invalidated if the content of the lock file changes
+    locker.set_lock_data(root, {Package("b", "1.0"): transitive_info})
+    assert locker.lock_data["package"][0]["name"] == "b"
+    assert loads.call_count == 2
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_invalid_lock_data_cache_is_ignored(
+    root: ProjectPackage,
+    transitive_info: TransitivePackageInfo,
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    lock_path = tmp_path / "poetry.lock"
+    cache_dir = tmp_path / "cache"
+    Locker(lock_path, {}).set_lock_data(root, {Package("a", "1.0"): transitive_info})
+    assert Locker(lock_path, {}, cache_dir=cache_dir).lock_data
+    (sidecar,) = cache_dir.iterdir()
+    assert sidecar.suffix == ".json"
+    sidecar.write_bytes(b"\x80invalid")
+    loads = mocker.spy(tomllib, "loads")
+
+    assert (
+        Locker(lock_path, {}, cache_dir=cache_dir).lock_data["package"][0]["name"]
+        == "a"
+    )
+    assert loads.call_count == 1
+    # the cache has been rewritten
+    assert json.loads(sidecar.read_bytes())["data"]["package"][0]["name"] == "a"
+    assert [path.name for path in cache_dir.iterdir()] == [sidecar.name]
+
+
 def test_lockfile_keep_eol(
     locker: Locker, root: ProjectPackage, transitive_info: TransitivePackageInfo
 ) -> None:
@@ -379,7 +379,7 @@ def test_ensure_plugins_install_missing_plugins(
     cache = ProjectPluginCache(poetry_with_plugins, io)
     install_spy = mocker.spy(cache, "_install")
     execute_mock = mocker.patch(
-        "poetry.plugins.plugin_manager.Installer._execute", return_value=0
+        "poetry.installation.installer.Installer._execute", return_value=0
     )
 
     cache.ensure_plugins()
@@ -433,7 +433,7 @@ def test_ensure_plugins_install_only_missing_plugins(
     cache = ProjectPluginCache(poetry_with_plugins, io)
     install_spy = mocker.spy(cache, "_install")
     execute_mock = mocker.patch(
-        "poetry.plugins.plugin_manager.Installer._execute", return_value=0
+        "poetry.installation.installer.Installer._execute", return_value=0
     )
 
     cache.ensure_plugins()
@@ -484,7 +484,7 @@ def test_ensure_plugins_install_overwrite_wrong_version_plugins(
     cache = ProjectPluginCache(poetry_with_plugins, io)
     install_spy = mocker.spy(cache, "_install")
     execute_mock = mocker.patch(
-        "poetry.plugins.plugin_manager.Installer._execute", return_value=0
+        "poetry.installation.installer.Installer._execute", return_value=0
     )
 
     cache.ensure_plugins()
@@ -544,7 +544,7 @@ def test_ensure_plugins_pins_other_installed_packages(
     cache = ProjectPluginCache(poetry_with_plugins, io)
     install_spy = mocker.spy(cache, "_install")
     execute_mock = mocker.patch(
-        "poetry.plugins.plugin_manager.Installer._execute", return_value=0
+        "poetry.installation.installer.Installer._execute", return_value=0
     )
 
     with pytest.raises(SolverProblemError):
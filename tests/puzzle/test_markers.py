@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from poetry.core.constraints.version import parse_constraint
+from poetry.core.version.markers import SingleMarker
+from poetry.core.version.markers import parse_marker
+
+from poetry.puzzle import markers
+
+
+def test_operations_return_interned_markers() -> None:
+    m1 = parse_marker('sys_platform == "linux"')
+    # parse_marker() is cached, so the markers are created directly
+    m2 = SingleMarker("python_version", ">=3.10")
+    m2_copy = SingleMarker("python_version", ">=3.10")
+    assert m2 == m2_copy
+    assert m2 is not m2_copy
+
+    intersection = markers.intersect(m1, m2)
+    assert intersection == m1.intersect(m2)
+    assert markers.intersect(m1, m2_copy) is intersection
+    assert markers.intern_marker(m1.intersect(m2)) is intersection
+
+    union = markers.union(m1, m2)
+    assert union == m1.union(m2)
+    assert markers.union_all(m1, m2) is union
+
+    inverted = markers.invert(m1)
+    assert str(inverted) == 'sys_platform != "linux"'
+    assert markers.invert(m1) is inverted
+
+
+def test_simplify_marker() -> None:
+    marker = parse_marker('python_version >= "3.9" and sys_platform == "linux"')
+
+    simplified = markers.simplify_marker(marker, parse_constraint(">=3.10"))
+
+    assert str(simplified) == 'sys_platform == "linux"'
+
+
+def test_format_cache_info() -> None:
+    markers.cache_clear()
+    assert markers.format_cache_info() == "Marker cache hits: none"
+
+    m1 = parse_marker('platform_machine == "x86_64"')
+    m2 = parse_marker('implementation_name == "cpython"')
+    markers.intersect(m1, m2)
+    markers.intersect(m1, m2)
+
+    assert markers.cache_info()["intersect"].hits == 1
+    assert markers.format_cache_info() == (
+        "Marker cache hits: intern 0/1 (0%), intersect 1/2 (50%)"
+    )
@@ -19,6 +19,7 @@ from poetry.core.packages.package import Package
 from poetry.core.packages.project_package import ProjectPackage
 from poetry.core.packages.url_dependency import URLDependency
 from poetry.core.packages.vcs_dependency import VCSDependency
+from poetry.core.version.markers import parse_marker
 
 from poetry.factory import Factory
 from poetry.inspection.info import PackageInfo
@@ -710,6 +711,55 @@ def test_search_for_file_wheel_with_extras(
     }
 
 
+def test_complete_package_prefetches_metadata_of_first_candidates(
+    root: ProjectPackage,
+    repository: Repository,
+    pool: RepositoryPool,
+    mocker: MockerFixture,
+) -> None:
+    for name, version in [
+        ("foo", "1.0"),
+        ("foo", "2.0"),
+        ("bar", "1.0"),
+        ("bar", "2.0"),
+    ]:
+        repository.add_package(Package(name, version))
+    locked_bar = Package("bar", "1.0")
+    mocker.patch.object(pool, "can_prefetch_metadata", return_value=True)
+    prefetch_metadata = mocker.patch.object(pool, "prefetch_metadata")
+    provider = Provider(root, pool, NullIO(), locked=[locked_bar])
+
+    root.add_dependency(get_dependency("foo"))
+    root.add_dependency(get_dependency("bar"))
+    root.add_dependency(get_dependency("missing"))
+
+    provider.complete_package(DependencyPackage(root.to_dependency(), root))
+    # the metadata of each package is only prefetched once
+    provider.complete_package(DependencyPackage(root.to_dependency(), root))
+
+    prefetch_metadata.assert_called_once()
+    assert [
+        (package.name, package.version.text)
+        for package in prefetch_metadata.call_args[0][0]
+    ] == [("foo", "2.0"), ("bar", "1.0")]
+
+
+def test_complete_package_does_not_prefetch_metadata_if_unsupported(
+    provider: Provider,
+    root: ProjectPackage,
+    repository: Repository,
+    pool: RepositoryPool,
+    mocker: MockerFixture,
+) -> None:
+    repository.add_package(Package("foo", "1.0"))
+    prefetch_metadata = mocker.spy(pool, "prefetch_metadata")
+    root.add_dependency(get_dependency("foo"))
+
+    provider.complete_package(DependencyPackage(root.to_dependency(), root))
+
+    prefetch_metadata.assert_not_called()
+
+
 def test_complete_package_merges_same_source_and_no_source(
     provider: Provider, root: ProjectPackage
 ) -> None:
@@ -1081,3 +1131,118 @@ def test_indicator_context_resets_on_exception() -> None:
         raise RuntimeError("network error")
 
     assert Indicator.CONTEXT is None
+
+
+def test_incompatibilities_for_coalesces_consecutive_versions(
+    provider: Provider,
+) -> None:
+    packages = {}
+    for version, bar_constraint in [
+        ("1.1", "<2"),
+        ("1.2", "<2"),
+        ("1.3", "<2"),
+        ("1.4", "<3"),
+    ]:
+        package = Package("foo", version)
+        package.add_dependency(Dependency("bar", bar_constraint))
+        package.add_dependency(Dependency("baz", ">=1"))
+        packages[version] = DependencyPackage(package.to_dependency(), package)
+
+    def incompatibilities(version: str) -> list[str]:
+        return [str(i) for i in provider.incompatibilities_for(packages[version])]
+
+    assert incompatibilities("1.2") == [
+        "foo (1.2) depends on bar (<2)",
+        "foo (1.2) depends on baz (>=1)",
+    ]
+    # only versions that have been seen before are taken into account
+    assert incompatibilities("1.4") == [
+        "foo (1.4) depends on bar (<3)",
+        "foo (1.2 || 1.4) depends on baz (>=1)",
+    ]
+    assert incompatibilities("1.1") == [
+        "foo (1.1 || 1.2) depends on bar (<2)",
+        "foo (1.1 || 1.2 || 1.4) depends on baz (>=1)",
+    ]
+    assert incompatibilities("1.3") == [
+        "foo (1.1 || 1.2 || 1.3) depends on bar (<2)",
+        "foo (1.1 || 1.2 || 1.3 || 1.4) depends on baz (>=1)",
+    ]
+
+
+def test_partition_markers() -> None:
+    markers = [
+        parse_marker('python_version < "3.10"'),
+        parse_marker('python_version >= "3.12"'),
+        parse_marker('sys_platform == "win32"'),
+    ]
+
+    partition = Provider._partition_markers(markers)
+
+    assert [(uses, str(marker)) for uses, marker in partition] == [
+        ((True, False, True), 'python_version < "3.10" and sys_platform == "win32"'),
+        ((True, False, False), 'python_version < "3.10" and sys_platform != "win32"'),
+        ((False, True, True), 'python_version >= "3.12" and sys_platform == "win32"'),
+        (
+            (False, True, False),
+            'python_version >= "3.12" and sys_platform != "win32"',
+        ),
+        (
+            (False, False, True),
+            (
+                'sys_platform == "win32"'
+                ' and python_version >= "3.10" and python_version < "3.12"'
+            ),
+        ),
+        (
+            (False, False, False),
+            (
+                'python_version >= "3.10" and python_version < "3.12"'
+                ' and sys_platform != "win32"'
+            ),
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("markers", "expected_count"),
+    [
+        # 12 mutually exclusive markers (and the leftover marker space)
+        (
+            [
+                f'python_version == "{python}" and sys_platform == "{platform}"'
+                for python in ["3.9", "3.10", "3.11", "3.12"]
+                for platform in ["linux", "darwin", "win32"]
+            ],
+            13,
+        ),
+        # 12 overlapping markers
+        (
+            [f'python_version >= "3.{minor}"' for minor in range(9, 15)]
+            + [f'sys_platform == "{p}"' for p in ["linux", "darwin", "win32"]]
+            + [f'platform_machine == "{m}"' for m in ["x86_64", "arm64", "aarch64"]],
+            12,
+        ),
+    ],
+)
+def test_resolve_overlapping_markers_12_way_split(
+    root: ProjectPackage, markers: list[str], expected_count: int
+) -> None:
+    # Before the marker space was partitioned incrementally,
+    # the overlapping markers took several minutes.
+    root.python_versions = ">=3.9"
+    provider = Provider(root, RepositoryPool(), NullIO())
+    dependencies = []
+    for i, marker in enumerate(markers):
+        dependency = Dependency("foo", f">={i}")
+        dependency.marker = parse_marker(marker)
+        dependencies.append(dependency)
+
+    new_dependencies = provider._resolve_overlapping_markers(
+        root, dependencies, None, cover_leftover_marker_space=True
+    )
+
+    assert len(new_dependencies) == expected_count
+    for i, dep in enumerate(new_dependencies):
+        for other in new_dependencies[i + 1 :]:
+            assert dep.marker.intersect(other.marker).is_empty()
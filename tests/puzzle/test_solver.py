@@ -29,6 +29,7 @@ from poetry.puzzle.provider import IncompatibleConstraintsError
 from poetry.repositories.repository import Repository
 from poetry.repositories.repository_pool import Priority
 from poetry.repositories.repository_pool import RepositoryPool
+from poetry.utils import profiling
 from poetry.utils.env import MockEnv
 from tests.helpers import MOCK_DEFAULT_GIT_REVISION
 from tests.helpers import get_dependency
@@ -2346,6 +2347,47 @@ def test_solver_conditional_transitive_conflict_overlapping_markers_still_fails(
         solver.solve()
 
 
+def test_solver_backtracks_through_long_release_history_with_bounded_decisions(
+    solver: Solver, repo: Repository, package: ProjectPackage
+) -> None:
+    """
+    Every release of A but the oldest requires B>=2, whose only release
+    conflicts with a requirement of the root package. The solver only finds
+    out after it has decided on the latest release of A. It must then rule out
+    all other conflicting releases at once instead of trying them one by one.
+    """
+    package.add_dependency(Factory.create_dependency("A", "*"))
+    package.add_dependency(Factory.create_dependency("C", ">=1"))
+
+    releases = 100
+    for i in range(1, releases + 1):
+        package_a = get_package("A", f"{i}.0")
+        package_a.add_dependency(Factory.create_dependency("B", ">=2"))
+        repo.add_package(package_a)
+    package_a = get_package("A", "0.1")
+    repo.add_package(package_a)
+    package_b = get_package("B", "2.0")
+    package_b.add_dependency(Factory.create_dependency("C", "<1"))
+    repo.add_package(package_b)
+    repo.add_package(get_package("B", "1.0"))
+    package_c = get_package("C", "1.0")
+    repo.add_package(package_c)
+    repo.add_package(get_package("C", "0.1"))
+
+    with profiling.profile() as profiler:
+        transaction = solver.solve()
+
+    check_solver_result(
+        transaction,
+        [
+            {"job": "install", "package": package_a},
+            {"job": "install", "package": package_c},
+        ],
+    )
+    assert profiler.counters["conflicts"] == 1
+    assert profiler.counters["decisions"] < 10 < releases
+
+
 def test_solver_duplicate_dependencies_with_overlapping_markers_simple(
     solver: Solver, repo: Repository, package: ProjectPackage
 ) -> None:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import itertools
+
 from typing import TYPE_CHECKING
 
 import pytest
@@ -25,6 +27,7 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from poetry.core.packages.project_package import ProjectPackage
+    from pytest_mock import MockerFixture
 
 
 DEV_GROUP = canonicalize_name("dev")
@@ -108,6 +111,29 @@ def test_dfs_depth_with_extra(package: ProjectPackage) -> None:
     assert depths == {"root": [-1], "a[foo]": [0], "a": [0], "b": [1], "c": [1]}
 
 
+def test_dfs_computes_edges_once_per_package(
+    package: ProjectPackage, mocker: MockerFixture
+) -> None:
+    layers = [[Package(f"p{i}-{j}", "1") for j in range(10)] for i in range(8)]
+    packages = [package] + [p for layer in layers for p in layer]
+    for p in layers[0]:
+        package.add_dependency(dep(p.name, groups=[MAIN_GROUP]))
+        package.add_dependency(dep(p.name, groups=[DEV_GROUP]))
+    for layer, next_layer in itertools.pairwise(layers):
+        for p in layer:
+            for next_p in next_layer:
+                p.add_dependency(dep(next_p.name))
+    edge_count = sum(len(p.all_requires) for p in packages)
+    satisfies = mocker.spy(Package, "satisfies")
+
+    result, __ = depth_first_search(PackageNode(package, packages))
+
+    # every package is reached via two groups, but its edges are only built once
+    assert len(result) == len(packages)
+    assert len(result[-1]) == 2
+    assert satisfies.call_count == edge_count
+
+
 def test_propagate_markers(package: ProjectPackage, solver: Solver) -> None:
     a = Package("a", "1")
     b = Package("b", "1")
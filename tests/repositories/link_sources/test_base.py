@@ -15,6 +15,7 @@ from poetry.core.packages.package import Package
 from poetry.core.packages.utils.link import Link
 
 from poetry.repositories.link_sources.base import LinkSource
+from poetry.repositories.link_sources.base import PackageNameIndex
 from poetry.repositories.link_sources.base import SimpleRepositoryRootPage
 from poetry.repositories.link_sources.base import make_absolute_url
 
@@ -133,6 +134,32 @@ def test_root_page_search(
     assert root_page.search(query) == expected
 
 
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("foo", ["bar-foo", "Foo.Bar", "foo_baz"]),
+        ("FOO-BA", ["Foo.Bar", "foo_baz"]),
+        ("o", ["bar-foo", "Foo.Bar", "foo_baz", "poetry"]),
+        (["ry", "baz"], ["foo_baz", "poetry"]),
+        ("", ["bar-foo", "Foo.Bar", "foo_baz", "poetry"]),
+        ("x", []),
+    ],
+)
+def test_package_name_index_search(query: str | list[str], expected: list[str]) -> None:
+    index = PackageNameIndex(["poetry", "foo_baz", "Foo.Bar", "bar-foo", "poetry"])
+    assert index.search(query) == expected
+    assert PackageNameIndex.from_dict(index.to_dict()).search(query) == expected
+
+
+def test_package_name_index_prefix() -> None:
+    index = PackageNameIndex(["poetry", "poetry-core", "poetry_plugin_export", "pip"])
+
+    assert index.prefix("Poetry") == ["poetry", "poetry-core", "poetry_plugin_export"]
+    assert index.prefix("poetry.p") == ["poetry_plugin_export"]
+    assert index.prefix("q") == []
+    assert len(index) == 4
+
+
 @pytest.mark.parametrize(
     ("url", "base_url", "expected", "urljoin_called"),
     [
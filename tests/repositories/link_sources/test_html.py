@@ -221,3 +221,18 @@ def test_base_url(
     page = HTMLPage(repo_url, content)
     link = next(iter(page.links))
     assert link.url == expected
+
+
+def test_page_from_chunks(html_page_content: HTMLPageGetter) -> None:
+    anchors = "".join(
+        f'<a href="https://example.org/demo-0.{i}.whl">demo-0.{i}.whl</a><br/>'
+        for i in range(10)
+    )
+    content = html_page_content(anchors)
+    chunks = [content[i : i + 16] for i in range(0, len(content), 16)]
+
+    page = HTMLPage("https://example.org/simple/demo/", chunks)
+
+    assert sorted(link.url for link in page.links) == [
+        f"https://example.org/demo-0.{i}.whl" for i in range(10)
+    ]
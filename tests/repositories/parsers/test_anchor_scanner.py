@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import logging
+import timeit
+
+from pathlib import Path
+
+import pytest
+
+from poetry.repositories.parsers.anchor_scanner import AnchorScanner
+from poetry.repositories.parsers.html_page_parser import HTMLPageParser
+
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+logger = logging.getLogger(__name__)
+
+
+def scan(content: str, chunk_size: int | None = None) -> AnchorScanner:
+    scanner = AnchorScanner()
+    chunk_size = chunk_size or len(content)
+    for i in range(0, len(content), chunk_size):
+        scanner.feed(content[i : i + chunk_size])
+    scanner.close()
+    return scanner
+
+
+def test_anchor_scanner_anchors() -> None:
+    content = """
+        <a href="https://example.org/demo-0.1.whl" class="link">demo-0.1.whl</a>
+        <a href='https://example.org/demo-0.1.whl'
+            data-requires-python="&gt;=3.7">demo-0.1.whl</a><br/>
+        <A HREF=https://example.org/demo-0.1.whl DATA-YANKED>demo-0.1.whl</A>
+        <a href="https://example.org/demo-0.1.whl" data-yanked="">demo-0.1.whl</a>
+        <a href="https://example.org/demo-0.1.whl" data-yanked="<reason>"
+        >demo-0.1.whl</a><br/>
+        <abbr href="https://example.org/demo-0.2.whl">not an anchor</abbr>
+        <!-- <a href="https://example.org/demo-0.3.whl">commented out</a> -->
+    """
+
+    assert scan(content).anchors == [
+        {"href": "https://example.org/demo-0.1.whl"},
+        {"data-requires-python": ">=3.7", "href": "https://example.org/demo-0.1.whl"},
+        {"data-yanked": None, "href": "https://example.org/demo-0.1.whl"},
+        {"data-yanked": "", "href": "https://example.org/demo-0.1.whl"},
+        {"data-yanked": "<reason>", "href": "https://example.org/demo-0.1.whl"},
+    ]
+
+
+def test_anchor_scanner_base_url() -> None:
+    content = """
+        <head><base href="https://example.org/"><base href="ignored"></head>
+        <a href="demo-0.1.whl">demo-0.1.whl</a>
+    """
+    scanner = scan(content)
+
+    assert scanner.base_url == "https://example.org/"
+    assert scanner.anchors == [{"href": "demo-0.1.whl"}]
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    sorted(FIXTURES.glob("**/*.html")),
+    ids=lambda path: path.relative_to(FIXTURES).as_posix(),
+)
+@pytest.mark.parametrize("chunk_size", [None, 1, 7, 64])
+def test_anchor_scanner_is_equivalent_to_html_page_parser(
+    fixture: Path, chunk_size: int | None
+) -> None:
+    content = fixture.read_text(encoding="utf-8")
+    parser = HTMLPageParser()
+    parser.feed(content)
+    expected = [
+        {k: v for k, v in anchor.items() if k == "href" or k.startswith("data-")}
+        for anchor in parser.anchors
+    ]
+
+    scanner = scan(content, chunk_size)
+
+    assert scanner.anchors == expected
+    assert scanner.base_url == parser.base_url
+
+
+@pytest.mark.benchmark
+def test_anchor_scanner_benchmark() -> None:
+    """
+    Compare AnchorScanner with HTMLPageParser on a large synthetic page.
+
+    Run with ``pytest --benchmark -n 0 -o log_cli=true -k anchor_scanner_benchmark``.
+    """
+    anchor = (
+        '<a href="https://files.example.org/packages/{i:02x}/{i:06x}/'
+        "demo-1.{i}.0-cp312-cp312-manylinux_2_17_x86_64.whl"
+        '#sha256={i:064x}" data-requires-python="&gt;=3.8"'
+        ' data-dist-info-metadata="sha256={i:064x}">'
+        "demo-1.{i}.0-cp312-cp312-manylinux_2_17_x86_64.whl</a><br />\n"
+    )
+    content = (
+        "<!DOCTYPE html>\n<html><head><title>Links for demo</title></head>"
+        "<body><h1>Links for demo</h1>\n"
+        + "".join(anchor.format(i=i) for i in range(40_000))
+        + "</body></html>\n"
+    )
+    chunk_size = 8192
+
+    def parse_with_html_page_parser() -> None:
+        parser = HTMLPageParser()
+        parser.feed(content)
+        parser.close()
+
+    def scan_whole_page() -> None:
+        scan(content)
+
+    def scan_in_chunks() -> None:
+        scan(content, chunk_size)
+
+    timings = {
+        name: min(timeit.repeat(func, number=1, repeat=3))
+        for name, func in (
+            ("HTMLPageParser.feed", parse_with_html_page_parser),
+            ("AnchorScanner.feed", scan_whole_page),
+            (f"AnchorScanner, {chunk_size // 1024} KiB chunks", scan_in_chunks),
+        )
+    }
+
+    logger.info("%.1f MB page with 40000 anchors:", len(content) / 1e6)
+    for name, seconds in timings.items():
+        logger.info("  %-32s %.3fs", name, seconds)
+
+    assert timings["AnchorScanner.feed"] < timings["HTMLPageParser.feed"]
@@ -17,11 +17,14 @@ import pytest
 from packaging.metadata import parse_email
 from packaging.utils import canonicalize_name
 from poetry.core.constraints.version import Version
+from poetry.core.constraints.version import parse_constraint
 from poetry.core.packages.utils.link import Link
 
 from poetry.inspection.info import PackageInfoError
 from poetry.inspection.lazy_wheel import HTTPRangeRequestUnsupportedError
 from poetry.repositories.http_repository import HTTPRepository
+from poetry.repositories.http_repository import _VersionIndex
+from poetry.utils.cache import ArtifactCache
 from poetry.utils.helpers import HTTPRangeRequestSupportedError
 
 
@@ -253,7 +256,10 @@ def test_get_info_from_wheel(
 
     if lazy_wheel and supports_range_requests is not False:
         mock_metadata_from_wheel_url.assert_called_once_with(
-            filename, url, repo.session
+            filename,
+            url,
+            repo.session,
+            supports_range_requests=repo._supports_range_requests,
         )
         mock_download.assert_not_called()
         assert repo._supports_range_requests[domain] is True
@@ -272,6 +278,149 @@ def test_get_info_from_wheel(
             assert domain not in repo._supports_range_requests
 
 
+def test_get_info_from_wheel_downloads_into_artifact_cache(
+    mocker: MockerFixture, config: Config
+) -> None:
+    filename = "poetry_core-1.5.0-py3-none-any.whl"
+    filepath = MockRepository.DIST_FIXTURES / filename
+    mock_download = mocker.patch(
+        "poetry.repositories.http_repository.download_file",
+        side_effect=lambda _, dest, *args, **kwargs: shutil.copy(filepath, dest),
+    )
+    link = Link(
+        f"https://foo.com/{filename}",
+        hashes={
+            "sha256": "e216b70f013c47b82a72540d34347632c5bfe59fd54f5fe5d51f6a68b19aaf84"
+        },
+    )
+    repo = MockRepository(lazy_wheel=False, config=config)
+
+    info = repo._get_info_from_wheel(link)
+    assert info.name == "poetry-core"
+    assert mock_download.call_count == 1
+
+    # The archive is shared with further inspections and the installer.
+    artifact_cache = ArtifactCache(cache_dir=config.artifacts_cache_directory)
+    cached_archive = artifact_cache.get_cached_archive_for_link(link, strict=True)
+    assert cached_archive is not None
+    assert cached_archive.name == filename
+
+    repo._get_info_from_wheel(link)
+    assert mock_download.call_count == 1
+
+
+@pytest.mark.parametrize("with_hash", [True, False])
+def test_get_info_from_wheel_caches_lazy_wheel_metadata(
+    mocker: MockerFixture, config: Config, with_hash: bool
+) -> None:
+    filename = "poetry_core-1.5.0-py3-none-any.whl"
+    filepath = MockRepository.DIST_FIXTURES / filename
+    with ZipFile(filepath) as zf:
+        metadata, _ = parse_email(zf.read("poetry_core-1.5.0.dist-info/METADATA"))
+    mock_metadata_from_wheel_url = mocker.patch(
+        "poetry.repositories.http_repository.metadata_from_wheel_url",
+        return_value=metadata,
+    )
+    hashes = (
+        {"sha256": "e216b70f013c47b82a72540d34347632c5bfe59fd54f5fe5d51f6a68b19aaf84"}
+        if with_hash
+        else {}
+    )
+    link = Link(f"https://foo.com/{filename}", hashes=hashes)
+
+    for _ in range(2):
+        # a new repository does not remember anything but the cache
+        repo = MockRepository(config=config)
+        info = repo._get_info_from_wheel(link)
+        assert info.name == "poetry-core"
+        assert info.requires_dist == [
+            'importlib-metadata (>=1.7.0) ; python_version < "3.8"'
+        ]
+
+    assert mock_metadata_from_wheel_url.call_count == (1 if with_hash else 2)
+
+
+def test_get_info_from_wheel_uses_prefetched_metadata(mocker: MockerFixture) -> None:
+    filename = "poetry_core-1.5.0-py3-none-any.whl"
+    filepath = MockRepository.DIST_FIXTURES / filename
+    with ZipFile(filepath) as zf:
+        metadata, _ = parse_email(zf.read("poetry_core-1.5.0.dist-info/METADATA"))
+    mock_metadata_from_wheel_urls = mocker.patch(
+        "poetry.repositories.http_repository.metadata_from_wheel_urls",
+        side_effect=lambda wheels, *args, **kwargs: {
+            url: metadata for _, url in wheels
+        },
+    )
+    mock_metadata_from_wheel_url = mocker.patch(
+        "poetry.repositories.http_repository.metadata_from_wheel_url"
+    )
+    link = Link(f"https://foo.com/{filename}")
+    other_link = Link("https://bar.com/demo-0.1.0-py2.py3-none-any.whl")
+    repo = MockRepository()
+    repo._supports_range_requests["bar.com"] = False
+
+    repo._prefetch_wheel_metadata([link, link, other_link])
+    # metadata that has been prefetched already is not read again
+    repo._prefetch_wheel_metadata([link])
+
+    mock_metadata_from_wheel_urls.assert_called_once_with(
+        [(filename, link.url)],
+        repo.session,
+        supports_range_requests=repo._supports_range_requests,
+        max_workers=repo._pool_size,
+    )
+
+    info = repo._get_info_from_wheel(link)
+
+    assert info.name == "poetry-core"
+    assert info.version == "1.5.0"
+    mock_metadata_from_wheel_url.assert_not_called()
+    assert repo._supports_range_requests["foo.com"] is True
+    assert not repo._prefetched_wheel_metadata
+
+
+def test_get_info_from_wheel_with_prefetch_error(mocker: MockerFixture) -> None:
+    filename = "poetry_core-1.5.0-py3-none-any.whl"
+    filepath = MockRepository.DIST_FIXTURES / filename
+    mocker.patch(
+        "poetry.repositories.http_repository.metadata_from_wheel_urls",
+        side_effect=lambda wheels, *args, **kwargs: {
+            url: HTTPRangeRequestUnsupportedError() for _, url in wheels
+        },
+    )
+    mock_metadata_from_wheel_url = mocker.patch(
+        "poetry.repositories.http_repository.metadata_from_wheel_url"
+    )
+    mock_download = mocker.patch(
+        "poetry.repositories.http_repository.download_file",
+        side_effect=lambda _, dest, *args, **kwargs: shutil.copy(filepath, dest),
+    )
+    link = Link(f"https://foo.com/{filename}")
+    repo = MockRepository()
+
+    repo._prefetch_wheel_metadata([link])
+    info = repo._get_info_from_wheel(link)
+
+    assert info.name == "poetry-core"
+    mock_metadata_from_wheel_url.assert_not_called()
+    assert mock_download.call_count == 1
+    assert mock_download.call_args[1]["raise_accepts_ranges"] is False
+    assert repo._supports_range_requests["foo.com"] is False
+
+
+def test_prefetch_wheel_metadata_without_lazy_wheel(mocker: MockerFixture) -> None:
+    mock_metadata_from_wheel_urls = mocker.patch(
+        "poetry.repositories.http_repository.metadata_from_wheel_urls"
+    )
+    repo = MockRepository(lazy_wheel=False)
+
+    repo._prefetch_wheel_metadata(
+        [Link("https://foo.com/poetry_core-1.5.0-py3-none-any.whl")]
+    )
+
+    mock_metadata_from_wheel_urls.assert_not_called()
+
+
 def test_get_info_from_wheel_state_sequence(mocker: MockerFixture) -> None:
     """
     1. We know nothing:
@@ -468,3 +617,50 @@ def test_log_age_filtered_versions_empty(caplog: pytest.LogCaptureFixture) -> No
         repo.log_age_filtered_versions(level="warning", reset=False)
 
     assert len(caplog.records) == 0
+
+
+@pytest.mark.parametrize(
+    "constraint",
+    [
+        "*",
+        ">=1.0",
+        ">1.0",
+        "<1.0",
+        "<=1.0",
+        "==1.0",
+        "1.0+local",
+        "!=1.0",
+        "^1.0",
+        "~=1.0.1",
+        "==1.0.*",
+        ">=0.9,<1.1 || >=2.0",
+        "<0.9 || 1.0.post1 || >2.0",
+        ">3.0",
+        "<0.1",
+    ],
+)
+def test_version_index_allowed_versions(constraint: str) -> None:
+    versions = [
+        Version.parse(v)
+        for v in [
+            "2.0",
+            "0.9",
+            "1.0",
+            "1.0.1",
+            "1.0a1",
+            "1.0.dev0",
+            "1.0+local",
+            "1.0.post1",
+            "1.0.post1+local",
+            "1.1",
+            "2.0.post1",
+            "2.1rc1",
+        ]
+    ]
+    version_constraint = parse_constraint(constraint)
+
+    index = _VersionIndex(versions)
+
+    assert list(index.allowed_versions(version_constraint)) == sorted(
+        v for v in versions if version_constraint.allows(v)
+    )
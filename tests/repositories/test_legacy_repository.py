@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import base64
+import io
 import re
+import time
 
 from datetime import datetime
 from datetime import timezone
@@ -15,6 +17,7 @@ from packaging.utils import NormalizedName
 from packaging.utils import canonicalize_name
 from poetry.core.constraints.version import Version
 from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
 from poetry.core.packages.utils.link import Link
 
 from poetry.factory import Factory
@@ -335,6 +338,23 @@ def test_find_packages_min_release_age_multiple_calls(
     assert repo._age_filtered_versions == expected
 
 
+def test_find_packages_reuses_packages_across_constraints(
+    legacy_repository: LegacyRepository, mocker: MockerFixture
+) -> None:
+    repo = legacy_repository
+    spy = mocker.spy(repo, "_package")
+
+    all_packages = repo.find_packages(Factory.create_dependency("ipython", "*"))
+    packages = repo.find_packages(Factory.create_dependency("ipython", ">=5,!=6.*"))
+    pinned = repo.find_packages(Factory.create_dependency("ipython", "7.5.0"))
+
+    assert [str(p.version) for p in all_packages] == ["5.7.0", "7.5.0"]
+    assert packages == all_packages
+    assert all(p is q for p, q in zip(packages, all_packages))
+    assert pinned[0] is all_packages[1]
+    assert spy.call_count == 3  # including the pre-release 4.1.0rc1
+
+
 def test_get_package_information_chooses_correct_distribution(
     legacy_repository: LegacyRepository,
 ) -> None:
@@ -460,6 +480,71 @@ def test_get_package_from_both_py2_and_py3_specific_wheels_python_constraint(
     assert package.python_versions == ">=2.7,<2.8 || >=3.7,<4.0"
 
 
+def test_prefetch_metadata(
+    mocker: MockerFixture, legacy_repository_html: LegacyRepository
+) -> None:
+    # the JSON fixture provides the core metadata of isort
+    repo = legacy_repository_html
+    py2_metadata = {
+        "name": "isort",
+        "version": "4.3.4",
+        "summary": "A Python utility / library to sort Python imports.",
+        "requires_dist": ['futures; python_version == "2.7"'],
+        "requires_python": ">=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*",
+    }
+    py3_metadata = {**py2_metadata, "requires_dist": []}
+    mock_metadata_from_wheel_urls = mocker.patch(
+        "poetry.repositories.http_repository.metadata_from_wheel_urls",
+        side_effect=lambda wheels, *args, **kwargs: {
+            url: py2_metadata if "-py2-" in url else py3_metadata for _, url in wheels
+        },
+    )
+    mock_metadata_from_wheel_url = mocker.patch(
+        "poetry.repositories.http_repository.metadata_from_wheel_url"
+    )
+
+    repo.prefetch_metadata([Package("isort", "4.3.4")])
+
+    assert mock_metadata_from_wheel_urls.call_count == 1
+    assert [
+        filename for filename, _ in mock_metadata_from_wheel_urls.call_args[0][0]
+    ] == ["isort-4.3.4-py2-none-any.whl", "isort-4.3.4-py3-none-any.whl"]
+
+    package = repo.package("isort", Version.parse("4.3.4"))
+
+    assert package.requires == [Dependency("futures", "*")]
+    assert package.requires[0].python_versions == "~2.7"
+    mock_metadata_from_wheel_url.assert_not_called()
+
+
+def test_prefetch_metadata_ignores_unavailable_pages(
+    mocker: MockerFixture, legacy_repository_html: LegacyRepository
+) -> None:
+    repo = legacy_repository_html
+    mocker.patch.object(repo, "get_page", side_effect=RepositoryError("error"))
+    mock_metadata_from_wheel_urls = mocker.patch(
+        "poetry.repositories.http_repository.metadata_from_wheel_urls"
+    )
+
+    repo.prefetch_metadata([Package("isort", "4.3.4")])
+
+    mock_metadata_from_wheel_urls.assert_not_called()
+
+
+def test_prefetch_metadata_without_lazy_wheel(
+    mocker: MockerFixture, legacy_repository_html: LegacyRepository
+) -> None:
+    repo = legacy_repository_html
+    repo._lazy_wheel = False
+    mock_metadata_from_wheel_urls = mocker.patch(
+        "poetry.repositories.http_repository.metadata_from_wheel_urls"
+    )
+
+    repo.prefetch_metadata([Package("isort", "4.3.4")])
+
+    mock_metadata_from_wheel_urls.assert_not_called()
+
+
 def test_get_package_with_dist_and_universal_py3_wheel(
     legacy_repository: LegacyRepository,
 ) -> None:
@@ -688,6 +773,88 @@ def test_get_40x_and_returns_none(
         repo.get_page("foo")
 
 
+def test_get_page_memoizes_missing_packages(http: responses.RequestsMock) -> None:
+    repo = MockHttpRepository({"/foo/": 404}, http)
+
+    for _ in range(2):
+        with pytest.raises(PackageNotFoundError):
+            repo.get_page("foo")
+
+    assert len(http.calls) == 1
+
+
+@pytest.mark.parametrize("status_code", [404, 401])
+def test_get_page_remembers_missing_packages_across_runs(
+    http: responses.RequestsMock, config: Config, status_code: int
+) -> None:
+    config.merge({"solver": {"missing-package-ttl": 10}})
+    http.get("http://legacy.foo.bar/foo/", status=status_code)
+
+    for _ in range(2):
+        repo = LegacyRepository("legacy", url="http://legacy.foo.bar", config=config)
+        with pytest.raises(PackageNotFoundError):
+            repo.get_page("foo")
+
+    # authorization errors are not remembered
+    assert len(http.calls) == (1 if status_code == 404 else 2)
+
+
+def test_get_page_remembered_missing_packages_expire(
+    http: responses.RequestsMock, config: Config, mocker: MockerFixture
+) -> None:
+    config.merge({"solver": {"missing-package-ttl": 10}})
+    http.get("http://legacy.foo.bar/foo/", status=404)
+
+    repo = LegacyRepository("legacy", url="http://legacy.foo.bar", config=config)
+    with pytest.raises(PackageNotFoundError):
+        repo.get_page("foo")
+
+    mocker.patch("time.time", return_value=time.time() + 11 * 60)
+    repo = LegacyRepository("legacy", url="http://legacy.foo.bar", config=config)
+    with pytest.raises(PackageNotFoundError):
+        repo.get_page("foo")
+
+    assert len(http.calls) == 2
+
+
+def test_name_index_is_reused_if_root_page_is_unchanged(
+    http: responses.RequestsMock, config: Config, mocker: MockerFixture
+) -> None:
+    url = "http://legacy.foo.bar/"
+    root_page = '<a href="Foo_Bar/">Foo_Bar</a><a href="baz/">baz</a>'
+    http.get(url, body=root_page, headers={"ETag": '"v1"'})
+
+    repo = LegacyRepository("legacy", url="http://legacy.foo.bar", config=config)
+    assert repo.name_index.search("foo-b") == ["Foo_Bar"]
+
+    http.replace("GET", url, status=304)
+    spy = mocker.spy(LegacyRepository, "_root_page_from_response")
+    repo = LegacyRepository("legacy", url="http://legacy.foo.bar", config=config)
+    assert repo.name_index.search("foo-b") == ["Foo_Bar"]
+
+    assert http.calls[-1].request.headers["If-None-Match"] == '"v1"'
+    assert spy.call_count == 0
+
+
+def test_search_fetches_limited_number_of_pages(
+    http: responses.RequestsMock, mocker: MockerFixture
+) -> None:
+    names = [f"demo{i}" for i in range(5)]
+    http.get(
+        "http://legacy.foo.bar/",
+        body="".join(f'<a href="{name}/">{name}</a>' for name in names),
+    )
+    for name in names:
+        http.get(f"http://legacy.foo.bar/{name}/", status=404)
+    mocker.patch.object(LegacyRepository, "SEARCH_LIMIT", 3)
+
+    repo = MockHttpRepository({}, http)
+
+    assert repo.search("demo") == []
+    requested = sorted(str(call.request.url) for call in http.calls[1:])
+    assert requested == [f"http://legacy.foo.bar/{name}/" for name in names[:3]]
+
+
 def test_get_5xx_raises(
     http: responses.RequestsMock, disable_http_status_force_list: None
 ) -> None:
@@ -707,6 +874,7 @@ def test_get_redirected_response_url(
         response = requests.Response()
         response.status_code = 200
         response.url = redirect_url + "/foo"
+        response.raw = io.BytesIO()
         return response
 
     monkeypatch.setattr(repo.session, "get", get_mock)
@@ -730,10 +898,11 @@ def test_get_page_prefers_json(http: responses.RequestsMock) -> None:
     assert any("*/*" in item for item in accepted)
 
 
-def test_root_page_prefers_json(http: responses.RequestsMock) -> None:
+@pytest.mark.parametrize("attribute", ["root_page", "name_index"])
+def test_root_page_prefers_json(http: responses.RequestsMock, attribute: str) -> None:
     repo = MockHttpRepository({"/": 200}, http)
 
-    _ = repo.root_page
+    _ = getattr(repo, attribute)
 
     accepted = [
         item.strip()
@@ -4,8 +4,10 @@ from copy import deepcopy
 
 import pytest
 
+from packaging.utils import canonicalize_name
 from poetry.core.packages.package import Package
 
+from poetry.factory import Factory
 from poetry.repositories.lockfile_repository import LockfileRepository
 
 
@@ -37,3 +39,29 @@ def test_has_package(packages: list[Package]) -> None:
     assert repo.has_package(deepcopy(url_package))
     assert repo.has_package(deepcopy(pypi_package))
     assert repo.has_package(deepcopy(url_package_2))
+
+
+def test_dependency_index() -> None:
+    a = Package("a", "1.0")
+    a.add_dependency(Factory.create_dependency("c", ">=1"))
+    b = Package("b", "2.0")
+    b.add_dependency(Factory.create_dependency("a", "^1.0"))
+    b.add_dependency(Factory.create_dependency("c", "<2"))
+    c = Package("c", "1.5")
+
+    repo = LockfileRepository()
+    repo.add_package(a)
+    repo.add_package(b)
+
+    assert repo.packages_with_name(canonicalize_name("c")) == []
+    assert repo.required_by(canonicalize_name("c")) == [
+        (a, a.requires[0]),
+        (b, b.requires[1]),
+    ]
+
+    # the index is rebuilt after adding a package
+    repo.add_package(c)
+
+    assert repo.packages_with_name(canonicalize_name("c")) == [c]
+    assert repo.required_by(canonicalize_name("a")) == [(b, b.requires[0])]
+    assert repo.required_by(canonicalize_name("b")) == []
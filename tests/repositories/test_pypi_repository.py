@@ -22,8 +22,11 @@ from poetry.repositories.pypi_repository import PyPiRepository
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    import responses
+
     from pytest_mock import MockerFixture
 
+    from poetry.config.config import Config
     from tests.types import DistributionHashGetter
 
 
@@ -320,6 +323,58 @@ def test_fallback_pep_658_metadata(
         assert dep.python_versions == "~2.7"
 
 
+def test_package_from_core_metadata(
+    http: responses.RequestsMock, pypi_repository: PyPiRepository
+) -> None:
+    repo = pypi_repository
+
+    package = repo.package("requests", Version.parse("2.18.4"))
+
+    assert package.name == "requests"
+    assert len(package.requires) == 9
+    requested = [call.request.url for call in http.calls]
+    assert not [url for url in requested if "/pypi/requests/" in str(url)]
+    assert [url for url in requested if str(url).endswith(".metadata")]
+
+
+def test_package_falls_back_to_json_api_without_core_metadata(
+    http: responses.RequestsMock,
+    mocker: MockerFixture,
+    pypi_repository: PyPiRepository,
+) -> None:
+    repo = pypi_repository
+    mocker.patch.object(repo, "_get_info_from_metadata", return_value=None)
+
+    package = repo.package("requests", Version.parse("2.18.4"))
+
+    assert len(package.requires) == 9
+    requested = [str(call.request.url) for call in http.calls]
+    assert "https://pypi.org/pypi/requests/2.18.4/json" in requested
+
+
+def test_core_metadata_is_cached_by_hash(
+    http: responses.RequestsMock, config: Config
+) -> None:
+    def metadata_requests() -> list[str]:
+        return [
+            str(call.request.url)
+            for call in http.calls
+            if str(call.request.url).endswith(".metadata")
+        ]
+
+    repo = PyPiRepository(config=config, fallback=False)
+    repo.package("requests", Version.parse("2.18.4"))
+    assert len(metadata_requests()) == 1
+
+    # Even if the release information is not cached anymore,
+    # the metadata file itself is taken from the cache.
+    repo.forget("requests", Version.parse("2.18.4"))
+    package = repo.package("requests", Version.parse("2.18.4"))
+
+    assert len(package.requires) == 9
+    assert len(metadata_requests()) == 1
+
+
 def test_pypi_repository_supports_reading_bz2_files(
     pypi_repository: PyPiRepository,
 ) -> None:
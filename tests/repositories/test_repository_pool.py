@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+
 from typing import TYPE_CHECKING
 
 import pytest
@@ -16,6 +18,10 @@ from tests.helpers import get_package
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from poetry.core.packages.dependency import Dependency
+    from poetry.core.packages.package import Package
     from pytest_mock import MockerFixture
 
 
@@ -236,6 +242,57 @@ def test_pool_find_packages_in_any_repository() -> None:
     assert returned_packages_unavailable == []
 
 
+def test_pool_find_packages_queries_remote_repositories_concurrently(
+    mocker: MockerFixture,
+) -> None:
+    package1 = get_package("foo", "1.0.0")
+    package2 = get_package("foo", "2.0.0")
+    repo1 = LegacyRepository("repo1", "https://repo1.example.org/simple")
+    repo2 = LegacyRepository("repo2", "https://repo2.example.org/simple")
+    pool = RepositoryPool([repo1, repo2])
+
+    # If the repositories were queried one after another,
+    # the barrier would not be passed.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def find_packages(packages: list[Package]) -> Callable[[Dependency], list[Package]]:
+        def _find_packages(dependency: Dependency) -> list[Package]:
+            barrier.wait()
+            return packages
+
+        return _find_packages
+
+    mocker.patch.object(repo1, "find_packages", find_packages([package2]))
+    mocker.patch.object(repo2, "find_packages", find_packages([package1]))
+
+    assert pool.find_packages(get_dependency("foo")) == [package2, package1]
+    executor = pool._executor
+    assert executor is not None
+
+    # the threads are reused for further queries
+    assert pool.find_packages(get_dependency("foo")) == [package2, package1]
+    assert pool._executor is executor
+
+
+def test_pool_package_stops_at_first_remote_repository_with_package(
+    mocker: MockerFixture,
+) -> None:
+    package1 = get_package("foo", "1.0.0")
+    package2 = get_package("foo", "1.0.0")
+    repos: list[Repository] = [
+        LegacyRepository(f"repo{i}", f"https://repo{i}.example.org/simple")
+        for i in range(3)
+    ]
+    pool = RepositoryPool(repos)
+
+    mocker.patch.object(repos[0], "package", side_effect=PackageNotFoundError)
+    mocker.patch.object(repos[1], "package", return_value=package1)
+    package_mock = mocker.patch.object(repos[2], "package", return_value=package2)
+
+    assert pool.package("foo", Version.parse("1.0.0")) is package1
+    package_mock.assert_not_called()
+
+
 def test_pool_find_packages_in_specified_repository() -> None:
     package_foo1 = get_package("foo", "1.1.1")
     package_foo2 = get_package("foo", "1.2.3")
@@ -307,3 +364,37 @@ def test_log_age_filtered_versions_includes_explicit_repositories(
 
     primary_spy.assert_called_once_with(level=level, reset=reset)
     explicit_spy.assert_called_once_with(level=level, reset=reset)
+
+
+def test_prefetch_metadata_groups_packages_by_repository(
+    mocker: MockerFixture,
+) -> None:
+    repo = Repository("repo")
+    legacy1 = LegacyRepository("legacy1", "https://legacy1.foo.bar")
+    legacy2 = LegacyRepository("legacy2", "https://legacy2.foo.bar")
+    prefetch1 = mocker.patch.object(legacy1, "prefetch_metadata")
+    prefetch2 = mocker.patch.object(legacy2, "prefetch_metadata")
+
+    pool = RepositoryPool([repo])
+    assert not pool.can_prefetch_metadata()
+    pool.add_repository(legacy1)
+    pool.add_repository(legacy2, priority=Priority.EXPLICIT)
+    assert pool.can_prefetch_metadata()
+
+    packages = [
+        get_package("foo", "1.0.0"),
+        get_package("bar", "1.0.0"),
+        get_package("baz", "1.0.0"),
+        get_package("qux", "1.0.0"),
+        get_package("quux", "1.0.0"),
+    ]
+    for package, source_reference in zip(
+        packages, ["legacy1", "legacy2", "legacy1", "repo", "unknown"]
+    ):
+        package._source_type = "legacy"
+        package._source_reference = source_reference
+
+    pool.prefetch_metadata(packages)
+
+    prefetch1.assert_called_once_with([packages[0], packages[2]])
+    prefetch2.assert_called_once_with([packages[1]])
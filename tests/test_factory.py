@@ -337,6 +337,21 @@ def test_poetry_with_no_default_source(fixture_dir: FixtureDirGetter) -> None:
     assert {repo.name for repo in poetry.pool.repositories} == {"PyPI"}
 
 
+def test_poetry_pool_is_created_on_first_access(
+    fixture_dir: FixtureDirGetter, mocker: MockerFixture
+) -> None:
+    create_pool = mocker.spy(Factory, "create_pool")
+    poetry = Factory().create_poetry(fixture_dir("sample_project"))
+
+    assert create_pool.call_count == 0
+
+    pool = poetry.pool
+
+    assert create_pool.call_count == 1
+    assert poetry.pool is pool
+    assert create_pool.call_count == 1
+
+
 def test_poetry_with_supplemental_source(
     fixture_dir: FixtureDirGetter, with_simple_keyring: None
 ) -> None:
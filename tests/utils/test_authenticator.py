@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import base64
 import logging
+import os
 import re
+import time
 import uuid
 
+from email.utils import formatdate
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import NoReturn
@@ -13,12 +16,15 @@ import pytest
 import requests
 import responses
 
+from cachecontrol import CacheControlAdapter
 from cleo.io.null_io import NullIO
 from keyring.credentials import SimpleCredential
+from urllib3 import HTTPResponse
 
 from poetry.console.exceptions import PoetryRuntimeError
 from poetry.utils.authenticator import Authenticator
 from poetry.utils.authenticator import RepositoryCertificateConfig
+from poetry.utils.authenticator import UsageTrackingFileCache
 from poetry.utils.password_manager import PoetryKeyring
 
 
@@ -355,6 +361,90 @@ def test_authenticator_request_retries_on_status_code(
     assert sleep.call_count == attempts
 
 
+def cache_response(config: Config, url: str, body: str, age: int) -> None:
+    """
+    Store a response in the HTTP cache of the authenticator as if it had been
+    fetched ``age`` minutes ago.
+    """
+    adapter = Authenticator(config, NullIO()).get_session(url).get_adapter(url)
+    assert isinstance(adapter, CacheControlAdapter)
+
+    headers = {
+        "Date": formatdate(time.time() - age * 60, usegmt=True),
+        "Cache-Control": "max-age=60",
+    }
+    response = HTTPResponse(body=body.encode(), headers=headers, status=200)
+    request = requests.Request("GET", url).prepare()
+    adapter.controller.cache_response(request, response, body.encode())
+
+
+@pytest.mark.parametrize(("age", "revalidated"), [(5, True), (15, False)])
+def test_authenticator_serves_stale_response_while_revalidating(
+    config: Config, http: responses.RequestsMock, age: int, revalidated: bool
+) -> None:
+    url = "https://foo.bar/simple/foo/"
+    http.get(url, body="new")
+    cache_response(config, url, "old", age)
+
+    config.merge({"requests": {"stale-while-revalidate": 10}})
+    authenticator = Authenticator(config, NullIO())
+    response = authenticator.request("get", url)
+    authenticator.close()
+
+    assert response.text == ("old" if revalidated else "new")
+    assert len(http.calls) == 1
+    assert http.calls[0].request.headers.get("Cache-Control") == (
+        "max-age=0" if revalidated else None
+    )
+
+
+def test_authenticator_does_not_revalidate_fresh_response(
+    config: Config, http: responses.RequestsMock
+) -> None:
+    url = "https://foo.bar/simple/foo/"
+    cache_response(config, url, "cached", 0)
+
+    config.merge({"requests": {"stale-while-revalidate": 10}})
+    authenticator = Authenticator(config, NullIO())
+    response = authenticator.request("get", url)
+    authenticator.close()
+
+    assert response.text == "cached"
+    assert len(http.calls) == 0
+
+
+def test_authenticator_offline_uses_cache_only(
+    config: Config, http: responses.RequestsMock
+) -> None:
+    url = "https://foo.bar/simple/foo/"
+    cache_response(config, url, "cached", 60 * 24)
+
+    config.merge({"requests": {"offline": True}})
+    authenticator = Authenticator(config, NullIO())
+
+    assert authenticator.request("get", url).text == "cached"
+
+    with pytest.raises(PoetryRuntimeError) as e:
+        authenticator.request("get", "https://foo.bar/simple/bar/")
+
+    assert str(e.value) == (
+        "Unable to GET https://foo.bar/simple/bar/ in offline mode"
+        " because no cached response is available."
+    )
+    assert len(http.calls) == 0
+
+
+def test_usage_tracking_file_cache_get_marks_entry_as_used(tmp_path: Path) -> None:
+    cache = UsageTrackingFileCache(tmp_path)
+    cache.set("https://foo.bar/simple/foo/", b"cached")
+    (path,) = (p for p in tmp_path.rglob("*") if p.is_file() and p.suffix != ".lock")
+    os.utime(path, (0, 0))
+
+    assert cache.get("https://foo.bar/simple/foo/") == b"cached"
+    assert path.stat().st_mtime > 0
+    assert cache.get("https://foo.bar/simple/bar/") is None
+
+
 def test_authenticator_uses_env_provided_credentials(
     config: Config,
     repo: dict[str, dict[str, str]],
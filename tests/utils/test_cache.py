@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import concurrent.futures
+import hashlib
+import os
 import shutil
 import traceback
 
@@ -14,7 +16,10 @@ from packaging.tags import Tag
 from poetry.core.packages.utils.link import Link
 
 from poetry.utils.cache import ArtifactCache
+from poetry.utils.cache import CacheManager
 from poetry.utils.cache import FileCache
+from poetry.utils.cache import MetadataCache
+from poetry.utils.cache import mark_as_used
 from poetry.utils.env import MockEnv
 
 
@@ -367,3 +372,136 @@ def test_get_cached_archive_for_git() -> None:
     cache = ArtifactCache(cache_dir=Path())
     archive = cache.get_cached_archive_for_git("url", "ref", "subdirectory", MockEnv())
     assert archive is None
+
+
+def test_metadata_cache(tmp_path: Path) -> None:
+    cache = MetadataCache(cache_dir=tmp_path)
+    content = b"Metadata-Version: 2.1\nName: demo\nVersion: 0.1.0\n"
+    digest = hashlib.sha256(content).hexdigest()
+
+    assert cache.get("sha256", digest) is None
+
+    cache.put("sha256", digest, content)
+
+    assert cache.get("sha256", digest) == content
+    assert [p.name for p in tmp_path.rglob("*") if p.is_file()] == [digest]
+
+
+def test_metadata_cache_ignores_corrupt_files(tmp_path: Path) -> None:
+    cache = MetadataCache(cache_dir=tmp_path)
+    content = b"Metadata-Version: 2.1\nName: demo\nVersion: 0.1.0\n"
+    digest = hashlib.sha256(content).hexdigest()
+
+    cache.put("sha256", digest, b"corrupt")
+
+    assert cache.get("sha256", digest) is None
+    assert not any(p.is_file() for p in tmp_path.rglob("*"))
+
+
+def test_file_cache_get_marks_entry_as_used(
+    poetry_file_cache: FileCache[Any],
+) -> None:
+    poetry_file_cache.put("demo:0.1", {"name": "demo"})
+    path = poetry_file_cache._path("demo:0.1")
+    os.utime(path, (0, 0))
+
+    assert poetry_file_cache.get("demo:0.1") == {"name": "demo"}
+    assert path.stat().st_mtime > 0
+
+
+def test_mark_as_used_skips_recently_used_entries(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    path = tmp_path / "entry"
+    path.touch()
+    utime = mocker.spy(os, "utime")
+
+    mark_as_used(path)
+
+    utime.assert_not_called()
+
+
+def test_mark_as_used_ignores_read_only_caches(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    path = tmp_path / "entry"
+    path.touch()
+    os.utime(path, (0, 0))
+    mocker.patch("os.utime", side_effect=PermissionError)
+
+    mark_as_used(path)
+
+    assert path.stat().st_mtime == 0
+
+
+def _create_cache_file(path: Path, size: int, last_used: int) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (last_used, last_used))
+    return path
+
+
+@pytest.fixture
+def cache_manager(tmp_path: Path) -> CacheManager:
+    return CacheManager(
+        repository_cache_dir=tmp_path / "repositories",
+        artifacts_cache_dir=tmp_path / "artifacts",
+        metadata_cache_dir=tmp_path / "metadata",
+        lock_cache_dir=tmp_path / "locks",
+        latest_versions_cache_dir=tmp_path / "latest-versions",
+    )
+
+
+def test_cache_manager_usage(tmp_path: Path, cache_manager: CacheManager) -> None:
+    _create_cache_file(tmp_path / "repositories" / "PyPI" / "a" / "b", 10, 1)
+    _create_cache_file(tmp_path / "repositories" / "PyPI" / "_http_" / "c", 20, 1)
+    _create_cache_file(tmp_path / "repositories" / "foo" / "d", 30, 1)
+    _create_cache_file(tmp_path / "artifacts" / "ab" / "demo-0.1.whl", 40, 1)
+    _create_cache_file(tmp_path / "locks" / "0123.json", 50, 1)
+
+    assert cache_manager.usage() == {
+        "PyPI": 30,
+        "foo": 30,
+        CacheManager.ARTIFACTS: 40,
+        CacheManager.METADATA: 0,
+        CacheManager.LOCKS: 50,
+        CacheManager.LATEST_VERSIONS: 0,
+    }
+
+
+def test_cache_manager_prune_removes_least_recently_used_entries(
+    tmp_path: Path, cache_manager: CacheManager
+) -> None:
+    http_cache = tmp_path / "repositories" / "PyPI" / "_http_" / "a" / "b"
+    oldest = [
+        _create_cache_file(http_cache / "response", 10, 1),
+        _create_cache_file(http_cache / "response.body", 20, 3),
+        _create_cache_file(http_cache / "response.body.lock", 0, 1),
+    ]
+    old = _create_cache_file(tmp_path / "artifacts" / "ab" / "demo-0.1.whl", 40, 4)
+    recent = [
+        _create_cache_file(tmp_path / "artifacts" / "cd" / "demo-0.2.whl", 40, 6),
+        _create_cache_file(tmp_path / "repositories" / "PyPI" / "e" / "f", 10, 5),
+        _create_cache_file(tmp_path / "metadata" / "sha256" / "0123", 5, 7),
+        _create_cache_file(tmp_path / "locks" / "0123.json", 5, 8),
+    ]
+
+    # the response is the least recently used entry, even though its body
+    # is more recent than the other files of the response
+    assert cache_manager.prune(60) == (2, 70)
+
+    assert not any(path.exists() for path in [*oldest, old])
+    assert all(path.exists() for path in recent)
+    # empty directories are removed, but not the caches themselves
+    assert not (tmp_path / "repositories" / "PyPI" / "_http_").exists()
+    assert not (tmp_path / "artifacts" / "ab").exists()
+    assert (tmp_path / "artifacts").exists()
+
+
+def test_cache_manager_prune_within_limit(
+    tmp_path: Path, cache_manager: CacheManager
+) -> None:
+    path = _create_cache_file(tmp_path / "artifacts" / "ab" / "demo-0.1.whl", 40, 1)
+
+    assert cache_manager.prune(40) == (0, 0)
+    assert path.exists()
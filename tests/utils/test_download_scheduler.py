@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from typing import TYPE_CHECKING
+
+from poetry.utils.download_scheduler import DownloadScheduler
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def _acquire_in_thread(
+    scheduler: DownloadScheduler, url: str, owner: object, granted: list[object]
+) -> threading.Thread:
+    def acquire() -> None:
+        scheduler.acquire(url, owner=owner)
+        granted.append(owner)
+
+    thread = threading.Thread(target=acquire, daemon=True)
+    thread.start()
+    return thread
+
+
+def _wait_for_waiters(scheduler: DownloadScheduler, host: str, count: int) -> None:
+    deadline = time.monotonic() + 5
+    while len(scheduler._hosts[host].waiting) < count:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_scheduler_limits_connections_per_host() -> None:
+    scheduler = DownloadScheduler(max_connections_per_host=1)
+    lease = scheduler.acquire("https://files.example.org/a.whl", owner="a")
+    # other hosts are not affected
+    scheduler.acquire("https://mirror.example.org/b.whl", owner="b").release()
+
+    granted: list[object] = []
+    thread = _acquire_in_thread(
+        scheduler, "https://files.example.org/c.whl", "c", granted
+    )
+    _wait_for_waiters(scheduler, "files.example.org", 1)
+    assert granted == []
+
+    lease.release()
+    # releasing twice must not free another connection
+    lease.release()
+    thread.join(5)
+
+    assert granted == ["c"]
+    stats = scheduler.host_stats["files.example.org"]
+    assert stats.requests == 2
+    assert stats.max_connections == 1
+    assert stats.queue_seconds > 0
+    assert scheduler._hosts["files.example.org"].active == 1
+
+
+def test_scheduler_prefers_downloads_with_fewer_connections() -> None:
+    scheduler = DownloadScheduler(max_connections_per_host=2)
+    url = "https://files.example.org/a.whl"
+    scheduler.acquire(url, owner="segmented")
+    lease = scheduler.acquire(url, owner="other")
+
+    granted: list[object] = []
+    threads = [_acquire_in_thread(scheduler, url, "segmented", granted)]
+    _wait_for_waiters(scheduler, "files.example.org", 1)
+    threads.append(_acquire_in_thread(scheduler, url, "new", granted))
+    _wait_for_waiters(scheduler, "files.example.org", 2)
+
+    lease.release()
+    threads[1].join(5)
+
+    # the new download has no connection yet, so it goes first
+    assert granted == ["new"]
+    assert threads[0].is_alive()
+
+
+def test_scheduler_limits_download_rate(mocker: MockerFixture) -> None:
+    sleep = mocker.patch("time.sleep")
+    scheduler = DownloadScheduler(max_rate=1000)
+    lease = scheduler.acquire("https://files.example.org/a.whl", owner="a")
+
+    # a burst of up to one second is allowed
+    lease.consume(1000)
+    sleep.assert_not_called()
+
+    lease.consume(500)
+    sleep.assert_called_once()
+    assert 0.4 < sleep.call_args.args[0] <= 0.5
+    lease.release()
+
+    stats = scheduler.host_stats["files.example.org"]
+    assert stats.bytes == 1500
+    assert stats.busy_seconds > 0
+    assert stats.throughput == stats.bytes / stats.busy_seconds
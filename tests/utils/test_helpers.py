@@ -11,13 +11,16 @@ from typing import TYPE_CHECKING
 from typing import Any
 
 import pytest
+import requests
 import responses
 
 from requests.exceptions import ChunkedEncodingError
 
 from poetry.utils._compat import WINDOWS
+from poetry.utils.download_scheduler import DownloadScheduler
 from poetry.utils.helpers import Downloader
 from poetry.utils.helpers import HTTPRangeRequestSupportedError
+from poetry.utils.helpers import _try_lock_file
 from poetry.utils.helpers import directory
 from poetry.utils.helpers import download_file
 from poetry.utils.helpers import ensure_path
@@ -28,6 +31,9 @@ from poetry.utils.helpers import merge_dicts
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_mock import MockerFixture
     from requests import PreparedRequest
 
     from tests.conftest import Config
@@ -165,16 +171,17 @@ def test_download_file_recover_from_error(
     url = "https://foo.com/demo-0.1.0.tar.gz"
 
     def handle_request(request: PreparedRequest) -> HttpResponse:
-        if request.headers.get("Range") is None:
+        range_header = request.headers.get("Range")
+        if range_header is None:
             response_headers = {
                 "Content-Length": str(file_length),
                 "Accept-Ranges": "bytes",
             }
             return 200, response_headers, file_body[: file_length // 2]
         else:
-            start = int(
-                request.headers.get("Range", "bytes=0-").split("=")[1].split("-")[0]
-            )
+            if isinstance(range_header, bytes):
+                range_header = range_header.decode()
+            start = int(range_header.split("=")[1].split("-")[0])
             response_headers = {"Content-Length": str(len(file_body[start:]))}
             return 206, response_headers, file_body[start:]
 
@@ -228,6 +235,193 @@ def test_download_file_fail_when_first_chunk_failed(
         download_file(url, dest, chunk_size=file_length, max_retries=1)
 
 
+def _range_request_handler(
+    body: bytes,
+    ignore_ranges: bool = False,
+    fail_from: int | None = None,
+    etag: str | None = '"demo"',
+) -> Callable[[PreparedRequest], HttpResponse]:
+    def handle_request(request: PreparedRequest) -> HttpResponse:
+        headers = {"Accept-Ranges": "bytes"}
+        if etag is not None:
+            headers["ETag"] = etag
+        range_header = request.headers.get("Range")
+        if range_header is None or ignore_ranges:
+            headers["Content-Length"] = str(len(body))
+            return 200, headers, body
+
+        assert request.headers.get("If-Range") == etag
+        if isinstance(range_header, bytes):
+            range_header = range_header.decode()
+        start, end = map(int, range_header.removeprefix("bytes=").split("-"))
+        headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+        if fail_from is not None and start >= fail_from:
+            # the connection is closed prematurely
+            return 206, headers, body[start : start + 10]
+        return 206, headers, body[start : end + 1]
+
+    return handle_request
+
+
+def test_download_in_segments(
+    http: responses.RequestsMock, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.utils.helpers.DOWNLOAD_SEGMENT_MIN_SIZE", 100)
+    body = bytes(range(256)) * 4
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.add_callback(responses.GET, url, callback=_range_request_handler(body))
+    dest = tmp_path / "downloads" / "demo-0.1.0.tar.gz"
+    dest.parent.mkdir()
+
+    downloader = Downloader(url, dest, segments=4)
+    progress = list(downloader.download_with_progress())
+
+    assert progress[-1] == len(body)
+    assert dest.read_bytes() == body
+    assert sorted(call.request.headers.get("Range", "") for call in http.calls) == [
+        "",
+        "bytes=0-255",
+        "bytes=256-511",
+        "bytes=512-767",
+        "bytes=768-1023",
+    ]
+    assert [path.name for path in dest.parent.iterdir()] == [dest.name]
+
+
+def test_download_in_segments_falls_back_if_server_ignores_ranges(
+    http: responses.RequestsMock, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.utils.helpers.DOWNLOAD_SEGMENT_MIN_SIZE", 100)
+    body = bytes(range(256)) * 4
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.add_callback(
+        responses.GET, url, callback=_range_request_handler(body, ignore_ranges=True)
+    )
+    dest = tmp_path / "downloads" / "demo-0.1.0.tar.gz"
+    dest.parent.mkdir()
+
+    downloader = Downloader(url, dest, segments=4)
+    progress = list(downloader.download_with_progress())
+
+    assert progress[-1] == len(body)
+    assert dest.read_bytes() == body
+    assert [path.name for path in dest.parent.iterdir()] == [dest.name]
+
+
+def test_download_in_segments_resumes_interrupted_download(
+    http: responses.RequestsMock, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.utils.helpers.DOWNLOAD_SEGMENT_MIN_SIZE", 100)
+    body = bytes(range(256)) * 4
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.add_callback(
+        responses.GET, url, callback=_range_request_handler(body, fail_from=512)
+    )
+    dest = tmp_path / "downloads" / "demo-0.1.0.tar.gz"
+    dest.parent.mkdir()
+
+    with pytest.raises(requests.ConnectionError):
+        list(Downloader(url, dest, segments=4).download_with_progress())
+
+    assert not dest.exists()
+    assert dest.with_name("demo-0.1.0.tar.gz.part").exists()
+    assert dest.with_name("demo-0.1.0.tar.gz.part.json").exists()
+
+    http.reset()
+    http.add_callback(responses.GET, url, callback=_range_request_handler(body))
+
+    downloader = Downloader(url, dest, segments=4)
+    progress = list(downloader.download_with_progress())
+
+    assert progress[-1] == len(body)
+    assert dest.read_bytes() == body
+    # only the missing parts of the segments are downloaded again
+    ranges = [
+        range_header.removeprefix("bytes=").split("-")
+        for call in http.calls
+        if isinstance(range_header := call.request.headers.get("Range"), str)
+    ]
+    # Segments below 512 may or may not have been finished
+    # before the download was stopped.
+    assert {"767", "1023"} <= {end for _, end in ranges}
+    assert sum(int(end) - int(start) + 1 for start, end in ranges) < len(body)
+    assert [path.name for path in dest.parent.iterdir()] == [dest.name]
+
+
+def test_download_in_segments_does_not_resume_without_validator(
+    http: responses.RequestsMock, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.utils.helpers.DOWNLOAD_SEGMENT_MIN_SIZE", 100)
+    body = bytes(range(256)) * 4
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.add_callback(
+        responses.GET,
+        url,
+        callback=_range_request_handler(body, fail_from=512, etag=None),
+    )
+    dest = tmp_path / "downloads" / "demo-0.1.0.tar.gz"
+    dest.parent.mkdir()
+
+    with pytest.raises(requests.ConnectionError):
+        list(Downloader(url, dest, segments=4).download_with_progress())
+
+    assert list(dest.parent.iterdir()) == []
+
+
+def test_download_in_segments_uses_temporary_file_if_part_file_is_locked(
+    http: responses.RequestsMock, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.utils.helpers.DOWNLOAD_SEGMENT_MIN_SIZE", 100)
+    body = bytes(range(256)) * 4
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.add_callback(responses.GET, url, callback=_range_request_handler(body))
+    dest = tmp_path / "downloads" / "demo-0.1.0.tar.gz"
+    dest.parent.mkdir()
+    part_file = dest.with_name("demo-0.1.0.tar.gz.part")
+    part_file.write_bytes(b"another download")
+    lock_file = dest.with_name("demo-0.1.0.tar.gz.part.lock")
+
+    # the lock is held by another download of the same file
+    with _try_lock_file(lock_file) as locked:
+        assert locked
+        progress = list(Downloader(url, dest, segments=4).download_with_progress())
+
+        assert progress[-1] == len(body)
+        assert dest.read_bytes() == body
+        assert part_file.read_bytes() == b"another download"
+        assert sorted(path.name for path in dest.parent.iterdir()) == [
+            dest.name,
+            part_file.name,
+            lock_file.name,
+        ]
+
+    assert not lock_file.exists()
+
+
+def test_download_in_segments_with_scheduler(
+    http: responses.RequestsMock, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.utils.helpers.DOWNLOAD_SEGMENT_MIN_SIZE", 100)
+    body = bytes(range(256)) * 4
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.add_callback(responses.GET, url, callback=_range_request_handler(body))
+    dest = tmp_path / "downloads" / "demo-0.1.0.tar.gz"
+    dest.parent.mkdir()
+    scheduler = DownloadScheduler(max_connections_per_host=2)
+
+    downloader = Downloader(url, dest, segments=4, scheduler=scheduler)
+    progress = list(downloader.download_with_progress())
+
+    assert progress[-1] == len(body)
+    assert dest.read_bytes() == body
+    stats = scheduler.host_stats["foo.com"]
+    assert stats.requests == 5
+    assert stats.bytes == len(body)
+    assert stats.max_connections <= 2
+    # all connections have been released
+    assert scheduler._hosts["foo.com"].active == 0
+
+
 @pytest.mark.parametrize(
     "hash_types,expected",
     [
@@ -16,8 +16,8 @@ from poetry.puzzle.exceptions import SolverProblemError
 from poetry.puzzle.provider import IncompatibleConstraintsError
 from poetry.repositories import RepositoryPool
 from poetry.repositories.installed_repository import InstalledRepository
+from poetry.utils.constants import CONSTRAINTS_GROUP_NAME
 from poetry.utils.env import ephemeral_environment
-from poetry.utils.isolated_build import CONSTRAINTS_GROUP_NAME
 from poetry.utils.isolated_build import IsolatedBuildInstallError
 from poetry.utils.isolated_build import IsolatedEnv
 from poetry.utils.isolated_build import isolated_builder
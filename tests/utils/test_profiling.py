@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from poetry.utils import profiling
+
+
+def test_hooks_do_nothing_without_profiler() -> None:
+    assert not profiling.is_active()
+
+    with profiling.phase("phase"):
+        profiling.count("counter")
+
+    assert not profiling.is_active()
+
+
+def test_profile_collects_phases_and_counters() -> None:
+    with profiling.profile() as profiler:
+        assert profiling.is_active()
+        with profiling.phase("outer"):
+            for name in ("a", "b", "a"):
+                with profiling.phase("inner", subject=name):
+                    profiling.count("counter")
+        profiling.count("bytes", 42)
+
+    assert not profiling.is_active()
+
+    data = profiler.to_dict()
+    assert data["phases"]["outer"]["count"] == 1
+    assert data["phases"]["inner"]["count"] == 3
+    assert data["phases"]["outer"]["seconds"] >= data["phases"]["inner"]["seconds"]
+    assert data["counters"] == {"counter": 3, "bytes": 42}
+    assert {item["name"] for item in data["slowest"]} == {"a", "b"}
+    assert data["seconds"] >= data["phases"]["outer"]["seconds"]
+
+
+def test_profile_chrome_trace() -> None:
+    with profiling.profile() as profiler, profiling.phase("phase", subject="foo"):
+        pass
+
+    trace = profiler.to_chrome_trace()
+
+    assert len(trace["traceEvents"]) == 1
+    event = trace["traceEvents"][0]
+    assert event["name"] == "foo"
+    assert event["cat"] == "phase"
+    assert event["ph"] == "X"
+    assert event["dur"] >= 0